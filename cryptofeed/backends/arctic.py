@@ -0,0 +1,62 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    from arctic import Arctic
+except ImportError:
+    Arctic = None
+
+from cryptofeed.backends.batch import BatchWriter, DECIMAL_COLUMNS
+
+
+class ArcticWriter(BatchWriter):
+    """
+    Store trades, tickers and book changes in Arctic, one symbol per
+    channel.feed.pair (e.g. trades.GDAX.BTC-USD) indexed by receipt time.
+
+    Rows are batched per symbol (see BatchWriter) and each batch is appended
+    in chunks of at most chunk_size rows, so every append is a single round
+    trip with a reasonably sized segment. Set max_pending/overflow to bound
+    memory if the store can't keep up.
+
+    library: library name (created if missing on the Arctic at host) or an
+             existing library object
+    """
+    def __init__(self, library, host='127.0.0.1', chunk_size=100000, **kwargs):
+        if pd is None:
+            raise ImportError("pandas is required for ArcticWriter")
+        if isinstance(library, str):
+            if Arctic is None:
+                raise ImportError("arctic is required for ArcticWriter")
+            store = Arctic(host)
+            if library not in store.list_libraries():
+                store.initialize_library(library)
+            library = store[library]
+        self.library = library
+        self.chunk_size = chunk_size
+        super().__init__(**kwargs)
+
+    def write(self, channel, feed, pair, columns):
+        symbol = '{}.{}.{}'.format(channel, feed, pair)
+        data = {}
+        for name, values in columns.items():
+            if name in ('receipt', 'feed', 'pair'):
+                continue
+            if name in DECIMAL_COLUMNS:
+                values = [float(value) for value in values]
+            elif name == 'timestamp':
+                values = pd.to_datetime(values, unit='ns', utc=True)
+            elif name == 'id':
+                values = [None if value is None else str(value) for value in values]
+            data[name] = values
+        frame = pd.DataFrame(data, index=pd.to_datetime(columns['receipt'], unit='ns', utc=True))
+        frame.index.name = 'receipt'
+        for start in range(0, len(frame), self.chunk_size):
+            self.library.append(symbol, frame.iloc[start:start + self.chunk_size], upsert=True)
@@ -0,0 +1,250 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+
+from cryptofeed.book import top_levels, level_changes
+from cryptofeed.callback import BLOCK, DROP
+from cryptofeed.defines import BID, ASK, TRADES, TICKER, L2_BOOK, L3_BOOK, L3_BOOK_UPDATE
+from cryptofeed.timestamps import Nanoseconds, NS, seconds_to_ns, receipt as frame_receipt
+from cryptofeed.wire import to_nanoseconds
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Columns buffered for each channel. receipt is the local time the event's
+frame arrived and timestamp the exchange's time if it sent one, both int
+nanoseconds since the epoch (see timestamps). Book channels are stored as
+level changes of the top book_depth levels, a size of 0 removes the level.
+"""
+COLUMNS = {
+    TRADES: ('receipt', 'timestamp', 'feed', 'pair', 'id', 'side', 'amount', 'price'),
+    TICKER: ('receipt', 'feed', 'pair', 'bid', 'ask'),
+    L2_BOOK: ('receipt', 'feed', 'pair', 'side', 'price', 'size'),
+    L3_BOOK: ('receipt', 'feed', 'pair', 'side', 'price', 'size'),
+    L3_BOOK_UPDATE: ('receipt', 'timestamp', 'feed', 'pair', 'sequence', 'msg_type', 'side', 'price', 'size')
+}
+# columns holding decimal.Decimal values
+DECIMAL_COLUMNS = ('amount', 'price', 'size', 'bid', 'ask')
+DAY = 24 * 60 * 60
+DAY_NS = DAY * NS
+
+
+def _nanoseconds(timestamp):
+    """
+    exchange timestamp (datetime, Nanoseconds or seconds since the epoch) to int nanoseconds
+    """
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, Nanoseconds):
+        return int(timestamp)
+    if isinstance(timestamp, datetime):
+        return to_nanoseconds(timestamp)
+    return seconds_to_ns(timestamp)
+
+
+def split_days(receipt):
+    """
+    (YYYY-MM-DD, start, end) for each UTC day in a sorted list of receipt times
+    """
+    start = 0
+    while start < len(receipt):
+        midnight = (receipt[start] // DAY_NS + 1) * DAY_NS
+        day = time.gmtime(receipt[start] // NS)
+        end = bisect_left(receipt, midnight, start)
+        yield time.strftime('%Y-%m-%d', day), start, end
+        start = end
+
+
+class _ChannelCallback:
+    def __init__(self, writer, channel):
+        self.writer = writer
+        self.channel = channel
+
+    async def __call__(self, **kwargs):
+        if self.writer.add(self.channel, kwargs):
+            # wait off the loop, only this feed is held up
+            await asyncio.get_event_loop().run_in_executor(None, self.writer.wait_for_space)
+
+
+class BatchWriter:
+    """
+    Base class for storage sinks. Events are appended to columnar buffers
+    (one per channel/feed/pair), and a buffer is handed to a background thread
+    for writing once it holds max_rows rows or its oldest row is max_age
+    seconds old. The feed loop only ever appends to lists.
+
+    Subclasses implement write(channel, feed, pair, columns), which is
+    called on the writer thread with a dict of column name -> list.
+
+    max_pending bounds the rows handed off but not yet written, for when the
+    store falls behind. Once it is reached the overflow policy applies: BLOCK
+    holds up the feed that handed off the batch until the writer catches up
+    (its callback waits in an executor, the event loop and other feeds keep
+    running), DROP discards new batches (counted in dropped). Unbounded if None.
+    """
+    def __init__(self, max_rows=10000, max_age=60, book_depth=25, max_pending=None, overflow=BLOCK):
+        if overflow not in (BLOCK, DROP):
+            raise ValueError("overflow must be {} or {}".format(BLOCK, DROP))
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self.book_depth = book_depth
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.pending = 0
+        self.dropped = 0
+        self.space = threading.Condition()
+        # (channel, feed, pair) -> (creation time, {column: [values]})
+        self.buffers = {}
+        # (channel, feed, pair) -> top levels last stored
+        self.books = {}
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self.thread.start()
+
+    def callback(self, channel):
+        """
+        callback that stores a channel, e.g. callbacks={TRADES: writer.callback(TRADES)}
+        """
+        if channel not in COLUMNS:
+            raise ValueError("{} can not be stored by {}".format(channel, type(self).__name__))
+        return _ChannelCallback(self, channel)
+
+    def _rows(self, channel, kwargs, receipt):
+        if channel == TRADES:
+            yield (receipt, _nanoseconds(kwargs.get('timestamp')), kwargs['feed'], kwargs['pair'], kwargs.get('id'),
+                   kwargs['side'], kwargs['amount'], kwargs['price'])
+        elif channel == TICKER:
+            yield (receipt, kwargs['feed'], kwargs['pair'], kwargs['bid'], kwargs['ask'])
+        elif channel == L3_BOOK_UPDATE:
+            yield (receipt, _nanoseconds(kwargs['timestamp']), kwargs['feed'], kwargs['pair'], kwargs['sequence'],
+                   kwargs['msg_type'], kwargs['side'], kwargs['price'], kwargs['size'])
+        else:
+            key = (channel, kwargs['feed'], kwargs['pair'])
+            top = top_levels(kwargs['book'], self.book_depth)
+            previous = self.books.get(key, {BID: {}, ASK: {}})
+            self.books[key] = top
+            changes = level_changes(previous, top)
+            for side in (BID, ASK):
+                for price, size in changes[side]:
+                    yield (receipt, kwargs['feed'], kwargs['pair'], side, price, size)
+
+    def add(self, channel, kwargs):
+        """
+        buffer an event, True if the caller should wait_for_space before adding more
+        """
+        receipt = frame_receipt().wall
+        now = time.time()
+        key = (channel, kwargs['feed'], kwargs['pair'])
+        batch = None
+        with self.lock:
+            try:
+                created, columns = self.buffers[key]
+            except KeyError:
+                created = now
+                columns = {column: [] for column in COLUMNS[channel]}
+                self.buffers[key] = (created, columns)
+            lists = [columns[column] for column in COLUMNS[channel]]
+            for row in self._rows(channel, kwargs, receipt):
+                for values, value in zip(lists, row):
+                    values.append(value)
+            if len(lists[0]) >= self.max_rows or now - created >= self.max_age:
+                batch = (key, self.buffers.pop(key)[1])
+        if batch is not None:
+            return self._submit(batch, wait=False)
+        return False
+
+    def _submit(self, batch, wait=True):
+        """
+        queue a batch for the writer thread, applying the overflow policy.
+        Without wait a BLOCK batch is queued anyway and True is returned, the
+        caller is expected to wait_for_space
+        """
+        rows = len(batch[1]['receipt'])
+        if not rows:
+            return False
+        with self.space:
+            if self.max_pending is not None and self.pending + rows > self.max_pending:
+                if self.overflow == DROP:
+                    self.dropped += rows
+                    LOG.warning("%s - writer is behind, dropping %d %s rows for %s %s", type(self).__name__,
+                                rows, *batch[0])
+                    return False
+                # a batch bigger than max_pending still goes through once the queue is empty
+                while wait and self.pending and self.pending + rows > self.max_pending:
+                    self.space.wait()
+            self.pending += rows
+            behind = self.max_pending is not None and self.pending > self.max_pending
+        self.queue.put(batch)
+        return behind
+
+    def wait_for_space(self):
+        """
+        block (the calling thread, never the event loop's) until pending rows are back within max_pending
+        """
+        with self.space:
+            while self.pending > self.max_pending:
+                self.space.wait()
+
+    def flush(self, max_age=None, wait=True):
+        """
+        hand every buffer (or those older than max_age seconds) to the writer thread
+        """
+        now = time.time()
+        with self.lock:
+            batches = [(key, self.buffers.pop(key)[1]) for key, (created, _) in list(self.buffers.items())
+                       if max_age is None or now - created >= max_age]
+        for batch in batches:
+            self._submit(batch, wait=wait)
+
+    def close(self):
+        """
+        write everything buffered and stop the writer thread
+        """
+        self.flush()
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self):
+        checked = time.time()
+        while True:
+            try:
+                item = self.queue.get(timeout=self.max_age)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                return
+            if item:
+                self._write(*item)
+            # buffers for quiet pairs only age out here. Never wait for space
+            # on this thread, it is the one that frees it
+            if time.time() - checked >= self.max_age:
+                self.flush(self.max_age, wait=False)
+                checked = time.time()
+
+    def _write(self, key, columns):
+        channel, feed, pair = key
+        try:
+            self.write(channel, feed, pair, columns)
+        except Exception:
+            LOG.exception("%s - failed to write %d %s rows for %s %s", type(self).__name__,
+                          len(columns['receipt']), channel, feed, pair)
+        finally:
+            with self.space:
+                self.pending -= len(columns['receipt'])
+                self.space.notify_all()
+
+    def write(self, channel, feed, pair, columns):
+        raise NotImplementedError
@@ -0,0 +1,71 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from cryptofeed.backends.batch import BatchWriter, COLUMNS, DECIMAL_COLUMNS, split_days
+
+
+"""
+Files are written to root/channel/date=YYYY-MM-DD/exchange=FEED/pair=PAIR/,
+a layout pyarrow (and Spark, etc.) read as a partitioned dataset. Dates are
+UTC dates of the receipt time. Prices and sizes are stored as doubles,
+receipt and timestamp as nanosecond UTC timestamps and string columns are
+dictionary encoded.
+"""
+_STRINGS = ('feed', 'pair', 'side', 'msg_type')
+
+
+def _array(name, values):
+    if name in DECIMAL_COLUMNS:
+        return pa.array([float(value) for value in values], type=pa.float64())
+    if name in ('receipt', 'timestamp'):
+        return pa.array(values, type=pa.int64()).cast(pa.timestamp('ns', tz='UTC'))
+    if name in _STRINGS:
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    if name == 'id':
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+    return pa.array(values, type=pa.int64())
+
+
+class ParquetWriter(BatchWriter):
+    """
+    Store trades, tickers and book changes as partitioned Parquet files.
+    Requires pyarrow.
+
+    root: directory the dataset is written under
+    max_rows/max_age/book_depth: see BatchWriter
+    """
+    def __init__(self, root, **kwargs):
+        if pa is None:
+            raise ImportError("pyarrow is required for ParquetWriter")
+        self.root = root
+        self.files = 0
+        super().__init__(**kwargs)
+
+    def write(self, channel, feed, pair, columns):
+        # one file per UTC day in the batch
+        for date, start, end in split_days(columns['receipt']):
+            self._write_file(channel, feed, pair, date, {name: values[start:end] for name, values in columns.items()})
+
+    def _write_file(self, channel, feed, pair, date, columns):
+        directory = os.path.join(self.root, channel, 'date=' + date, 'exchange=' + feed, 'pair=' + pair)
+        os.makedirs(directory, exist_ok=True)
+        names = COLUMNS[channel]
+        table = pa.Table.from_arrays([_array(name, columns[name]) for name in names], names=list(names))
+
+        self.files += 1
+        name = '{}-{}-{}.parquet'.format(columns['receipt'][0] // 1000, os.getpid(), self.files)
+        # written under a hidden name first so dataset readers never see a partial file
+        tmp = os.path.join(directory, '.' + name)
+        pq.write_table(table, tmp)
+        os.replace(tmp, os.path.join(directory, name))
@@ -0,0 +1,204 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import mmap
+import os
+import struct
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cryptofeed.backends.batch import BatchWriter, DAY, split_days
+from cryptofeed.defines import TRADES, TICKER, L2_BOOK, L3_BOOK
+from cryptofeed.wire import RECORD_DTYPE, TRADE, TICKER_RECORD, BOOK_DELTA, SIDE_IDS, to_scaled, to_nanoseconds
+
+
+"""
+Append-only tick store
+
+root/FEED/PAIR/CHANNEL/YYYY-MM-DD.ticks holds one exchange's events on a
+channel for a pair on a UTC day (of receipt time), in receipt order, as fixed
+size records:
+
+    receipt (int64, nanoseconds since the epoch), then a wire format record
+    (cryptofeed.wire) with feed and pair ids of 0, the path names them
+
+Trades are TRADE records, tickers TICKER records and books BOOK_DELTA records
+of the top book_depth levels.
+
+Each channel has its own file because channels are buffered and written
+separately, so only within a channel are records appended in receipt order.
+
+root/FEED/PAIR/CHANNEL/YYYY-MM-DD.index is a sparse time index of (receipt,
+record number) int64 pairs for every index_interval'th record. A query bisects
+the index, maps only the records between the entries bracketing the time
+range and returns them as a NumPy structured array (TICK_DTYPE), nothing is
+parsed. Channels are merged by receipt.
+"""
+TICKS = '.ticks'
+INDEX = '.index'
+TICK = struct.Struct('<qBBHH2xqqqq')
+INDEX_ENTRY = struct.Struct('<qq')
+# channel -> record type
+RECORD_TYPES = {TRADES: TRADE, TICKER: TICKER_RECORD, L2_BOOK: BOOK_DELTA, L3_BOOK: BOOK_DELTA}
+
+if np is not None:
+    TICK_DTYPE = np.dtype([('receipt', '<i8')] + RECORD_DTYPE.descr)
+    INDEX_DTYPE = np.dtype([('receipt', '<i8'), ('record', '<i8')])
+else:
+    TICK_DTYPE = None
+    INDEX_DTYPE = None
+
+
+def _path(root, feed, pair, channel, date):
+    return os.path.join(root, feed, pair, channel, date)
+
+
+class TickStoreWriter(BatchWriter):
+    """
+    Appends trades, tickers and book changes to a tick store under root
+
+    index_interval: records between sparse index entries
+    max_rows/max_age/book_depth/max_pending/overflow: see BatchWriter
+    """
+    def __init__(self, root, index_interval=1024, **kwargs):
+        self.root = root
+        self.index_interval = index_interval
+        super().__init__(**kwargs)
+
+    def callback(self, channel):
+        if channel not in RECORD_TYPES:
+            raise ValueError("{} can not be stored by {}".format(channel, type(self).__name__))
+        return super().callback(channel)
+
+    @staticmethod
+    def _records(channel, columns):
+        receipts = columns['receipt']
+        if channel == TRADES:
+            for receipt, timestamp, trade_id, side, amount, price in zip(receipts, columns['timestamp'], columns['id'],
+                                                                         columns['side'], columns['amount'],
+                                                                         columns['price']):
+                try:
+                    trade_id = int(trade_id) if trade_id is not None else -1
+                except ValueError:
+                    trade_id = -1
+                yield TICK.pack(receipt, TRADE, SIDE_IDS[side], 0, 0, timestamp or 0,
+                                to_scaled(price), to_scaled(amount), trade_id)
+        elif channel == TICKER:
+            for receipt, bid, ask in zip(receipts, columns['bid'], columns['ask']):
+                yield TICK.pack(receipt, TICKER_RECORD, 0, 0, 0, 0, to_scaled(bid), to_scaled(ask), 0)
+        else:
+            for receipt, side, price, size in zip(receipts, columns['side'], columns['price'], columns['size']):
+                yield TICK.pack(receipt, BOOK_DELTA, SIDE_IDS[side], 0, 0, 0, to_scaled(price), to_scaled(size), 0)
+
+    def write(self, channel, feed, pair, columns):
+        receipts = columns['receipt']
+        records = list(self._records(channel, columns))
+        for date, start, end in split_days(receipts):
+            self._append(_path(self.root, feed, pair, channel, date), receipts[start:end], records[start:end])
+
+    def _append(self, path, receipts, records):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + TICKS, 'ab') as fp:
+            size = fp.tell()
+            if size % TICK.size:
+                # a record torn by a crash, drop it
+                size -= size % TICK.size
+                fp.truncate(size)
+            count = size // TICK.size
+            fp.write(b''.join(records))
+
+        # records whose number is a multiple of index_interval get an entry
+        first = -count % self.index_interval
+        entries = [INDEX_ENTRY.pack(receipts[i], count + i) for i in range(first, len(receipts), self.index_interval)]
+        if entries:
+            with open(path + INDEX, 'ab') as fp:
+                fp.write(b''.join(entries))
+
+
+class TickStore:
+    """
+    Time range queries over a tick store. Requires numpy
+    """
+    def __init__(self, root):
+        if np is None:
+            raise ImportError("numpy is required for TickStore")
+        self.root = root
+
+    def feeds(self):
+        return sorted(name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name)))
+
+    def query(self, pair, start, end, feeds=None, channel=None):
+        """
+        records for pair with start <= receipt < end (datetimes or seconds since
+        the epoch) as {feed: TICK_DTYPE array}, for the given feeds (default all)
+        and optionally only one channel. Prices and sizes are scaled ints, see
+        cryptofeed.wire
+        """
+        start = to_nanoseconds(start)
+        end = to_nanoseconds(end)
+        first_day = start // 1000000000 // DAY
+        last_day = (end - 1) // 1000000000 // DAY
+        dates = [time.strftime('%Y-%m-%d', time.gmtime(day * DAY)) for day in range(first_day, last_day + 1)]
+
+        channels = [channel] if channel is not None else list(RECORD_TYPES)
+        ret = {}
+        for feed in feeds or self.feeds():
+            parts = []
+            for chan in channels:
+                for date in dates:
+                    path = _path(self.root, feed, pair, chan, date)
+                    if os.path.exists(path + TICKS):
+                        parts.append(self._read(path, start, end))
+            if not parts:
+                continue
+            records = np.concatenate(parts)
+            if len(channels) > 1:
+                # each channel is in receipt order, the merge has to be sorted
+                records = records[np.argsort(records['receipt'], kind='mergesort')]
+            ret[feed] = records
+        return ret
+
+    @staticmethod
+    def _bounds(path, start, end, count):
+        """
+        record numbers [lo, hi) that bracket start and end according to the index
+        """
+        lo, hi = 0, count
+        if not os.path.exists(path + INDEX):
+            return lo, hi
+        index = np.fromfile(path + INDEX, dtype=INDEX_DTYPE)
+        # the last entry before start and the first entry at or after end
+        i = np.searchsorted(index['receipt'], start) - 1
+        if i >= 0:
+            lo = int(index['record'][i])
+        j = np.searchsorted(index['receipt'], end)
+        if j < len(index):
+            hi = min(int(index['record'][j]), count)
+        return lo, hi
+
+    def _read(self, path, start, end):
+        count = os.path.getsize(path + TICKS) // TICK.size
+        lo, hi = self._bounds(path, start, end, count)
+        if lo >= hi:
+            return np.empty(0, dtype=TICK_DTYPE)
+
+        # map the bracketed records only, mmap offsets are in allocation granularity
+        offset = lo * TICK.size // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY
+        with open(path + TICKS, 'rb') as fp:
+            mm = mmap.mmap(fp.fileno(), hi * TICK.size - offset, access=mmap.ACCESS_READ, offset=offset)
+        try:
+            region = np.frombuffer(mm, dtype=TICK_DTYPE, count=hi - lo, offset=lo * TICK.size - offset)
+            receipts = region['receipt']
+            ret = region[np.searchsorted(receipts, start):np.searchsorted(receipts, end)].copy()
+            # the mapping can only be closed once no array refers to it
+            del region, receipts
+        finally:
+            mm.close()
+        return ret
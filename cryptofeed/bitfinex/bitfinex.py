@@ -8,9 +8,10 @@ import json
 import logging
 from decimal import Decimal
 
-from sortedcontainers import SortedDict as sd
 
 from cryptofeed.feed import Feed
+from cryptofeed.integrity import crossed, bitfinex_checksum
+from cryptofeed.orders import Order, OrderStore
 from cryptofeed.defines import TICKER, TRADES, L3_BOOK, BID, ASK, L2_BOOK
 from cryptofeed.exchanges import BITFINEX
 from cryptofeed.standards import pair_exchange_to_std
@@ -18,23 +19,38 @@ from cryptofeed.standards import pair_exchange_to_std
 
 LOG = logging.getLogger('feedhandler')
 
+# conf flag that adds checksum messages ([chan_id, 'cs', checksum]) to book channels
+CHECKSUM_FLAG = 131072
+
 
 class Bitfinex(Feed):
     id = BITFINEX
+    # heartbeats: [chan_id,"hb"]
+    ignore_suffixes = (',"hb"]',)
+    incremental_subscriptions = True
 
     def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
         super().__init__('wss://api.bitfinex.com/ws/2', pairs, channels, callbacks, **kwargs)
         '''
         maps channel id (int) to a dict of
            symbol: channel's currency
+           pair: channel's currency in standard form
            channel: channel name
            handler: the handler for this channel type
+           subscription: the subscribe request for the channel
         '''
         self.channel_map = {}
-        self.order_map = {}
+        self.orders = OrderStore()
+        # channel id -> (handler, standard pair), built as subscriptions are acked
+        self.dispatch = {}
+
+    def _books(self):
+        # raw books are delivered as L3 books
+        channel = L3_BOOK if L3_BOOK in self.standardized_channels else L2_BOOK
+        for pair, book in self.l2_book.items():
+            yield channel, pair, book
 
-    async def _ticker(self, msg):
-        chan_id = msg[0]
+    async def _ticker(self, msg, pair):
         if msg[1] == 'hb':
             # ignore heartbeats
             pass
@@ -42,17 +58,12 @@ class Bitfinex(Feed):
             # bid, bid_size, ask, ask_size, daily_change, daily_change_percent,
             # last_price, volume, high, low
             bid, _, ask, _, _, _, _, _, _, _ = msg[1]
-            pair = self.channel_map[chan_id]['symbol']
-            pair = pair_exchange_to_std(pair)
             await self.callbacks[TICKER](feed=self.id,
                                          pair=pair,
                                          bid=Decimal(bid),
                                          ask=Decimal(ask))
 
-    async def _trades(self, msg):
-        chan_id = msg[0]
-        pair = self.channel_map[chan_id]['symbol']
-        pair = pair_exchange_to_std(pair)
+    async def _trades(self, msg, pair):
         async def _trade_update(trade):
             # trade id, timestamp, amount, price
             _, _, amount, price = trade
@@ -84,15 +95,11 @@ class Bitfinex(Feed):
             else:
                 LOG.warning("{} - Unexpected trade message {}".format(self.id, msg))
 
-    async def _book(self, msg):
-        chan_id = msg[0]
-        pair = self.channel_map[chan_id]['symbol']
-        pair = pair_exchange_to_std(pair)
-
+    async def _book(self, msg, pair):
         if isinstance(msg[1], list):
             if isinstance(msg[1][0], list):
                 # snapshot so clear book
-                self.l2_book[pair] = {BID: sd(), ASK: sd()}
+                self.l2_book[pair] = self._new_book(pair)
                 for update in msg[1]:
                     price, _, amount = [Decimal(x) for x in update]
                     if amount > 0:
@@ -119,24 +126,30 @@ class Bitfinex(Feed):
                     del self.l2_book[pair][side][price]
         elif msg[1] == 'hb':
             pass
+        elif msg[1] == 'cs':
+            # the checksum covers 25 levels, more than a smaller max_depth window holds
+            if getattr(self.l2_book[pair][BID], 'depth', 25) >= 25 and msg[2] != bitfinex_checksum(self.l2_book[pair]):
+                await self._integrity_failure(pair, 'checksum mismatch')
+            return
         else:
             LOG.warning("{} - Unexpected book msg {}".format(self.id, msg))
-        
+
+        if self.check_integrity and crossed(self.l2_book[pair]):
+            await self._integrity_failure(pair, 'crossed book')
+            return
+
         if L3_BOOK in self.channels:
             await self.callbacks[L3_BOOK](feed=self.id, pair=pair, timestamp=None,
                                           sequence=None, book=self.l2_book[pair])
         else:
             await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=self.l2_book[pair])
 
-    async def _raw_book(self, msg):
-        chan_id = msg[0]
-        pair = self.channel_map[chan_id]['symbol']
-        pair = pair_exchange_to_std(pair)
-
+    async def _raw_book(self, msg, pair):
         if isinstance(msg[1], list):
             if isinstance(msg[1][0], list):
                 # snapshot so clear book
-                self.l2_book[pair] = {BID: sd(), ASK: sd()}
+                self.l2_book[pair] = self._new_book(pair, l3=True)
+                orders = self.orders.reset(pair)
                 for update in msg[1]:
                     order_id, price, amount = update
                     price = Decimal(price)
@@ -150,13 +163,14 @@ class Bitfinex(Feed):
 
                     if price not in self.l2_book[pair][side]:
                         self.l2_book[pair][side][price] = amount
-                        self.order_map[order_id] = {'price': price, 'amount': amount, 'side': side}
                     else:
                         self.l2_book[pair][side][price] += amount
-                        self.order_map[order_id] = {'price': price, 'amount': amount, 'side': side}
+                    orders[order_id] = Order(side, price, amount)
             else:
                 # book update
-                order_id, price, amount = [Decimal(x) for x in msg[1]]
+                order_id, price, amount = msg[1]
+                price = Decimal(price)
+                amount = Decimal(amount)
 
                 if amount > 0:
                     side = BID
@@ -164,37 +178,71 @@ class Bitfinex(Feed):
                     side = ASK
                     amount = abs(amount)
 
-                if price == 0:
-                    price = self.order_map[order_id]['price']
-                    self.l2_book[pair][side][price] -= self.order_map[order_id]['amount']
-                    if self.l2_book[pair][side][price] == 0:
-                        del self.l2_book[pair][side][price]
-                    del self.order_map[order_id]
-                else:
-                    self.order_map[order_id] = {'price': price, 'amount': amount, 'side': side}
+                # an update replaces the order, so remove what it had on the book
+                order = self.orders.pop(pair, order_id)
+                if order is not None:
+                    book_side = self.l2_book[pair][order.side]
+                    book_side[order.price] -= order.size
+                    if book_side[order.price] == 0:
+                        del book_side[order.price]
+
+                if price != 0:
+                    self.orders.add(pair, order_id, side, price, amount)
                     if price in self.l2_book[pair][side]:
                         self.l2_book[pair][side][price] += amount
                     else:
                         self.l2_book[pair][side][price] = amount
         elif msg[1] == 'hb':
             pass
+        elif msg[1] == 'cs':
+            # raw book checksums are over order ids in exchange queue order, which we
+            # don't maintain, so raw books rely on the crossed book check only
+            return
         else:
             LOG.warning("{} - Unexpected book msg {}".format(self.id, msg))
-        
+
+        if self.check_integrity and crossed(self.l2_book[pair]):
+            await self._integrity_failure(pair, 'crossed book')
+            return
+
         if L3_BOOK in self.standardized_channels:
             await self.callbacks[L3_BOOK](feed=self.id, pair=pair, timestamp=None, sequence=None,
                                           book=self.l2_book[pair])
+            await self._l2_view_callback(pair)
         else:
-            await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=self.l2_book[pair])        
+            await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=self.l2_book[pair])
+
+    async def _resync(self, pair):
+        """
+        resubscribe to pair's book channels, the exchange resends a snapshot
+        """
+        for chan_id, chan in list(self.channel_map.items()):
+            if chan['pair'] != pair or chan['channel'] != 'book':
+                continue
+            # drop anything still in flight on the old channel
+            del self.channel_map[chan_id]
+            self.dispatch[chan_id] = (None, pair)
+            self.orders.reset(pair)
+            await self.websocket.send(json.dumps({'event': 'unsubscribe', 'chanId': chan_id}))
+            await self.websocket.send(json.dumps(chan['subscription']))
+
+    def ignored(self, msg):
+        # trade updates ([chan_id,"tu",[...]]) duplicate the trade executions we use,
+        # the chan_id is at most a few digits so the tag is within the first 16 chars
+        return super().ignored(msg) or msg.find(',"tu",', 0, 16) != -1
 
     async def message_handler(self, msg):
+        if self.ignored(msg):
+            return
         msg = json.loads(msg, parse_float=Decimal)
         if isinstance(msg, list):
-            chan_id = msg[0]
-            if chan_id in self.channel_map:
-                await self.channel_map[chan_id]['handler'](msg)
-            else:
+            try:
+                handler, pair = self.dispatch[msg[0]]
+            except KeyError:
                 LOG.warning("{} - Unexpected message on unregistered channel {}".format(self.id, msg))
+                return
+            if handler is not None:
+                await handler(msg, pair)
         elif 'event' in msg and msg['event'] == 'error':
             LOG.error("{} - Error message from exchange: {}".format(self.id, msg['msg']))
         elif 'chanId' in msg and 'symbol' in msg:
@@ -211,26 +259,79 @@ class Bitfinex(Feed):
             else:
                 LOG.warning('{} - Invalid message type {}'.format(self.id, msg))
                 return
+            pair = pair_exchange_to_std(msg['symbol'], self.id)
+            if msg['symbol'] in self.removed_pairs:
+                # subscribed just before the pair was removed
+                self.dispatch[msg['chanId']] = (None, pair)
+                await self.websocket.send(json.dumps({'event': 'unsubscribe', 'chanId': msg['chanId']}))
+                return
+            subscription = {'event': 'subscribe', 'channel': msg['channel'], 'symbol': msg['symbol']}
+            for key in ('prec', 'freq', 'len'):
+                if key in msg:
+                    subscription[key] = msg[key]
             self.channel_map[msg['chanId']] = {'symbol': msg['symbol'],
+                                               'pair': pair,
                                                'channel': msg['channel'],
-                                               'handler': handler}
+                                               'handler': handler,
+                                               'subscription': subscription}
+            self.dispatch[msg['chanId']] = (handler, pair)
 
     async def subscribe(self, websocket):
-        for channel in self.channels:
-            for pair in self.pairs:
-                message = {'event': 'subscribe',
-                           'channel': channel,
-                           'symbol': pair
-                          }
-                if 'book' in channel:
-                    parts = channel.split('-')
-                    if len(parts) != 1:
-                        message['channel'] = 'book'
-                        try:
-                            message['prec'] = parts[1]
-                            message['freq'] = parts[2]
-                            message['len'] = parts[3]
-                        except IndexError:
-                            # any non specified params will be defaulted
-                            pass
-                await websocket.send(json.dumps(message))
+        # channel ids are assigned per connection
+        self.channel_map = {}
+        self.dispatch = {}
+        self.websocket = websocket
+        self.removed_pairs = set()
+        if self.check_integrity:
+            await websocket.send(json.dumps({'event': 'conf', 'flags': CHECKSUM_FLAG}))
+        await self._subscribe(websocket, self.channels, self.pairs)
+
+    @staticmethod
+    def _subscription(channel, pair):
+        message = {'event': 'subscribe',
+                   'channel': channel,
+                   'symbol': pair
+                  }
+        if 'book' in channel:
+            parts = channel.split('-')
+            if len(parts) != 1:
+                message['channel'] = 'book'
+                try:
+                    message['prec'] = parts[1]
+                    message['freq'] = parts[2]
+                    message['len'] = parts[3]
+                except IndexError:
+                    # any non specified params will be defaulted
+                    pass
+        return message
+
+    async def _subscribe(self, websocket, channels, pairs):
+        for channel in channels:
+            for pair in pairs:
+                await websocket.send(json.dumps(self._subscription(channel, pair)))
+
+    @staticmethod
+    def _matches(subscription, request):
+        """
+        True if an acknowledged subscription is for a subscribe request, the
+        acknowledgement spells out parameters the request may have defaulted
+        """
+        return all(subscription.get(key) == request[key] for key in ('channel', 'symbol', 'prec') if key in request)
+
+    async def _unsubscribe(self, websocket, channels, pairs):
+        requests = [self._subscription(channel, pair) for channel in channels for pair in pairs]
+        for chan_id, chan in list(self.channel_map.items()):
+            if not any(self._matches(chan['subscription'], request) for request in requests):
+                continue
+            # drop anything still in flight on the channel
+            del self.channel_map[chan_id]
+            self.dispatch[chan_id] = (None, chan['pair'])
+            if chan['channel'] == 'book':
+                self.l2_book.pop(chan['pair'], None)
+                self.l2_views.pop(chan['pair'], None)
+                self.orders.remove(chan['pair'])
+            await websocket.send(json.dumps({'event': 'unsubscribe', 'chanId': chan_id}))
+
+    def _remove_pair(self, pair):
+        super()._remove_pair(pair)
+        self.orders.remove(self._std_pair(pair))
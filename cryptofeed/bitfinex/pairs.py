@@ -4,16 +4,25 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-bitfinex_trading_pairs = {
-    'tBTCEUR', 'tBTCUSD', 'tXRPUSD', 'tXRPBTC', 'tETHUSD', 'tETHBTC',
-    'tIOTAEUR', 'tIOTAUSD', 'tIOTABTC', 'tIOTAETH', 'tBCHUSD', 'tBCHBTC',
-    'tBCHETH', 'tLTCUSD', 'tLTCBTC', 'tEOSUSD', 'tEOSBTC', 'tEOSETH',
-    'tSNTUSD', 'tSNTBTC', 'tSNTETH', 'tNEOUSD', 'tNEOBTC', 'tNEOETH',
-    'tOMGUSD', 'tOMGBTC', 'tOMGETH', 'tETCUSD', 'tETCBTC', 'tXMRUSD',
-    'tXMRBTC', 'tDASHUSD', 'tDASHBTC', 'tZECUSD', 'tZECBTC', 'tBTGUSD',
-    'tBTGBTC', 'tGNTUSD', 'tGNTBTC', 'tGNTETH', 'tQTUMUSD', 'tQTUMBTC',
-    'tQTUMETH', 'tDATAUSD', 'tDATABTC', 'tDATAETH', 'tSANUSD', 'tSANBTC',
-    'tSANETH', 'tYYWUSD', 'tYYWBTC', 'tYYWETH', 'tETPUSD', 'tETPBTC',
-    'tETPETH', 'tEDOUSD', 'tEDOBTC', 'tEDOETH', 'tQASHUSD', 'tQASHBTC',
-    'tQASHETH', 'tAVTUSD', 'tAVTBTC', 'tAVTETH', 'tRRTUSD', 'tRRTBTC'
-}
+# standardized pairs listed on Bitfinex, see cryptofeed.standards
+standard_pairs = (
+    'BTC-USD', 'ETH-USD', 'ETH-BTC', 'BCH-USD', 'LTC-USD', 'LTC-BTC', 'BTC-EUR',
+    'BCH-ETH', 'DATA-BTC', 'ETC-BTC', 'GNT-BTC', 'QTUM-BTC', 'SAN-USD',
+    'OMG-ETH', 'ETC-USD', 'DASH-USD', 'RRT-USD', 'SAN-BTC', 'GNT-USD',
+    'IOTA-EUR', 'YYW-BTC', 'BCH-BTC', 'NEO-USD', 'EDO-BTC', 'EDO-ETH',
+    'QASH-USD', 'QTUM-USD', 'BTG-BTC', 'ZEC-BTC', 'XRP-BTC', 'AVT-USD',
+    'XRP-USD', 'XMR-BTC', 'OMG-BTC', 'IOTA-USD', 'ETP-USD', 'IOTA-BTC',
+    'EDO-USD', 'NEO-ETH', 'SNT-USD', 'BTG-USD', 'DATA-USD', 'ETP-BTC',
+    'AVT-ETH', 'SAN-ETH', 'EOS-ETH', 'DATA-ETH', 'DASH-BTC', 'XMR-USD',
+    'IOTA-ETH', 'YYW-ETH', 'QTUM-ETH', 'YYW-USD', 'OMG-USD', 'GNT-ETH',
+    'EOS-BTC', 'ETP-ETH', 'SNT-BTC', 'SNT-ETH', 'QASH-BTC', 'QASH-ETH',
+    'AVT-BTC', 'RRT-BTC', 'ZEC-USD', 'NEO-BTC', 'EOS-USD'
+)
+
+
+def exchange_symbol(pair: str) -> str:
+    # BTC-USD -> tBTCUSD
+    return 't' + pair.replace('-', '')
+
+
+bitfinex_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
@@ -12,7 +12,10 @@ from decimal import Decimal
 import requests
 from sortedcontainers import SortedDict as sd
 
+from cryptofeed import metadata
 from cryptofeed.feed import Feed
+from cryptofeed.orders import OrderStore
+from cryptofeed.integrity import crossed, diff
 from cryptofeed.exchanges import BITMEX
 from cryptofeed.standards import pair_exchange_to_std
 from cryptofeed.defines import L2_BOOK, L3_BOOK, BID, ASK, TRADES, TICKER
@@ -24,22 +27,66 @@ LOG = logging.getLogger('feedhandler')
 class Bitmex(Feed):
     id = BITMEX
     api = 'https://www.bitmex.com/api/v1/'
+    incremental_subscriptions = True
 
-    def __init__(self, pairs=None, channels=None, callbacks=None):
-        super().__init__('wss://www.bitmex.com/realtime', pairs=None, channels=channels, callbacks=callbacks)
-        active_pairs = self.get_active_symbols()
+    def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
+        super().__init__('wss://www.bitmex.com/realtime', pairs=None, channels=channels, callbacks=callbacks, **kwargs)
+        self.instruments = metadata.instruments(self.id)
+        if not set(pairs).issubset(self.instruments):
+            # cache may predate a new listing, refetch before rejecting the pairs
+            self.instruments = metadata.instruments(self.id, max_age=0)
+        active_pairs = self.get_active_symbols(self.instruments)
         for pair in pairs:
             if pair not in active_pairs:
                 raise ValueError("{} is not active on BitMEX".format(pair))
         self.pairs = pairs
+        # table -> handler
+        self.dispatch = {}
         self._reset()
 
     def _reset(self):
-        self.partial_received = False
-        self.order_id = {}
+        # pairs whose orderBookL2 partial has been received
+        self.partial_received = set()
+        # orderBookL2 ids identify price levels
+        self.orders = OrderStore()
         for pair in self.pairs:
-            self.l2_book[pair] = {BID: sd(), ASK: sd()}
-            self.order_id[pair] = {}
+            self._reset_pair(pair)
+
+    def _reset_pair(self, pair):
+        self.partial_received.discard(pair)
+        self.l2_book[pair] = self._new_book(pair)
+        self.orders.reset(pair)
+
+    async def add_subscriptions(self, pairs=(), channels=()):
+        if not set(pairs).issubset(self.instruments):
+            # new listing, refetch in the executor so the loop is not blocked
+            instruments = await metadata.refresh(self.id)
+            if instruments is not None:
+                self.instruments = instruments
+        await super().add_subscriptions(pairs, channels)
+
+    def _exchange_pair(self, pair):
+        # bitmex pairs are exchange symbols
+        if pair not in self.get_active_symbols(self.instruments):
+            raise ValueError("{} is not active on BitMEX".format(pair))
+        return pair
+
+    def _remove_pair(self, pair):
+        super()._remove_pair(pair)
+        self.partial_received.discard(pair)
+        self.orders.remove(pair)
+
+    def _removed(self, msg):
+        """
+        drop data for removed pairs from a table message, True if nothing is left
+        """
+        if msg.get('filter', {}).get('symbol') in self.removed_pairs:
+            return True
+        data = [data for data in msg['data'] if data['symbol'] not in self.removed_pairs]
+        if len(data) == len(msg['data']):
+            return False
+        msg['data'] = data
+        return not data
 
     @staticmethod
     def get_symbol_info():
@@ -50,11 +97,14 @@ class Bitmex(Feed):
         return requests.get(Bitmex.api + 'instrument/active').json()
     
     @staticmethod
-    def get_active_symbols():
-        symbols = []
-        for data in Bitmex.get_active_symbols_info():
-            symbols.append(data['symbol'])
-        return symbols
+    def get_active_symbols(instruments=None):
+        """
+        active symbols from the instrument metadata cache (see cryptofeed.metadata),
+        the cache is populated from the REST API if it is empty
+        """
+        if instruments is None:
+            instruments = metadata.instruments(BITMEX)
+        return list(instruments)
 
     async def _trade(self, msg):
         """
@@ -83,13 +133,19 @@ class Bitmex(Feed):
     
     async def _book(self, msg):
         pair = None
-        if not self.partial_received:
+        if msg['action'] == 'partial':
+            pair = msg.get('filter', {}).get('symbol')
+            if pair is None and msg['data']:
+                pair = msg['data'][0]['symbol']
+            self._reset_pair(pair)
+            self.partial_received.add(pair)
+        else:
             # per bitmex documentation messages received before partial
             # should be discarded
-            if msg['action'] != 'partial':
+            msg['data'] = [data for data in msg['data'] if data['symbol'] in self.partial_received]
+            if not msg['data']:
                 return
-            self.partial_received = True
-        
+
         if msg['action'] == 'partial' or msg['action'] == 'insert':
             for data in msg['data']:
                 side = BID if data['side'] == 'Buy' else ASK
@@ -97,54 +153,126 @@ class Bitmex(Feed):
                 pair = data['symbol']
                 size = Decimal(data['size'])
                 self.l2_book[pair][side][price] = size
-                self.order_id[pair][data['id']] = (price, size)
+                self.orders.add(pair, data['id'], side, price, size)
         elif msg['action'] == 'update':
             for data in msg['data']:
                 side = BID if data['side'] == 'Buy' else ASK
                 pair = data['symbol']
                 update_size = Decimal(data['size'])
-                price, _ = self.order_id[pair][data['id']]
-                self.l2_book[pair][side][price] = update_size
-                self.order_id[pair][data['id']] = (price, update_size)
+                order = self.orders.get(pair, data['id'])
+                self.l2_book[pair][side][order.price] = update_size
+                order.size = update_size
         elif msg['action'] == 'delete':
             for data in msg['data']:
                 pair = data['symbol']
                 side = BID if data['side'] == 'Buy' else ASK
-                delete_price, delete_size = self.order_id[pair][data['id']]
-                del self.order_id[pair][data['id']]
+                order = self.orders.pop(pair, data['id'])
+                delete_price, delete_size = order.price, order.size
                 self.l2_book[pair][side][delete_price] -= delete_size
                 if self.l2_book[pair][side][delete_price] == 0:
                     del self.l2_book[pair][side][delete_price]
         else:
             LOG.warning("{} - Unexpected L2 Book message {}".format(self.id, msg))
             return
-        
+
+        if self.check_integrity and crossed(self.l2_book[pair]):
+            await self._integrity_failure(pair, 'crossed book')
+            return
+
         await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=self.l2_book[pair])
 
+    async def _resync(self, pair):
+        """
+        resubscribe to the pair's book, bitmex sends a new partial
+        """
+        self._reset_pair(pair)
+        topic = 'orderBookL2:{}'.format(pair)
+        await self.websocket.send(json.dumps({'op': 'unsubscribe', 'args': [topic]}))
+        await self.websocket.send(json.dumps({'op': 'subscribe', 'args': [topic]}))
+
+    def _rest_book(self, pair, depth):
+        book = {BID: sd(), ASK: sd()}
+        r = requests.get('{}orderBook/L2?symbol={}&depth={}'.format(self.api, pair, depth))
+        for data in json.loads(r.text, parse_float=Decimal):
+            side = BID if data['side'] == 'Buy' else ASK
+            book[side][Decimal(data['price'])] = Decimal(data['size'])
+        return book
+
+    async def _verify_book(self, pair, depth=25, delay=1):
+        """
+        diff the book against the REST snapshot. The snapshot is not sequenced
+        against the websocket stream, so a level only counts as drifted if the
+        same difference is still there after delay seconds
+        """
+        loop = asyncio.get_event_loop()
+        mismatched = None
+        for _ in range(2):
+            if pair not in self.partial_received:
+                return
+            try:
+                snapshot = await loop.run_in_executor(None, self._rest_book, pair, depth)
+            except Exception as e:
+                LOG.warning("%s - unable to fetch %s book for verification: %s", self.id, pair, str(e))
+                return
+            differences = diff(self.l2_book[pair], snapshot, depth=depth)
+            mismatched = differences.items() if mismatched is None else mismatched & differences.items()
+            if not mismatched:
+                return
+            await asyncio.sleep(delay)
+        await self._integrity_failure(pair, '{} levels differ from REST snapshot'.format(len(mismatched)))
+
 
     async def message_handler(self, msg):
         msg = json.loads(msg, parse_float=Decimal)
         if 'info' in msg:
             LOG.info("%s - info message: %s", self.id, msg)
-        elif 'subscribe' in msg:
+        elif 'subscribe' in msg or 'unsubscribe' in msg:
             if not msg['success']:
                 LOG.error("{} - subscribe failed: {}".format(self.id, msg))
         elif 'error' in msg:
             LOG.error("{} - Error message from exchange: {}".format(self.id, msg))
         else:
-            if msg['table'] == 'trade':
-                await self._trade(msg)
-            elif msg['table'] == 'orderBookL2':
-                await self._book(msg)
-            else:
+            try:
+                handler = self.dispatch[msg['table']]
+            except KeyError:
                 LOG.warning("{} - Unhandled message {}".format(self.id, msg))
+                return
+            if self.removed_pairs and self._removed(msg):
+                return
+            await handler(msg)
 
     async def subscribe(self, websocket):
+        self.websocket = websocket
+        self.removed_pairs = set()
         self._reset()
+        self._start_symbol_refresh()
+        self.dispatch = {
+            'trade': self._trade,
+            'orderBookL2': self._book
+        }
+        await self._subscribe(websocket, self.channels, self.pairs)
+
+    async def _subscribe(self, websocket, channels, pairs):
         chans = []
-        for channel in self.channels:
-            for pair in self.pairs:
+        for channel in channels:
+            for pair in pairs:
                 chans.append("{}:{}".format(channel, pair))
-    
-        await websocket.send(json.dumps({"op": "subscribe", 
+
+        await websocket.send(json.dumps({"op": "subscribe",
                                          "args": chans}))
+
+        if 'orderBookL2' in channels:
+            self._start_book_verification(pairs)
+
+    async def _unsubscribe(self, websocket, channels, pairs):
+        chans = ["{}:{}".format(channel, pair) for channel in channels for pair in pairs]
+        await websocket.send(json.dumps({"op": "unsubscribe", "args": chans}))
+        if 'orderBookL2' in channels:
+            for pair in pairs:
+                # updates still in flight are dropped as the pair has no partial
+                self.partial_received.discard(pair)
+                self.l2_book.pop(pair, None)
+                self.orders.remove(pair)
+                task = self._verify_tasks.pop(pair, None)
+                if task is not None:
+                    task.cancel()
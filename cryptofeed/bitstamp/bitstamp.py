@@ -10,7 +10,6 @@ import logging
 from decimal import Decimal
 
 import requests
-from sortedcontainers import SortedDict as sd
 
 from cryptofeed.exchanges import BITSTAMP
 from cryptofeed.feed import Feed
@@ -24,15 +23,24 @@ LOG = logging.getLogger('feedhandler')
 class Bitstamp(Feed):
     id = BITSTAMP
 
-    def __init__(self, pairs=None, channels=None, callbacks=None):
+    def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
         super().__init__(
             'wss://ws.pusherapp.com/app/de504dc5763aeef9ff52?protocol=7&client=js&version=2.1.6&flash=false',
             pairs=pairs,
             channels=channels,
-            callbacks=callbacks
+            callbacks=callbacks,
+            **kwargs
         )
         self.seq_no = {}
         self.snapshot_processed = False
+        # event -> handler, None for events that are ignored
+        self.dispatch = {}
+        # pusher channel name -> standard pair
+        self.channel_pairs = {}
+
+    def _books(self):
+        for pair, book in getattr(self, 'book', {}).items():
+            yield L3_BOOK, pair, book
 
     async def _process_snapshot(self):
         self.book = {}
@@ -48,8 +56,8 @@ class Bitstamp(Feed):
 
         for res, pair in zip(results, self.pairs):
             orders = res.json()
-            pair = pair_exchange_to_std(pair)
-            self.book[pair] = {BID: sd(), ASK: sd()}
+            pair = pair_exchange_to_std(pair, self.id)
+            self.book[pair] = self._new_book(pair, l3=True)
             self.seq_no[pair] = orders['timestamp']
 
             for side in (BID, ASK):
@@ -67,12 +75,8 @@ class Bitstamp(Feed):
             await self._process_snapshot()
         data = msg['data']
         chan = msg['channel']
-        timestamp = self.tz_aware_datetime_from_string(data['timestamp'])
-        pair = None
-        if chan == 'diff_order_book':
-            pair = 'BTC-USD'
-        else:
-            pair = pair_exchange_to_std(chan.split('_')[-1])
+        timestamp = self.timestamp(data['timestamp'])
+        pair = self.channel_pairs[chan]
 
         if pair in self.seq_no:
             if data['timestamp'] <= self.seq_no[pair]:
@@ -81,25 +85,21 @@ class Bitstamp(Feed):
                 del self.seq_no[pair]
 
         for side in (BID, ASK):
+            book_side = self.book[pair][side]
+            # levels are [price, size] string pairs
             for price, size in data[side+'s']:
-                price = Decimal(price)
                 size = Decimal(size)
-                if size == 0:
-                    if price in self.book[pair][side]:
-                        del self.book[pair][side][price]
+                if size:
+                    book_side[Decimal(price)] = size
                 else:
-                    self.book[pair][side][price] = size
+                    book_side.pop(Decimal(price), None)
         await self.callbacks[L3_BOOK](feed=self.id, pair=pair, timestamp=timestamp,
                                       sequence=None, book=self.book[pair])
+        await self._l2_view_callback(pair)
 
     async def _trades(self, msg):
         data = msg['data']
-        chan = msg['channel']
-        pair = None
-        if chan == 'live_trades':
-            pair = 'BTC-USD'
-        else:
-            pair = pair_exchange_to_std(chan.split('_')[-1])
+        pair = self.channel_pairs[msg['channel']]
 
         side = 'BUY' if data['type'] == 0 else 'SELL'
         amount = Decimal(data['amount'])
@@ -111,39 +111,44 @@ class Bitstamp(Feed):
                                      price=price)
 
     async def message_handler(self, msg):
-        # for some reason the internal parts of the message
-        # are formatted in such a way that it wont parse from
-        # string to json without stripping some extra quotes and
-        # slashes
-        msg = msg.replace("\\", '')
-        msg = msg.replace("\"{", "{")
-        msg = msg.replace("}\"", "}")
-        msg = json.loads(msg, parse_float=Decimal)
-        if 'pusher' in msg['event']:
-            if msg['event'] == 'pusher:connection_established':
-                pass
-            elif msg['event'] == 'pusher_internal:subscription_succeeded':
-                pass
-            else:
+        # pusher double encodes messages, the envelope's data field is itself
+        # a json string. Decode the envelope, then decode the payload once and
+        # only for events we handle
+        msg = json.loads(msg)
+        try:
+            handler = self.dispatch[msg['event']]
+        except KeyError:
+            if 'pusher' in msg['event']:
                 LOG.warning("{} - Unexpected pusher message {}".format(self.id, msg))
-        elif msg['event'] == 'trade':
-            await self._trades(msg)
-        elif msg['event'] == 'data':
-            await self._order_book(msg)
-        else:
-            LOG.warning("{} - Invalid message type {}".format(self.id, msg))
+            else:
+                LOG.warning("{} - Invalid message type {}".format(self.id, msg))
+            return
+        if handler is not None:
+            data = msg['data']
+            if isinstance(data, str):
+                msg['data'] = json.loads(data, parse_float=Decimal)
+            await handler(msg)
 
     async def subscribe(self, websocket):
         # if channel is order book we need to subscribe to the diff channel
         # to get updates, hit the REST endpoint to get the current complete state,
         # then process the updates from the diff channel, ignoring any updates that
         # are pre-timestamp on the response from the REST endpoint
+        self.dispatch = {
+            'pusher:connection_established': None,
+            'pusher_internal:subscription_succeeded': None,
+            'trade': self._trades,
+            'data': self._order_book
+        }
+        self.channel_pairs = {}
         for channel in self.channels:
             for pair in self.pairs:
+                chan = "{}_{}".format(channel, pair) if pair != 'btcusd' else channel
+                self.channel_pairs[chan] = pair_exchange_to_std(pair, self.id)
                 await websocket.send(
                     json.dumps({
                         "event": "pusher:subscribe",
                         "data": {
-                            "channel": "{}_{}".format(channel, pair) if pair != 'btcusd' else channel
+                            "channel": chan
                         }
                     }))
@@ -4,8 +4,17 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-bitstamp_trading_pairs = {
-    'btcusd', 'btceur', 'eurusd', 'xrpusd', 'xrpeur', 'xrpbtc', 'ltcusd',
-    'ltceur', 'ltcbtc', 'ethusd', 'etheur', 'ethbtc', 'bchusd', 'bcheur',
-    'bchbtc'
-}
+# standardized pairs listed on Bitstamp, see cryptofeed.standards
+standard_pairs = (
+    'BTC-USD', 'ETH-USD', 'ETH-BTC', 'BCH-USD', 'LTC-EUR', 'LTC-USD', 'LTC-BTC',
+    'ETH-EUR', 'BTC-EUR', 'BCH-BTC', 'XRP-BTC', 'XRP-USD', 'EUR-USD', 'XRP-EUR',
+    'BCH-EUR'
+)
+
+
+def exchange_symbol(pair: str) -> str:
+    # BTC-USD -> btcusd
+    return pair.replace('-', '').lower()
+
+
+bitstamp_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
@@ -0,0 +1,473 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import heapq
+from collections.abc import Mapping, MutableMapping
+from decimal import ROUND_FLOOR, ROUND_CEILING
+from itertools import islice
+from weakref import ref
+
+from sortedcontainers import SortedDict as sd
+
+from cryptofeed.defines import BID, ASK
+
+
+class BookSide(sd):
+    """
+    SortedDict side of a maintained book with O(1) snapshots. A snapshot
+    reads the side in place until the side next changes, the change first
+    gives the snapshot its own copy if anything still references it. So
+    levels are only copied for snapshots that are kept past a change
+    """
+    # weakref to the snapshot reading this side in place
+    _snapshot = None
+
+    def snapshot(self):
+        snap = self._snapshot() if self._snapshot is not None else None
+        if snap is None:
+            snap = SideSnapshot.__new__(SideSnapshot)
+            snap._prices = self.keys()
+            snap._sizes = self
+            self._snapshot = ref(snap)
+        return snap
+
+    def _detach(self):
+        snap = self._snapshot()
+        self._snapshot = None
+        if snap is not None:
+            snap._prices = tuple(self)
+            snap._sizes = dict.copy(self)
+
+    def __setitem__(self, price, size):
+        if self._snapshot is not None:
+            self._detach()
+        if price not in self:
+            self._list_add(price)
+        dict.__setitem__(self, price, size)
+
+    _setitem = __setitem__
+
+    def __delitem__(self, price):
+        if self._snapshot is not None:
+            self._detach()
+        dict.__delitem__(self, price)
+        self._list_remove(price)
+
+    def pop(self, *args):
+        if self._snapshot is not None:
+            self._detach()
+        return super().pop(*args)
+
+    def popitem(self, index=-1):
+        if self._snapshot is not None:
+            self._detach()
+        return super().popitem(index)
+
+    def setdefault(self, price, default=None):
+        if self._snapshot is not None:
+            self._detach()
+        return super().setdefault(price, default)
+
+    def clear(self):
+        if self._snapshot is not None:
+            self._detach()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        if self._snapshot is not None:
+            self._detach()
+        super().update(*args, **kwargs)
+
+    _update = update
+
+
+class DepthLimitedSide(MutableMapping):
+    """
+    One side of a book that only keeps the best `depth` levels sorted, and
+    a bounded number of levels beyond them.
+
+    Iteration, len, keys/values/items and SortedDict reads that aren't
+    defined here (peekitem, irange, bisect_left, index, ...) see `window`, a
+    SortedDict of the top `depth` levels, so callbacks only ever see the
+    window (a BookSide). Up to `max_overflow` levels outside it are kept in `overflow`, a
+    plain dict indexed by a lazy heap, so updates deep in the book cost a dict
+    write instead of a sorted insert. When a level leaves the window the best
+    overflow level moves back in.
+
+    Once the overflow holds twice max_overflow levels the worst are pruned.
+    Levels at or beyond the best pruned price are unknown from then on:
+    updates to them are ignored and they read as size 0. If the window runs
+    short of depth while levels were pruned, on_truncated is called (the
+    feed resyncs the book).
+
+    Lookups (`in`, `[]`, get, pop, del) cover the overflow as well, so feeds
+    that adjust level sizes incrementally keep working unchanged.
+    """
+    on_truncated = None
+
+    def __init__(self, depth, descending, items=(), max_overflow=None):
+        if depth < 1:
+            raise ValueError("Book depth must be at least 1")
+        self.depth = depth
+        # bids are descending (best price is the highest)
+        self.descending = descending
+        self.max_overflow = 4 * depth if max_overflow is None else max_overflow
+        self.window = BookSide()
+        self.overflow = {}
+        # heap of overflow prices, best first. May hold prices that have since
+        # left the overflow, those are skipped when popped
+        self._heap = []
+        # best pruned price, None if nothing was pruned
+        self.pruned = None
+        self.truncated = False
+        for price, size in items:
+            self[price] = size
+
+    def __getattr__(self, name):
+        if name == 'window':
+            # not set yet (unpickling)
+            raise AttributeError(name)
+        return getattr(self.window, name)
+
+    def _heap_key(self, price):
+        return -price if self.descending else price
+
+    def _worst(self):
+        return 0 if self.descending else -1
+
+    def _unknown(self, price):
+        if self.pruned is None:
+            return False
+        return price <= self.pruned if self.descending else price >= self.pruned
+
+    def _demote(self, price, size):
+        self.overflow[price] = size
+        heapq.heappush(self._heap, self._heap_key(price))
+        if len(self.overflow) > 2 * self.max_overflow:
+            self._prune()
+        elif len(self._heap) > 2 * len(self.overflow) + self.depth:
+            self._heap = [self._heap_key(price) for price in self.overflow]
+            heapq.heapify(self._heap)
+
+    def _prune(self):
+        keys = sorted(self._heap_key(price) for price in self.overflow)
+        for key in keys[self.max_overflow:]:
+            del self.overflow[self._heap_key(key)]
+        # pruned levels are all better than anything pruned before
+        self.pruned = self._heap_key(keys[self.max_overflow])
+        self._heap = keys[:self.max_overflow]
+
+    def _promote(self):
+        while self._heap:
+            price = self._heap_key(heapq.heappop(self._heap))
+            if price in self.overflow:
+                self.window[price] = self.overflow.pop(price)
+                return
+        if self.pruned is not None and len(self.window) < self.depth and not self.truncated:
+            self.truncated = True
+            if self.on_truncated is not None:
+                self.on_truncated()
+
+    def __getitem__(self, price):
+        if price in self.window:
+            return self.window[price]
+        if self._unknown(price):
+            return 0
+        return self.overflow[price]
+
+    def get(self, price, default=None):
+        if price in self.window:
+            return self.window[price]
+        return self.overflow.get(price, default)
+
+    def __setitem__(self, price, size):
+        window = self.window
+        if price in window:
+            window[price] = size
+        elif price in self.overflow:
+            self.overflow[price] = size
+        elif self._unknown(price):
+            return
+        elif len(window) < self.depth:
+            # the window only has room when the overflow is empty
+            window[price] = size
+        elif (price > window.keys()[0]) if self.descending else (price < window.keys()[-1]):
+            window[price] = size
+            self._demote(*window.popitem(self._worst()))
+        else:
+            self._demote(price, size)
+
+    def __delitem__(self, price):
+        if price in self.window:
+            del self.window[price]
+            self._promote()
+        elif not self._unknown(price):
+            del self.overflow[price]
+
+    def __contains__(self, price):
+        return price in self.window or price in self.overflow
+
+    def __iter__(self):
+        return iter(self.window)
+
+    def __reversed__(self):
+        return reversed(self.window)
+
+    def __len__(self):
+        return len(self.window)
+
+    def __repr__(self):
+        return '{}({}, {!r})'.format(type(self).__name__, self.depth, self.window)
+
+    def keys(self):
+        return self.window.keys()
+
+    def values(self):
+        return self.window.values()
+
+    def items(self):
+        return self.window.items()
+
+    def pop(self, price, *default):
+        if price in self.window:
+            size = self.window.pop(price)
+            self._promote()
+            return size
+        if self._unknown(price):
+            return 0
+        return self.overflow.pop(price, *default)
+
+    def popitem(self, index=-1):
+        item = self.window.popitem(index)
+        self._promote()
+        return item
+
+    def clear(self):
+        self.window.clear()
+        self.overflow.clear()
+        self._heap = []
+        self.pruned = None
+        self.truncated = False
+
+    def copy(self):
+        """
+        a plain SortedDict of the window
+        """
+        return sd(self.window)
+
+    __copy__ = copy
+
+
+def bucket(price, tick_size, side):
+    """
+    the price bucket of tick_size a level falls in. Bids round down and asks
+    round up, so a bucket never shows a better price than its levels
+    """
+    rounding = ROUND_FLOOR if side == BID else ROUND_CEILING
+    return (price / tick_size).to_integral_value(rounding=rounding) * tick_size
+
+
+class _Aggregating:
+    """
+    Mixin for book sides that keep an L2 view aggregated into tick_size
+    buckets. Every change to a level's size is applied to its bucket as a
+    delta, so the view is maintained incrementally and never recomputed.
+    """
+    view = None
+
+    def _aggregate(self, price, delta):
+        if not delta:
+            return
+        key = bucket(price, self.tick_size, self.side)
+        size = self.view.get(key, 0) + delta
+        if size:
+            self.view[key] = size
+        else:
+            del self.view[key]
+
+    def __setitem__(self, price, size):
+        if self.view is None:
+            return super().__setitem__(price, size)
+        before = self.get(price, 0)
+        super().__setitem__(price, size)
+        # depth limited sides ignore updates to pruned levels
+        self._aggregate(price, self.get(price, 0) - before)
+
+    _setitem = __setitem__
+
+    def __delitem__(self, price):
+        size = self[price]
+        super().__delitem__(price)
+        if self.view is not None:
+            self._aggregate(price, -size)
+
+    def pop(self, price, *default):
+        if price not in self:
+            return super().pop(price, *default)
+        size = super().pop(price)
+        if self.view is not None:
+            self._aggregate(price, -size)
+        return size
+
+    def popitem(self, index=-1):
+        price, size = super().popitem(index)
+        if self.view is not None:
+            self._aggregate(price, -size)
+        return price, size
+
+    def update(self, *args, **kwargs):
+        for price, size in dict(*args, **kwargs).items():
+            self[price] = size
+
+    def clear(self):
+        super().clear()
+        if self.view is not None:
+            self.view.clear()
+
+
+class AggregatingSide(_Aggregating, BookSide):
+    pass
+
+
+class AggregatingDepthLimitedSide(_Aggregating, DepthLimitedSide):
+    pass
+
+
+def _side(side, depth, tick_size):
+    descending = side == BID
+    if tick_size:
+        ret = AggregatingDepthLimitedSide(depth, descending) if depth else AggregatingSide()
+        ret.side = side
+        ret.tick_size = tick_size
+        ret.view = BookSide()
+        return ret
+    if depth:
+        return DepthLimitedSide(depth, descending)
+    return BookSide()
+
+
+def new_book(depth=None, tick_size=None):
+    """
+    an empty {BID: ..., ASK: ...} book
+
+    depth: limit the book to the top depth levels per side
+    tick_size: also maintain an L2 view of the book aggregated into tick_size
+               price buckets, available as book[side].view
+    """
+    return {BID: _side(BID, depth, tick_size), ASK: _side(ASK, depth, tick_size)}
+
+
+class SideSnapshot(Mapping):
+    """
+    Immutable view of one book side.
+
+    Constructed directly it is a copy, safe to hand to other threads. Prices
+    and sizes are Decimals (immutable), so only the containers are copied: a C
+    level dict copy and a tuple of the sorted prices. BookSide.snapshot()
+    returns one that reads the side in place until the side changes, those
+    are for the event loop thread only. Read access mirrors the SortedDict it
+    was taken from (ascending iteration, peekitem, indexable keys).
+    """
+    __slots__ = ('_prices', '_sizes', '__weakref__')
+
+    def __init__(self, side):
+        if isinstance(side, DepthLimitedSide):
+            side = side.window
+        if isinstance(side, SideSnapshot):
+            self._prices = tuple(side._prices)
+            self._sizes = dict.copy(side._sizes)
+            return
+        self._prices = tuple(side)
+        self._sizes = dict.copy(side)
+
+    def __getitem__(self, price):
+        return self._sizes[price]
+
+    def __contains__(self, price):
+        return price in self._sizes
+
+    def __iter__(self):
+        return iter(self._prices)
+
+    def __reversed__(self):
+        return reversed(self._prices)
+
+    def __len__(self):
+        return len(self._prices)
+
+    def __repr__(self):
+        return 'SideSnapshot({{{}}})'.format(', '.join('{!r}: {!r}'.format(price, self._sizes[price]) for price in self._prices))
+
+    def keys(self):
+        return self._prices
+
+    def values(self):
+        return tuple(self._sizes[price] for price in self._prices)
+
+    def items(self):
+        return tuple((price, self._sizes[price]) for price in self._prices)
+
+    def peekitem(self, index=-1):
+        price = self._prices[index]
+        return price, self._sizes[price]
+
+
+class BookSnapshot(dict):
+    """
+    {BID: SideSnapshot, ASK: SideSnapshot}. stale is True for books restored
+    from a checkpoint rather than maintained from the live feed
+    """
+    __slots__ = ('stale',)
+
+    def __init__(self, sides, stale=False):
+        super().__init__(sides)
+        self.stale = stale
+
+
+def top_levels(book, depth):
+    """
+    {BID: {price: size}, ASK: {price: size}} for the best depth levels of book
+    """
+    return {BID: {price: book[BID][price] for price in islice(reversed(book[BID]), depth)},
+            ASK: {price: book[ASK][price] for price in islice(book[ASK], depth)}}
+
+
+def level_changes(previous, current):
+    """
+    levels that differ between two top_levels results, as
+    {BID: [(price, size), ...], ASK: [...]}. Levels that are gone have size 0
+    """
+    ret = {}
+    for side in (BID, ASK):
+        before = previous[side]
+        after = current[side]
+        changes = [(price, size) for price, size in after.items() if before.get(price) != size]
+        changes.extend((price, 0) for price in before if price not in after)
+        ret[side] = changes
+    return ret
+
+
+def _side_snapshot(side):
+    if isinstance(side, DepthLimitedSide):
+        side = side.window
+    if isinstance(side, BookSide):
+        return side.snapshot()
+    return SideSnapshot(side)
+
+
+def snapshot(book, copy=False):
+    """
+    immutable BookSnapshot of a book. BookSide sides are read in place until
+    they change (see BookSide), other sides are copied. Snapshots are
+    returned as is. With copy=True the levels are always copied, so the
+    snapshot can be handed to other threads
+    """
+    if copy:
+        return BookSnapshot({BID: SideSnapshot(book[BID]), ASK: SideSnapshot(book[ASK])},
+                            stale=getattr(book, 'stale', False))
+    if isinstance(book, BookSnapshot):
+        return book
+    return BookSnapshot({BID: _side_snapshot(book[BID]), ASK: _side_snapshot(book[ASK])})
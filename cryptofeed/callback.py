@@ -5,14 +5,113 @@ Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
 import asyncio
+import functools
 import inspect
+import logging
 from decimal import Decimal
+from time import time
+
+from cryptofeed import timestamps
+from cryptofeed.book import snapshot
+from cryptofeed.wire import SIDE_IDS
+
+
+LOG = logging.getLogger('feedhandler')
+
+# overflow policies for bounded queues
+BLOCK = 'block'
+DROP = 'drop'
+DROP_OLDEST = 'drop_oldest'
+
+
+class Event:
+    """
+    Base for the slotted event objects callbacks receive in event mode,
+    fields are in the order of the callback's positional arguments
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__,
+                               ', '.join('{}={!r}'.format(name, getattr(self, name, None)) for name in self.__slots__))
+
+    def _asdict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class TradeEvent(Event):
+    __slots__ = ('feed', 'pair', 'id', 'timestamp', 'side', 'amount', 'price')
+
+    def __init__(self, feed, pair, id, timestamp, side, amount, price):
+        self.feed = feed
+        self.pair = pair
+        self.id = id
+        self.timestamp = timestamp
+        self.side = side
+        self.amount = amount
+        self.price = price
+
+
+class TickerEvent(Event):
+    __slots__ = ('feed', 'pair', 'bid', 'ask')
+
+    def __init__(self, feed, pair, bid, ask):
+        self.feed = feed
+        self.pair = pair
+        self.bid = bid
+        self.ask = ask
+
+
+class BookEvent(Event):
+    __slots__ = ('feed', 'pair', 'book')
+
+    def __init__(self, feed, pair, book):
+        self.feed = feed
+        self.pair = pair
+        self.book = book
+
+
+class L3BookEvent(Event):
+    __slots__ = ('feed', 'pair', 'timestamp', 'sequence', 'book')
+
+    def __init__(self, feed, pair, timestamp, sequence, book):
+        self.feed = feed
+        self.pair = pair
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.book = book
+
+
+class L3BookUpdateEvent(Event):
+    __slots__ = ('feed', 'pair', 'msg_type', 'timestamp', 'sequence', 'side', 'price', 'size')
+
+    def __init__(self, feed, pair, msg_type, timestamp, sequence, side, price, size):
+        self.feed = feed
+        self.pair = pair
+        self.msg_type = msg_type
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.side = side
+        self.price = price
+        self.size = size
 
 
 class Callback(object):
-    def __init__(self, callback):
+    """
+    Calls callback with the event's positional arguments. Sync callbacks run
+    in the loop's executor. Either kind can get the event's receipt from
+    timestamps.receipt()
+
+    events: call callback with a single slotted Event instead. Behind a
+            FanOut one event is built per message and shared by every
+            callback in event mode, so callbacks must not modify it
+    """
+    def __init__(self, callback, events=False):
+        if events and type(self).event is Callback.event:
+            raise ValueError("{} does not support events".format(type(self).__name__))
         self.callback = callback
         self.is_async = inspect.iscoroutinefunction(callback)
+        self.events = events
 
     async def __call__(self, *args, **kwargs):
         if self.callback is None:
@@ -20,51 +119,101 @@ class Callback(object):
         else:
             raise NotImplementedError
 
+    def event(self, **kwargs) -> Event:
+        """
+        the Event for a call's keyword arguments, implemented by callbacks
+        that support event mode
+        """
+        raise NotImplementedError
+
+    async def deliver(self, event: Event):
+        """
+        call callback with an event that is already built
+        """
+        if self.is_async:
+            await self.callback(event)
+        else:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, timestamps.bind(self.callback), event)
+
 
 class TradeCallback(Callback):
+    def event(self, feed, pair, side, amount, price, id=None, timestamp=None):
+        return TradeEvent(feed, pair, id, timestamp, side, amount, price)
+
     async def __call__(self, *, feed: str, pair: str, side: str, amount: Decimal, price: Decimal, id=None, timestamp=None):
-        if self.is_async:
+        if self.events:
+            await self.deliver(TradeEvent(feed, pair, id, timestamp, side, amount, price))
+        elif self.is_async:
             await self.callback(feed, pair, id, timestamp, side, amount, price)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, feed, pair, id, timestamp, side, amount, price)
+            await loop.run_in_executor(None, timestamps.bind(self.callback), feed, pair, id, timestamp,
+                                       side, amount, price)
 
 
 class TickerCallback(Callback):
+    def event(self, feed, pair, bid, ask):
+        return TickerEvent(feed, pair, bid, ask)
+
     async def __call__(self, *, feed: str, pair: str, bid:  Decimal, ask: Decimal):
-        if self.is_async:
+        if self.events:
+            await self.deliver(TickerEvent(feed, pair, bid, ask))
+        elif self.is_async:
             await self.callback(feed, pair, bid, ask)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, feed, pair, bid, ask)
+            await loop.run_in_executor(None, timestamps.bind(self.callback), feed, pair, bid, ask)
 
 
 class BookCallback(Callback):
+    """
+    callbacks receive an immutable view of the book (BookSnapshot) they can
+    keep. Taking it is O(1), levels are only copied if the view is still
+    referenced when the book next changes
+    """
+    def event(self, feed, pair, book):
+        return BookEvent(feed, pair, snapshot(book))
+
     async def __call__(self, *, feed: str, pair: str, book: dict):
-        if self.is_async:
+        book = snapshot(book)
+        if self.events:
+            await self.deliver(BookEvent(feed, pair, book))
+        elif self.is_async:
             await self.callback(feed, pair, book)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, feed, pair, book)
+            await loop.run_in_executor(None, timestamps.bind(self.callback), feed, pair, book)
+
 
+class L3BookCallback(BookCallback):
+    def event(self, feed, pair, timestamp, sequence, book):
+        return L3BookEvent(feed, pair, timestamp, sequence, snapshot(book))
 
-class L3BookCallback(Callback):
     async def __call__(self, *, feed: str, pair: str, timestamp: float, sequence: int, book: dict):
-        if self.is_async:
+        book = snapshot(book)
+        if self.events:
+            await self.deliver(L3BookEvent(feed, pair, timestamp, sequence, book))
+        elif self.is_async:
             await self.callback(feed, pair, timestamp, sequence, book)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, feed, pair, timestamp, sequence, book)
+            await loop.run_in_executor(None, timestamps.bind(self.callback), feed, pair, timestamp, sequence, book)
 
 
 class L3BookUpdateCallback(Callback):
+    def event(self, feed, pair, msg_type, timestamp, sequence, side, price, size):
+        return L3BookUpdateEvent(feed, pair, msg_type, timestamp, sequence, side, price, size)
+
     async def __call__(self, *, feed: str, pair: str, msg_type: str, timestamp: float,
                        sequence: int, side: str, price: Decimal, size: Decimal):
-        if self.is_async:
+        if self.events:
+            await self.deliver(L3BookUpdateEvent(feed, pair, msg_type, timestamp, sequence, side, price, size))
+        elif self.is_async:
             await self.callback(feed, pair, msg_type, timestamp, sequence, side, price, size)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, feed, pair, msg_type, timestamp,
+            await loop.run_in_executor(None, timestamps.bind(self.callback), feed, pair, msg_type, timestamp,
                                        sequence, side, price, size)
 
 
@@ -74,4 +223,160 @@ class VolumeCallback(Callback):
             await self.callback(**kwargs)
         else:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.callback, **kwargs)
+            await loop.run_in_executor(None, timestamps.bind(functools.partial(self.callback, **kwargs)))
+
+
+class FanOut:
+    """
+    Delivers each event to several callbacks, in order. The event is built
+    once and its values are shared by every callback, so callbacks must not
+    modify them. Books are snapshotted once for all callbacks, and callbacks
+    in event mode are all handed the same Event
+    """
+    def __init__(self, callbacks):
+        self.callbacks = []
+        # whether each callback takes an Event
+        self.takes_event = []
+        for callback in callbacks:
+            self.add(callback)
+
+    def add(self, callback):
+        if isinstance(callback, FanOut):
+            # flattened, so events are shared with its callbacks too
+            for child in callback.callbacks:
+                self.add(child)
+            return
+        self.callbacks.append(callback)
+        self.takes_event.append(getattr(callback, 'events', False) is True)
+
+    async def __call__(self, **kwargs):
+        if 'book' in kwargs:
+            kwargs['book'] = snapshot(kwargs['book'])
+        event = None
+        for callback, takes_event in zip(self.callbacks, self.takes_event):
+            if not takes_event:
+                await callback(**kwargs)
+                continue
+            if event is None:
+                event = callback.event(**kwargs)
+            await callback.deliver(event)
+
+
+class FilteredCallback:
+    """
+    Passes on only events for the given pairs and sides, and with an amount
+    (trades) or size (book updates) of at least min_size. Sides are BID/ASK,
+    feeds that report buy/sell match them as BID/ASK
+    """
+    def __init__(self, callback, pairs=None, sides=None, min_size=None):
+        self.callback = callback
+        self.pairs = frozenset(pairs) if pairs is not None else None
+        self.sides = frozenset(SIDE_IDS[side] for side in sides) if sides is not None else None
+        self.min_size = min_size
+
+    async def __call__(self, **kwargs):
+        if self.pairs is not None and kwargs.get('pair') not in self.pairs:
+            return
+        if self.sides is not None and SIDE_IDS.get(kwargs.get('side')) not in self.sides:
+            return
+        if self.min_size is not None:
+            size = kwargs.get('amount', kwargs.get('size'))
+            if size is not None and size < self.min_size:
+                return
+        await self.callback(**kwargs)
+
+
+class IsolatedCallback:
+    """
+    Runs a callback on its own worker task behind a bounded queue, so a slow
+    or hung callback holds up neither the feed nor other callbacks. Books are
+    copied and receipts (timestamps.receipt) captured when queued.
+
+    max_queue: events queued before the overflow policy applies. DROP_OLDEST
+               (the default) discards the oldest queued event, DROP the new
+               one and BLOCK waits for room, holding up the feed
+    timeout: seconds a call may take before it is cancelled. Calls to sync
+             callbacks are abandoned, their executor thread runs on
+    """
+    def __init__(self, callback, max_queue=1000, timeout=None, overflow=DROP_OLDEST):
+        if overflow not in (BLOCK, DROP, DROP_OLDEST):
+            raise ValueError("overflow must be {}, {} or {}".format(BLOCK, DROP, DROP_OLDEST))
+        self.callback = callback
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.overflow = overflow
+        self.queue = None
+        self.worker = None
+        self.calls = 0
+        self.dropped = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    async def __call__(self, **kwargs):
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queue)
+            self.worker = asyncio.ensure_future(self._work())
+        if 'book' in kwargs:
+            # delivered after the feed has moved on, possibly to another thread
+            kwargs['book'] = snapshot(kwargs['book'], copy=True)
+        item = (time(), timestamps.receipt(), kwargs)
+
+        if self.overflow == BLOCK:
+            await self.queue.put(item)
+            return
+        if self.queue.full():
+            self.dropped += 1
+            if self.overflow == DROP:
+                return
+            self.queue.get_nowait()
+            self.queue.task_done()
+        self.queue.put_nowait(item)
+
+    async def _work(self):
+        while True:
+            queued, receipt, kwargs = await self.queue.get()
+            # the callback sees the receipt of the event's frame
+            timestamps.set_receipt(receipt)
+            try:
+                if self.timeout is None:
+                    await self.callback(**kwargs)
+                else:
+                    await asyncio.wait_for(self.callback(**kwargs), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                LOG.warning("Callback %r timed out after %s seconds", self.callback, self.timeout)
+            except Exception:
+                self.errors += 1
+                LOG.exception("Callback %r failed", self.callback)
+            finally:
+                latency = time() - queued
+                self.calls += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                self.queue.task_done()
+
+    async def join(self):
+        """
+        wait until everything queued has been handled
+        """
+        if self.queue is not None:
+            await self.queue.join()
+
+    def stats(self) -> dict:
+        """
+        calls completed, events dropped, timeouts, errors, events queued and
+        latency (seconds from queueing to completion)
+        """
+        return {'calls': self.calls,
+                'dropped': self.dropped,
+                'timeouts': self.timeouts,
+                'errors': self.errors,
+                'queued': self.queue.qsize() if self.queue is not None else 0,
+                'mean_latency': self.total_latency / self.calls if self.calls else 0.0,
+                'max_latency': self.max_latency}
+
+    def close(self):
+        if self.worker is not None:
+            self.worker.cancel()
@@ -0,0 +1,82 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import logging
+import os
+import pickle
+import time
+import zlib
+
+from sortedcontainers import SortedDict as sd
+
+from cryptofeed.book import BookSnapshot, SideSnapshot
+from cryptofeed.defines import BID, ASK
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Book checkpoints for warm restarts
+
+A checkpoint is a zlib compressed pickle of
+
+    {'time': seconds since the epoch,
+     'feeds': {feed id: {'books': {channel: {pair: {BID: [(price, size), ...], ASK: [...]}}},
+                         'sequences': {pair: sequence number},
+                         ...feed specific {pair: state} entries, e.g. GDAX 'orders'}}}
+
+Every feed's books are delivered stale on restart. Feeds whose protocol
+allows it also resume maintaining a book from the checkpoint (see
+GDAX.restore), the saved sequence number decides whether the next live
+message continues it or a fresh snapshot is needed.
+
+Files are replaced atomically, so a crash while writing leaves the previous
+checkpoint in place. Checkpoints are pickles, only load ones you wrote.
+"""
+
+
+def state(feeds) -> dict:
+    """
+    checkpoint state of feeds. Feeds with the same id (e.g. one per pair) are merged
+    """
+    ret = {'time': time.time(), 'feeds': {}}
+    for feed in feeds:
+        feed_state = ret['feeds'].setdefault(feed.id, {'books': {}, 'sequences': {}})
+        checkpoint = feed.checkpoint()
+        for channel, books in checkpoint.pop('books').items():
+            feed_state['books'].setdefault(channel, {}).update(books)
+        for key, pairs in checkpoint.items():
+            feed_state.setdefault(key, {}).update(pairs)
+    return ret
+
+
+def save(path, state):
+    tmp = os.path.join(os.path.dirname(path), '.' + os.path.basename(path) + '.tmp')
+    with open(tmp, 'wb') as fp:
+        fp.write(zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1))
+    os.replace(tmp, path)
+
+
+def load(path):
+    """
+    state saved in path, None if there is no usable checkpoint
+    """
+    try:
+        with open(path, 'rb') as fp:
+            return pickle.loads(zlib.decompress(fp.read()))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        LOG.warning("Ignoring unreadable checkpoint %s: %s", path, str(e))
+        return None
+
+
+def stale_book(levels) -> BookSnapshot:
+    """
+    book from checkpointed levels, marked stale
+    """
+    return BookSnapshot({side: SideSnapshot(sd(levels[side])) for side in (BID, ASK)}, stale=True)
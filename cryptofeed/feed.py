@@ -5,23 +5,63 @@ Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
 import asyncio
+import logging
+from functools import partial
 from collections import defaultdict
 from time import time
-from datetime import datetime, timezone
+from datetime import datetime
 
-from cryptofeed.callback import Callback
-from cryptofeed.standards import pair_std_to_exchange
+from cryptofeed import metadata, timestamps
+from cryptofeed.book import new_book
+from cryptofeed.checkpoint import stale_book
+from cryptofeed.callback import Callback, FanOut, IsolatedCallback
+from cryptofeed.defines import BID, ASK
+from cryptofeed.standards import pair_std_to_exchange, pair_exchange_to_std
 from cryptofeed.feeds import TRADES, TICKER, L2_BOOK, L3_BOOK, L3_BOOK_UPDATE, VOLUME, feed_to_exchange
 
 
+LOG = logging.getLogger('feedhandler')
+
+
 class Feed:
     id = 'NotImplemented'
+    # frames that start/end with any of these (heartbeats, message types the feed
+    # throws away) are dropped by `ignored` before they are json decoded
+    ignore_prefixes = ()
+    ignore_suffixes = ()
+    # the exchange can add and remove subscriptions on a live connection (_subscribe/_unsubscribe)
+    incremental_subscriptions = False
 
-    def __init__(self, address, pairs=None, channels=None, callbacks=None, intervals=None, default_interval=60*60):
+    def __init__(self, address, pairs=None, channels=None, callbacks=None, intervals=None, default_interval=60*60,
+                 check_integrity=False, max_depth=None, l2_tick_size=None, isolate_callbacks=False,
+                 timestamp_ns=False):
+        """
+        check_integrity: check maintained books for crossed/locked prices (and exchange
+                         checksums where supported) and resync a book that fails.
+                         Books are also diffed against REST snapshots if an interval
+                         for _verify_book is set
+        max_depth: keep only the top N levels per side of each book sorted, either
+                   an int for every pair or a dict of pair -> N. Callbacks only see
+                   the top N, up to 4N deeper levels are kept unsorted and the book
+                   is resynced if it runs short of N levels (see DepthLimitedSide)
+        l2_tick_size: maintain an L2 view of L3 books aggregated into buckets of this
+                      price increment (a Decimal, or a dict of pair -> Decimal) and
+                      deliver it to the L2_BOOK callback whenever the L3 book changes
+        isolate_callbacks: run each callback on its own worker behind a bounded
+                           queue (see IsolatedCallback), True or a dict of
+                           IsolatedCallback keyword arguments
+        timestamp_ns: deliver exchange timestamps as int nanoseconds since the
+                      epoch (timestamps.Nanoseconds) instead of datetimes
+
+        callbacks maps channels to a callback or a list of callbacks, more can
+        be added with add_callback
+        """
         self.address = address
         self.standardized_pairs = pairs
         self.standardized_channels = channels
 
+        self.pairs = []
+        self.channels = []
         if pairs:
             self.pairs = [pair_std_to_exchange(pair, self.id) for pair in pairs]
         if channels:
@@ -29,6 +69,23 @@ class Feed:
         
         self.l3_book = {}
         self.l2_book = {}
+        self.instruments = {}
+        self._symbol_refresh = None
+        self.check_integrity = check_integrity
+        self._verify_tasks = {}
+        # (name, pair) -> background task working on pair, see _start_pair_task
+        self._pair_tasks = {}
+        self.websocket = None
+        # exchange pairs unsubscribed on the live connection, messages still
+        # in flight for them are dropped
+        self.removed_pairs = set()
+        self.max_depth = max_depth
+        self.l2_tick_size = l2_tick_size
+        # pair -> L2 view aggregated from the pair's L3 book
+        self.l2_views = {}
+        self.timestamp_ns = timestamp_ns
+        # detected from the first timestamp the feed parses
+        self._timestamp_parser = None
         self.callbacks = {TRADES: Callback(None),
                           TICKER: Callback(None),
                           L2_BOOK: Callback(None),
@@ -40,29 +97,121 @@ class Feed:
         if intervals is not None:
             self.intervals.update(intervals)
 
+        self.isolate_callbacks = isolate_callbacks
         if callbacks:
-            for cb in callbacks:
-                self.callbacks[cb] = callbacks[cb]
+            for channel, cbs in callbacks.items():
+                for cb in (cbs if isinstance(cbs, (list, tuple)) else [cbs]):
+                    self.add_callback(channel, cb)
+
+    def add_callback(self, channel, callback):
+        """
+        deliver channel's events to callback as well as any callbacks already registered
+        """
+        if self.isolate_callbacks:
+            options = {} if self.isolate_callbacks is True else self.isolate_callbacks
+            callback = IsolatedCallback(callback, **options)
+        current = self.callbacks.get(channel)
+        if isinstance(current, FanOut):
+            current.add(callback)
+        elif current is None or isinstance(current, Callback) and current.callback is None:
+            self.callbacks[channel] = callback
+        else:
+            self.callbacks[channel] = FanOut([current, callback])
+
+    def _new_book(self, pair, l3=False):
+        """
+        an empty book for pair, depth limited if max_depth applies to it. For
+        L3 books an aggregated L2 view is kept if l2_tick_size applies to it
+        """
+        depth = self.max_depth.get(pair) if isinstance(self.max_depth, dict) else self.max_depth
+        tick_size = None
+        if l3:
+            tick_size = self.l2_tick_size.get(pair) if isinstance(self.l2_tick_size, dict) else self.l2_tick_size
+        book = new_book(depth, tick_size)
+        if depth:
+            for side in (BID, ASK):
+                book[side].on_truncated = partial(self._truncated, pair)
+        if tick_size:
+            self.l2_views[pair] = {BID: book[BID].view, ASK: book[ASK].view}
+        return book
+
+    async def _l2_view_callback(self, pair):
+        """
+        deliver the aggregated L2 view of pair's L3 book, if one is maintained
+        """
+        view = self.l2_views.get(pair)
+        if view is not None:
+            await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=view)
+
+    def _books(self):
+        """
+        (channel, pair, book) for every book the feed maintains
+        """
+        for pair, book in self.l2_book.items():
+            yield L2_BOOK, pair, book
+        for pair, book in self.l3_book.items():
+            yield L3_BOOK, pair, book
+
+    def _checkpoint_pairs(self):
+        return set(getattr(self, 'pairs', None) or ()) | set(self.standardized_pairs or ())
+
+    def checkpoint(self) -> dict:
+        """
+        maintained books (the window of depth limited books) and sequence
+        numbers, see cryptofeed.checkpoint
+        """
+        books = {}
+        for channel, pair, book in self._books():
+            if book[BID] or book[ASK]:
+                books.setdefault(channel, {})[pair] = {side: list(book[side].items()) for side in (BID, ASK)}
+        return {'books': books, 'sequences': dict(getattr(self, 'seq_no', {}))}
+
+    async def restore(self, state):
+        """
+        deliver this feed's books from a checkpoint to the book callbacks,
+        marked stale, so they are usable before live books are built
+        """
+        pairs = self._checkpoint_pairs()
+        timestamp = timestamps.seconds_to_ns(state['time'])
+        timestamp = timestamps.Nanoseconds(timestamp) if self.timestamp_ns else timestamps.to_datetime(timestamp)
+        feed_state = state['feeds'].get(self.id, {'books': {}, 'sequences': {}})
+        for channel, books in feed_state['books'].items():
+            for pair, levels in books.items():
+                if pair not in pairs:
+                    continue
+                if channel == L3_BOOK:
+                    await self.callbacks[L3_BOOK](feed=self.id, pair=pair, timestamp=timestamp,
+                                                  sequence=feed_state['sequences'].get(pair), book=stale_book(levels))
+                else:
+                    await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=stale_book(levels))
 
     @staticmethod
     def tz_aware_datetime_from_string(tstring: str) -> datetime:
         """
-        from ISO compliant string to tz aware datetime object
+        from ISO compliant string (or seconds since the epoch) to tz aware datetime object
         :param tstring: timestamp string
         :return: tz aware datetime object
         """
-        # test for UNIX timestamp first
+        return timestamps.to_datetime(timestamps.to_ns(tstring))
+
+    def timestamp(self, value):
+        """
+        an exchange timestamp (ISO 8601, or seconds since the epoch as a string
+        or number) as a tz aware datetime, or Nanoseconds if timestamp_ns is set.
+        The format is detected once and redetected if it stops matching
+        """
         try:
-            timestamp = datetime.fromtimestamp(float(tstring), tz=timezone.utc)
+            ns = self._timestamp_parser(value)
+        except (TypeError, ValueError, IndexError):
+            self._timestamp_parser = timestamps.parser(value)
+            ns = self._timestamp_parser(value)
+        return timestamps.Nanoseconds(ns) if self.timestamp_ns else timestamps.to_datetime(ns)
 
-        # assume ISO timestamp
-        except ValueError:
-            try:
-                # test for `Z` (Zulu time) instead of offset UTC +0000
-                timestamp = datetime.strptime(tstring, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
-            except ValueError:
-                timestamp = datetime.strptime(tstring, '%Y-%m-%dT%H:%M:%S.%f%z')
-        return timestamp
+    def ignored(self, msg: str) -> bool:
+        """
+        cheap check on the raw frame, True if it can be dropped without decoding
+        """
+        return msg.startswith(self.ignore_prefixes) or msg.endswith(self.ignore_suffixes)
 
     async def synthesize_feed(self, func, *args, **kwargs):
         interval = self.intervals[func.__name__]
@@ -76,5 +225,183 @@ class Feed:
                 interval - ((time() - start_time) % interval)
             )
 
+    async def _refresh_symbols(self):
+        instruments = await metadata.refresh(self.id)
+        if instruments:
+            self.instruments = instruments
+
+    def _start_symbol_refresh(self):
+        """
+        refresh the instrument metadata cache in the background if
+        an interval for _refresh_symbols was configured
+        """
+        if '_refresh_symbols' in self.intervals and self._symbol_refresh is None:
+            self._symbol_refresh = asyncio.ensure_future(self.synthesize_feed(self._refresh_symbols))
+
+    async def _resync(self, pair):
+        """
+        rebuild a single book, implemented by feeds that maintain books
+        """
+        raise NotImplementedError
+
+    async def _verify_book(self, pair):
+        """
+        diff a maintained book against a REST snapshot, implemented by
+        feeds that support it
+        """
+        raise NotImplementedError
+
+    def _truncated(self, pair):
+        """
+        a depth limited side of pair's book ran short of levels after deeper
+        levels were pruned, resync the book if the feed can
+        """
+        LOG.warning("%s - %s book is missing pruned levels", self.id, pair)
+        if type(self)._resync is not Feed._resync:
+            self._start_pair_task('resync', pair, self._resync(pair))
+
+    async def _integrity_failure(self, pair, reason):
+        LOG.warning("%s - %s book failed integrity check (%s) - resyncing", self.id, pair, reason)
+        await self._resync(pair)
+
+    def _start_book_verification(self, pairs):
+        """
+        periodically verify the books for pairs in the background if an
+        interval for _verify_book was configured
+        """
+        if '_verify_book' not in self.intervals:
+            return
+        for pair in pairs:
+            if pair not in self._verify_tasks:
+                self._verify_tasks[pair] = asyncio.ensure_future(self.synthesize_feed(self._verify_book, pair))
+
+    def _start_pair_task(self, name, pair, coro):
+        """
+        run coro in the background for pair, replacing the pair's earlier task of the same name
+        """
+        task = self._pair_tasks.pop((name, pair), None)
+        if task is not None:
+            task.cancel()
+        self._pair_tasks[(name, pair)] = asyncio.ensure_future(coro)
+
+    def _exchange_pair(self, pair):
+        return pair_std_to_exchange(pair, self.id)
+
+    async def add_subscriptions(self, pairs=(), channels=()):
+        """
+        subscribe to more pairs (on every channel) and channels (for every
+        pair), by standard name. Feeds that support it update a live
+        connection in place, otherwise the feed is changed before it connects
+        """
+        self._check_live_changes()
+        pairs = [(pair, self._exchange_pair(pair)) for pair in pairs]
+        pairs = [(std, pair) for std, pair in pairs if pair not in self.pairs]
+        channels = [(channel, feed_to_exchange(self.id, channel)) for channel in channels]
+        channels = [(std, channel) for std, channel in channels if channel not in self.channels]
+        old_pairs = list(self.pairs)
+        new_pairs = [pair for _, pair in pairs]
+        new_channels = [channel for _, channel in channels]
+
+        self.pairs.extend(new_pairs)
+        self.channels.extend(new_channels)
+        if self.standardized_pairs is not None:
+            self.standardized_pairs = list(self.standardized_pairs) + [std for std, _ in pairs]
+        if self.standardized_channels is not None:
+            self.standardized_channels = list(self.standardized_channels) + [std for std, _ in channels]
+        self.removed_pairs.difference_update(new_pairs)
+
+        if self._connected():
+            if new_pairs:
+                await self._subscribe(self.websocket, self.channels, new_pairs)
+            if new_channels and old_pairs:
+                await self._subscribe(self.websocket, new_channels, old_pairs)
+        LOG.info("%s - added pairs %s channels %s", self.id, new_pairs, new_channels)
+
+    async def remove_subscriptions(self, pairs=(), channels=()):
+        """
+        unsubscribe pairs (from every channel) and channels (for every pair),
+        by standard name, and drop the books and background tasks of removed pairs
+        """
+        self._check_live_changes()
+        names = dict(zip(self.standardized_pairs or (), self.pairs))
+        pairs = [names.get(pair, pair) for pair in pairs]
+        pairs = [pair for pair in pairs if pair in self.pairs]
+        names = dict(zip(self.standardized_channels or (), self.channels))
+        channels = [names.get(channel, channel) for channel in channels]
+        channels = [channel for channel in channels if channel in self.channels]
+        if self._connected():
+            if pairs:
+                await self._unsubscribe(self.websocket, self.channels, pairs)
+            remaining = [pair for pair in self.pairs if pair not in pairs]
+            if channels and remaining:
+                await self._unsubscribe(self.websocket, channels, remaining)
+            self.removed_pairs.update(pairs)
+
+        for pair in pairs:
+            index = self.pairs.index(pair)
+            del self.pairs[index]
+            if self.standardized_pairs is not None:
+                self.standardized_pairs = [std for i, std in enumerate(self.standardized_pairs) if i != index]
+            self._remove_pair(pair)
+        for channel in channels:
+            index = self.channels.index(channel)
+            del self.channels[index]
+            if self.standardized_channels is not None:
+                self.standardized_channels = [std for i, std in enumerate(self.standardized_channels) if i != index]
+        LOG.info("%s - removed pairs %s channels %s", self.id, pairs, channels)
+
+    def _connected(self):
+        return self.websocket is not None and self.websocket.open
+
+    def _check_live_changes(self):
+        if self._connected() and not self.incremental_subscriptions:
+            raise NotImplementedError("{} can not change subscriptions on a live connection, "
+                                      "replace the feed instead".format(self.id))
+
+    async def _subscribe(self, websocket, channels, pairs):
+        """
+        subscribe to every channel for every pair (exchange names) on a live
+        connection, implemented by feeds with incremental_subscriptions
+        """
+        raise NotImplementedError
+
+    async def _unsubscribe(self, websocket, channels, pairs):
+        """
+        unsubscribe every channel for every pair (exchange names) on a live
+        connection, and drop what the feed keeps for those channels
+        """
+        raise NotImplementedError
+
+    def _remove_pair(self, pair):
+        """
+        drop the books, state and background tasks of an exchange pair
+        """
+        for name, task_pair in list(self._pair_tasks):
+            if task_pair == pair:
+                self._pair_tasks.pop((name, task_pair)).cancel()
+        task = self._verify_tasks.pop(pair, None)
+        if task is not None:
+            task.cancel()
+        std = self._std_pair(pair)
+        for books in (self.l2_book, self.l3_book, self.l2_views):
+            books.pop(pair, None)
+            books.pop(std, None)
+
+    def _std_pair(self, pair):
+        return pair_exchange_to_std(pair, self.id) or pair
+
+    def stop(self):
+        """
+        cancel the feed's background tasks, called when it is removed from a running FeedHandler
+        """
+        tasks = list(self._pair_tasks.values()) + list(self._verify_tasks.values())
+        if self._symbol_refresh is not None:
+            tasks.append(self._symbol_refresh)
+        for task in tasks:
+            task.cancel()
+        self._pair_tasks = {}
+        self._verify_tasks = {}
+        self._symbol_refresh = None
+
     def message_handler(self, msg):
         raise NotImplementedError
@@ -6,15 +6,15 @@ associated with this software.
 '''
 import asyncio
 import logging
-from datetime import datetime as dt
-from datetime import timedelta
 from socket import error as socket_error
 
 import websockets
 from websockets import ConnectionClosed
 
+from cryptofeed import checkpoint, timestamps
 from cryptofeed.defines import TICKER
 from cryptofeed import Gemini
+from cryptofeed.watchdog import Watchdog
 from .nbbo import NBBO
 
 
@@ -28,17 +28,58 @@ LOG = logging.getLogger('feedhandler')
 
 
 class FeedHandler(object):
-    def __init__(self, retries=10, timeout_interval=5):
+    def __init__(self, retries=10, timeout_interval=5, checkpoint=None, checkpoint_interval=60, channel_timeouts=None):
+        """
+        timeout_interval: unused, connections are watched by deadline (see cryptofeed.watchdog)
+        channel_timeouts: {channel: seconds} a connection may be silent, for
+                          channels that are busier or quieter than add_feed's
+                          timeout. A feed's connection uses the shortest timeout
+                          of its channels
+        checkpoint: file that maintained books and sequence numbers are saved to
+                    every checkpoint_interval seconds and on shutdown. On start,
+                    books from an existing checkpoint are delivered to the book
+                    callbacks marked stale (book.stale) until live books replace them
+        """
         self.feeds = []
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
         self.retries = retries
         self.timeout = {}
-        self.last_msg = {}
         self.timeout_interval = timeout_interval
+        self.channel_timeouts = channel_timeouts or {}
+        self.watchdog = Watchdog()
+        # feed -> connection task, while running
+        self.connections = {}
+        self.running = False
 
     def add_feed(self, feed, timeout=30):
+        """
+        feeds added while the handler is running connect straight away.
+        Pairs and channels of a running feed are changed with
+        feed.add_subscriptions/remove_subscriptions
+        """
         self.feeds.append(feed)
-        self.last_msg[feed.id] = None
         self.timeout[feed.id] = timeout
+        if self.running:
+            self._start(feed)
+
+    def remove_feed(self, feed):
+        """
+        close a feed's connection and cancel its background tasks, other feeds are not affected
+        """
+        self.feeds.remove(feed)
+        task = self.connections.pop(feed, None)
+        if task is not None:
+            task.cancel()
+        feed.stop()
+
+    def _start(self, feed):
+        self.connections[feed] = asyncio.ensure_future(self._connect(feed))
+
+    def _timeout(self, feed):
+        timeout = self.timeout[feed.id]
+        channels = feed.standardized_channels or ()
+        return min([self.channel_timeouts.get(channel, timeout) for channel in channels] or [timeout])
 
     def add_nbbo(self, feeds, pairs, callback, timeout=120):
         cb = NBBO(callback, pairs)
@@ -57,33 +98,68 @@ class FeedHandler(object):
             pass
         except Exception as e:
             LOG.error("Unhandled exception: %s", str(e))
-
-    def _run(self):
-        feeds = [asyncio.ensure_future(self._connect(feed)) for feed in self.feeds]
-        _, _ = yield from asyncio.wait(feeds)
-
-    async def _watch(self, feed_id, websocket):
-        while websocket.open:
-            if self.last_msg[feed_id]:
-                if dt.utcnow() - timedelta(seconds=self.timeout[feed_id]) > self.last_msg[feed_id]:
-                    LOG.warning("Feed {} received no messages within timeout, restarting connection".format(feed_id))
-                    await websocket.close()
-                    break
-            await asyncio.sleep(self.timeout_interval)
+        finally:
+            if self.checkpoint:
+                self._save_checkpoint()
+
+    async def _run(self):
+        tasks = []
+        if self.checkpoint:
+            await self._restore()
+            tasks.append(asyncio.ensure_future(self._checkpoint()))
+        tasks.append(asyncio.ensure_future(self.watchdog.run()))
+        self.running = True
+        for feed in self.feeds:
+            self._start(feed)
+        # feeds can be added and removed while waiting
+        while self.connections:
+            await asyncio.wait(list(self.connections.values()))
+            self.connections = {feed: task for feed, task in self.connections.items() if not task.done()}
+        self.running = False
+        for task in tasks:
+            task.cancel()
+
+    async def _restore(self):
+        state = checkpoint.load(self.checkpoint)
+        if state is None:
+            return
+        for feed in self.feeds:
+            await feed.restore(state)
+
+    def _save_checkpoint(self):
+        try:
+            checkpoint.save(self.checkpoint, checkpoint.state(self.feeds))
+        except Exception as e:
+            LOG.error("Unable to save checkpoint %s: %s", self.checkpoint, str(e))
+
+    async def _checkpoint(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            # books are copied on the loop, pickled and written off it
+            state = checkpoint.state(self.feeds)
+            try:
+                await loop.run_in_executor(None, checkpoint.save, self.checkpoint, state)
+            except Exception as e:
+                LOG.error("Unable to save checkpoint %s: %s", self.checkpoint, str(e))
 
     async def _connect(self, feed):
         retries = 0
         delay = 1
         while retries <= self.retries:
-            self.last_msg[feed.id] = None
             try:
                 async with websockets.connect(feed.address) as websocket:
-                    asyncio.ensure_future(self._watch(feed.id, websocket))
+                    watch = self.watchdog.watch(feed.id, websocket, self._timeout(feed))
                     # connection was successful, reset retry count and delay
                     retries = 0
                     delay = 1
-                    await feed.subscribe(websocket)
-                    await self._handler(websocket, feed.message_handler, feed.id)
+                    # tasks started by subscribe must not inherit the last frame's receipt
+                    timestamps.set_receipt(None)
+                    try:
+                        await feed.subscribe(websocket)
+                        await self._handler(websocket, feed.message_handler, watch)
+                    finally:
+                        self.watchdog.unwatch(watch)
             except (ConnectionClosed, ConnectionAbortedError, ConnectionResetError, socket_error) as e:
                 LOG.warning("Feed {} encountered connection issue {} - reconnecting...".format(feed.id, str(e)))
                 await asyncio.sleep(delay)
@@ -91,7 +167,10 @@ class FeedHandler(object):
                 delay = delay * 2
         LOG.error("Feed {} failed to reconnect after {} retries - exiting".format(feed.id, retries))
 
-    async def _handler(self, websocket, handler, feed_id):
+    async def _handler(self, websocket, handler, watch):
         async for message in websocket:
-            self.last_msg[feed_id] = dt.utcnow()
+            # captured once per frame, events from the frame carry it (timestamps.receipt)
+            receipt = timestamps.now()
+            timestamps.set_receipt(receipt)
+            watch.last = receipt.monotonic
             await handler(message)
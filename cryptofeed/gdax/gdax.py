@@ -13,6 +13,8 @@ import requests
 from sortedcontainers import SortedDict as sd
 
 from cryptofeed.feed import Feed
+from cryptofeed.integrity import crossed, diff
+from cryptofeed.orders import OrderStore
 from cryptofeed.exchanges import GDAX as GDAX_ID
 from cryptofeed.defines import L2_BOOK, L3_BOOK, L3_BOOK_UPDATE, BID, ASK, TRADES, TICKER
 
@@ -22,12 +24,68 @@ LOG = logging.getLogger('feedhandler')
 
 class GDAX(Feed):
     id = GDAX_ID
-
-    def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
+    # received and activate messages on the full channel are not used
+    ignore_prefixes = ('{"type":"received"', '{"type":"activate"')
+    incremental_subscriptions = True
+
+    def __init__(self, pairs=None, channels=None, callbacks=None, track_queue=False, **kwargs):
+        """
+        track_queue: keep the orders at each price level of the full channel book
+                     in arrival order so queue_position can be queried
+        """
         super().__init__('wss://ws-feed.gdax.com', pairs=pairs, channels=channels, callbacks=callbacks, **kwargs)
-        self.order_map = {}
+        self.orders = OrderStore(track_queue=track_queue)
         self.seq_no = {}
+        # (pair, message type) -> last sequence, for dropping replays without the full channel
+        self.last_sequence = {}
         self.book = {}
+        self.check_sequence = False
+        # pair -> (sequence, REST book) waiting for the feed to reach that sequence
+        self.pending_verify = {}
+        # full channel pairs resumed from a checkpoint, not snapshotted on subscribe
+        self.resumed = set()
+        # message type -> handler, None for message types that are ignored
+        self.dispatch = {}
+
+    def _books(self):
+        for pair, book in self.l2_book.items():
+            yield L2_BOOK, pair, book
+        for pair, book in self.book.items():
+            yield L3_BOOK, pair, book
+
+    def checkpoint(self) -> dict:
+        """
+        adds the resting orders of full channel books, so they can be resumed
+        """
+        ret = super().checkpoint()
+        ret['orders'] = {pair: [(order_id, order.side, order.price, order.size)
+                                for order_id, order in self.orders[pair].items()]
+                         for pair in self.book if pair in self.seq_no and pair in self.orders.pairs}
+        return ret
+
+    async def restore(self, state):
+        """
+        besides delivering stale books, resume full channel books from their
+        checkpointed orders and sequence number. The first live message either
+        continues the sequence or, on a gap, the book is snapshotted as usual
+        """
+        await super().restore(state)
+        if 'full' not in self.channels:
+            return
+        feed_state = state['feeds'].get(self.id, {})
+        sequences = feed_state.get('sequences', {})
+        orders = feed_state.get('orders', {})
+        for pair in self.pairs:
+            if pair not in sequences or pair not in orders:
+                continue
+            book = self._new_book(pair, l3=True)
+            self.orders.reset(pair)
+            for order_id, side, price, size in orders[pair]:
+                self.orders.add(pair, order_id, side, price, size)
+                book[side][price] = book[side].get(price, 0) + size
+            self.book[pair] = book
+            self.seq_no[pair] = sequences[pair]
+            self.resumed.add(pair)
 
     async def _ticker(self, msg):
         '''
@@ -84,17 +142,19 @@ class GDAX(Feed):
         }
         '''
         sequence = msg['sequence']
-        timestamp = self.tz_aware_datetime_from_string(msg['time'])
+        timestamp = self.timestamp(msg['time'])
         pair = msg['product_id']
         price = Decimal(msg['price'])
         side = ASK if msg['side'] == 'sell' else BID
         size = Decimal(msg['size'])
-        if self.book:
+        if pair in self.book:
             maker_order_id = msg['maker_order_id']
 
-            self.order_map[maker_order_id]['size'] -= size
-            if self.order_map[maker_order_id]['size'] <= 0:
-                del self.order_map[maker_order_id]
+            order = self.orders.get(pair, maker_order_id)
+            if order is not None:
+                order.size -= size
+                if order.size <= 0:
+                    self.orders.pop(pair, maker_order_id)
 
             self.book[pair][side][price] -= size
             if self.book[pair][side][price] == 0:
@@ -110,6 +170,7 @@ class GDAX(Feed):
                 price=price,
                 size=size
             )
+            await self._l2_view_callback(pair)
 
         await self.callbacks[TRADES](
                 feed=self.id,
@@ -122,23 +183,24 @@ class GDAX(Feed):
             )
 
     async def _pair_level2_snapshot(self, msg):
-        self.l2_book[msg['product_id']] = {
-            BID: sd({
-                Decimal(price): Decimal(amount)
-                for price, amount in msg['bids']
-            }),
-            ASK: sd({
+        pair = msg['product_id']
+        self.l2_book[pair] = self._new_book(pair)
+        for side in (BID, ASK):
+            self.l2_book[pair][side].update({
                 Decimal(price): Decimal(amount)
-                for price, amount in msg['asks']
+                for price, amount in msg[side + 's']
             })
-        }
 
     async def _pair_level2_update(self, msg):
         pair = msg['product_id']
+        book = self.l2_book.get(pair)
+        if book is None:
+            # level2 was unsubscribed for the pair, the update was in flight
+            return
         for side, price, amount in msg['changes']:
             price = Decimal(price)
             amount = Decimal(amount)
-            bidask = self.l2_book[pair][BID if side == 'buy' else ASK]
+            bidask = book[BID if side == 'buy' else ASK]
 
             if amount == "0":
                 if price in bidask:
@@ -146,7 +208,7 @@ class GDAX(Feed):
             else:
                 bidask[price] = amount
 
-        await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=self.l2_book[pair])
+        await self.callbacks[L2_BOOK](feed=self.id, pair=pair, book=book)
 
     async def _book_snapshot(self, pair, update_book=True, ignore_sequence=False):
         loop = asyncio.get_event_loop()
@@ -154,7 +216,11 @@ class GDAX(Feed):
         result = await loop.run_in_executor(None, requests.get, url)
         orders = result.json()
         seq_no = orders['sequence']
-        book = {BID: sd(), ASK: sd()}
+        book = self._new_book(pair, l3=update_book)
+        if update_book:
+            self.orders.reset(pair)
+            self.pending_verify.pop(pair, None)
+            add_order = self.orders.add
 
         for side in (BID, ASK):
             book_side = book[side]
@@ -168,7 +234,8 @@ class GDAX(Feed):
                     book_side[price] = size
 
                 if update_book:
-                    self.order_map[order_id] = {'price': price, 'size': size}
+                    # levels are listed oldest order first
+                    add_order(pair, order_id, side, price, size)
 
         if update_book:
             self.book[pair] = book
@@ -181,22 +248,83 @@ class GDAX(Feed):
                                       timestamp=None,
                                       sequence=seq_no,
                                       book=book)
+        if update_book:
+            await self._l2_view_callback(pair)
+
+    async def _resync(self, pair):
+        await self._book_snapshot(pair)
+
+    async def _verify_book(self, pair, attempts=3):
+        """
+        fetch the aggregated top 50 levels and diff them against the full
+        channel book once the feed reaches the snapshot's sequence number.
+        The book can't be wound back, so a snapshot the feed has already
+        passed is refetched
+        """
+        loop = asyncio.get_event_loop()
+        url = 'https://api.gdax.com/products/{}/book?level=2'.format(pair)
+        for _ in range(attempts):
+            if pair not in self.book:
+                return
+            try:
+                result = await loop.run_in_executor(None, requests.get, url)
+                levels = result.json()
+            except Exception as e:
+                LOG.warning("%s - unable to fetch %s book for verification: %s", self.id, pair, str(e))
+                return
+            sequence = levels['sequence']
+            current = self.seq_no.get(pair)
+            if current is None:
+                return
+            if current <= sequence:
+                break
+        else:
+            LOG.debug("%s - %s book moved past %d REST snapshots, not verified", self.id, pair, attempts)
+            return
+
+        snapshot = {BID: sd(), ASK: sd()}
+        for side in (BID, ASK):
+            for price, size, _ in levels[side + 's']:
+                snapshot[side][Decimal(price)] = Decimal(size)
+        self.pending_verify[pair] = (sequence, snapshot)
+        await self._verify_pending(pair, current)
+
+    async def _verify_pending(self, pair, sequence):
+        pending = self.pending_verify.get(pair)
+        if pending is None or sequence < pending[0]:
+            return
+        del self.pending_verify[pair]
+        if sequence > pending[0]:
+            # skipped past the snapshot (e.g. resync), nothing to compare against
+            return
+        mismatches = diff(self.book[pair], pending[1], depth=50)
+        if mismatches:
+            await self._integrity_failure(pair, '{} levels differ from REST snapshot'.format(len(mismatches)))
+
+    def queue_position(self, pair, order_id):
+        """
+        (number of orders, total size) resting ahead of order_id at its price,
+        None if the order is not on the book. Requires track_queue.
+        """
+        return self.orders.queue_position(pair, order_id)
 
     async def _open(self, msg):
+        pair = msg['product_id']
+        if pair not in self.book:
+            return
         price = Decimal(msg['price'])
         side = ASK if msg['side'] == 'sell' else BID
         size = Decimal(msg['remaining_size'])
-        pair = msg['product_id']
         order_id = msg['order_id']
         sequence = msg['sequence']
-        timestamp = self.tz_aware_datetime_from_string(msg['time'])
+        timestamp = self.timestamp(msg['time'])
 
         if price in self.book[pair][side]:
             self.book[pair][side][price] += size
         else:
             self.book[pair][side][price] = size
 
-        self.order_map[order_id] = {'price': price, 'size': size}
+        self.orders.add(pair, order_id, side, price, size)
         await self.callbacks[L3_BOOK_UPDATE](
                 feed=self.id,
                 pair=pair,
@@ -207,52 +335,58 @@ class GDAX(Feed):
                 price=price,
                 size=size
         )
+        await self._l2_view_callback(pair)
+
+        # orders only rest once they can no longer match, so a new order
+        # crossing the book means an update was missed
+        if self.check_integrity and crossed(self.book[pair]):
+            await self._integrity_failure(pair, 'crossed book')
 
     async def _done(self, msg):
         if 'price' not in msg:
             return
-        order_id = msg['order_id']
-        if order_id not in self.order_map:
-            return
-        price = Decimal(msg['price'])
-        side = ASK if msg['side'] == 'sell' else BID
         pair = msg['product_id']
-        size = self.order_map[order_id]['size']
+        order = self.orders.pop(pair, msg['order_id'])
+        if order is None:
+            return
+        price = order.price
+        side = order.side
+        size = order.size
         sequence = msg['sequence']
-        timestamp = self.tz_aware_datetime_from_string(msg['time'])
+        timestamp = self.timestamp(msg['time'])
 
         if self.book[pair][side][price] - size == 0:
             del self.book[pair][side][price]
         else:
             self.book[pair][side][price] -= size
 
-        del self.order_map[order_id]
         await self.callbacks[L3_BOOK_UPDATE](
                 feed=self.id,
                 pair=pair,
                 msg_type='done',
-                ts=timestamp,
-                seq=sequence,
+                timestamp=timestamp,
+                sequence=sequence,
                 side=side,
                 price=price,
                 size=size
             )
+        await self._l2_view_callback(pair)
 
     async def _change(self, msg):
-        order_id = msg['order_id']
-        if order_id not in self.order_map:
+        pair = msg['product_id']
+        order = self.orders.get(pair, msg['order_id'])
+        if order is None:
             return
-        price = Decimal(msg['price'])
-        side = ASK if msg['side'] == 'sell' else BID
+        price = order.price
+        side = order.side
         new_size = Decimal(msg['new_size'])
         old_size = Decimal(msg['old_size'])
-        pair = msg['product_id']
 
         size = old_size - new_size
         sequence = msg['sequence']
-        timestamp = self.tz_aware_datetime_from_string(msg['time'])
+        timestamp = self.timestamp(msg['time'])
         self.book[pair][side][price] -= size
-        self.order_map[order_id] = new_size
+        order.size = new_size
 
         await self.callbacks[L3_BOOK_UPDATE](
                 feed=self.id,
@@ -264,66 +398,172 @@ class GDAX(Feed):
                 price=price,
                 size=size
             )
+        await self._l2_view_callback(pair)
+
+    async def _in_sequence(self, pair, sequence):
+        """
+        returns False if the message should be dropped, either because it is
+        a duplicate or because a gap was detected and the book was resynced
+        """
+        if pair not in self.seq_no:
+            self.seq_no[pair] = sequence
+        elif sequence <= self.seq_no[pair]:
+            return False
+        elif sequence != self.seq_no[pair] + 1:
+            LOG.warning("Missing sequence number detected")
+            LOG.warning("Requesting book snapshot")
+            await self._book_snapshot(pair)
+            return False
+
+        self.seq_no[pair] = sequence
+        return True
+
+    def _fresh(self, msg):
+        """
+        without the full channel a product's sequence numbers have gaps, so
+        only replayed messages (no newer than the last of their type) are dropped
+        """
+        msg_type = msg.get('type')
+        key = (msg['product_id'], 'match' if msg_type == 'last_match' else msg_type)
+        if msg['sequence'] <= self.last_sequence.get(key, -1):
+            return False
+        self.last_sequence[key] = msg['sequence']
+        return True
+
+    @staticmethod
+    def _raw_sequence(msg: str):
+        """
+        product id and sequence number from an undecoded (compact) message
+        """
+        start = msg.index('"product_id":"') + 14
+        pair = msg[start:msg.index('"', start)]
+        start = msg.index('"sequence":') + 11
+        end = msg.find(',', start)
+        if end == -1:
+            end = msg.index('}', start)
+        return pair, int(msg[start:end])
 
     async def message_handler(self, msg: str):
+        if self.ignored(msg):
+            if not self.check_sequence:
+                return
+            # ignored messages on the full channel still advance the sequence,
+            # so pull it out of the raw message to keep gap detection intact
+            try:
+                pair, sequence = self._raw_sequence(msg)
+            except ValueError:
+                # unexpected layout, fall back to decoding the message
+                pass
+            else:
+                if pair in self.removed_pairs:
+                    return
+                if await self._in_sequence(pair, sequence) and self.pending_verify:
+                    await self._verify_pending(pair, sequence)
+                return
+
         msg = json.loads(msg, parse_float=Decimal)
-        if not msg.get('ignore_sequence', False) and \
-                'full' in self.channels and \
+        if self.removed_pairs and msg.get('product_id') in self.removed_pairs:
+            return
+        if 'sequence' in msg and \
                 'product_id' in msg and \
-                'sequence' in msg:
-            pair = msg['product_id']
-            if pair not in self.seq_no:
-                self.seq_no[pair] = msg['sequence']
-            elif msg['sequence'] <= self.seq_no[pair]:
-                return
-            elif 'full' in self.channels and msg['sequence'] != self.seq_no[pair] + 1:
-                LOG.warning("Missing sequence number detected")
-                LOG.warning("Requesting book snapshot")
-                await self._book_snapshot(pair)
+                not msg.get('ignore_sequence', False):
+            if self.check_sequence:
+                if not await self._in_sequence(msg['product_id'], msg['sequence']):
+                    return
+            elif not self._fresh(msg):
                 return
-        
-            self.seq_no[pair] = msg['sequence']
 
         if 'type' in msg:
-            if msg['type'] == 'ticker':
-                await self._ticker(msg)
-            elif msg['type'] == 'match' or msg['type'] == 'last_match':
-                await self._book_update(msg)
-            elif msg['type'] == 'snapshot':
-                await self._pair_level2_snapshot(msg)
-            elif msg['type'] == 'l2update':
-                await self._pair_level2_update(msg)
-            elif msg['type'] == 'open':
-                await self._open(msg)
-            elif msg['type'] == 'done':
-                await self._done(msg)
-            elif msg['type'] == 'change':
-                await self._change(msg)
-            elif msg['type'] == 'received':
-                pass
-            elif msg['type'] == 'activate':
-                pass
-            elif msg['type'] == 'subscriptions':
-                pass
-            else:
+            try:
+                handler = self.dispatch[msg['type']]
+            except KeyError:
                 LOG.warning('{} - Invalid message type {}'.format(self.id, msg))
+                return
+            if handler is not None:
+                await handler(msg)
+
+        if self.pending_verify and 'sequence' in msg and 'product_id' in msg:
+            await self._verify_pending(msg['product_id'], msg['sequence'])
 
     async def subscribe(self, websocket):
-        l3_book = False
-        # remove l3_book from channels as we will be synthesizing that feed
-        if L3_BOOK in self.channels:
-            l3_book = True
-            self.channels.pop(self.channels.index(L3_BOOK))
-
-        await websocket.send(json.dumps({"type": "subscribe",
-                                         "product_ids": self.pairs,
-                                         "channels": self.channels
-                                        }))
-        if l3_book:
-            for pair in self.pairs:
-                asyncio.ensure_future(self.synthesize_feed(self._book_snapshot,
-                                                           pair,
-                                                           update_book=False,
-                                                           ignore_sequence=True))
-        if 'full' in self.channels:
-            await asyncio.gather(*[self._book_snapshot(pair) for pair in self.pairs])
+        self.websocket = websocket
+        self.removed_pairs = set()
+        self.check_sequence = False
+        self.last_sequence = {}
+        self.dispatch = {
+            'ticker': self._ticker,
+            'match': self._book_update,
+            'last_match': self._book_update,
+            'snapshot': self._pair_level2_snapshot,
+            'l2update': self._pair_level2_update,
+            'open': self._open,
+            'done': self._done,
+            'change': self._change,
+            'received': None,
+            'activate': None,
+            'subscriptions': None
+        }
+        await self._subscribe(websocket, self.channels, self.pairs)
+
+    async def _subscribe(self, websocket, channels, pairs):
+        # l3_book is synthesized from REST snapshots rather than subscribed to
+        live = [channel for channel in channels if channel != L3_BOOK]
+        if 'full' in live:
+            self.check_sequence = True
+        if live:
+            await websocket.send(json.dumps({"type": "subscribe",
+                                             "product_ids": pairs,
+                                             "channels": live
+                                            }))
+        if L3_BOOK in channels:
+            for pair in pairs:
+                self._start_pair_task(L3_BOOK, pair, self.synthesize_feed(self._book_snapshot,
+                                                                          pair,
+                                                                          update_book=False,
+                                                                          ignore_sequence=True))
+        if 'full' in live:
+            await asyncio.gather(*[self._book_snapshot(pair) for pair in pairs if pair not in self.resumed])
+            self.resumed.difference_update(pairs)
+            self._start_book_verification(pairs)
+
+    async def _unsubscribe(self, websocket, channels, pairs):
+        live = [channel for channel in channels if channel != L3_BOOK]
+        if live:
+            await websocket.send(json.dumps({"type": "unsubscribe",
+                                             "product_ids": pairs,
+                                             "channels": live
+                                            }))
+        for pair in pairs:
+            if L3_BOOK in channels:
+                task = self._pair_tasks.pop((L3_BOOK, pair), None)
+                if task is not None:
+                    task.cancel()
+            if 'level2' in channels:
+                self.l2_book.pop(pair, None)
+            if 'full' in channels:
+                self._remove_full_book(pair)
+
+    async def remove_subscriptions(self, pairs=(), channels=()):
+        await super().remove_subscriptions(pairs, channels)
+        # sequence numbers are per product across channels, so without the
+        # full channel there are gaps
+        if 'full' not in self.channels:
+            self.check_sequence = False
+            self.seq_no = {}
+
+    def _remove_full_book(self, pair):
+        self.book.pop(pair, None)
+        self.l2_views.pop(pair, None)
+        self.orders.remove(pair)
+        self.seq_no.pop(pair, None)
+        self.resumed.discard(pair)
+        self.pending_verify.pop(pair, None)
+        task = self._verify_tasks.pop(pair, None)
+        if task is not None:
+            task.cancel()
+
+    def _remove_pair(self, pair):
+        super()._remove_pair(pair)
+        self._remove_full_book(pair)
+        for key in [key for key in self.last_sequence if key[0] == pair]:
+            del self.last_sequence[key]
@@ -4,16 +4,16 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
+# standardized pairs listed on GDAX, see cryptofeed.standards
+standard_pairs = (
+    'BTC-USD', 'ETH-USD', 'ETH-BTC', 'BCH-USD', 'LTC-EUR', 'LTC-USD', 'LTC-BTC',
+    'ETH-EUR', 'BTC-GBP', 'BTC-EUR'
+)
 
-gdax_trading_pairs = {
-    'BCH-USD',
-    'LTC-EUR',
-    'LTC-USD',
-    'LTC-BTC',
-    'ETH-EUR',
-    'ETH-USD',
-    'ETH-BTC',
-    'BTC-GBP',
-    'BTC-EUR',
-    'BTC-USD',
-}
+
+def exchange_symbol(pair: str) -> str:
+    # GDAX uses the standard form, e.g. BTC-USD
+    return pair
+
+
+gdax_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
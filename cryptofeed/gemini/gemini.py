@@ -11,7 +11,6 @@ from decimal import Decimal
 from functools import partial
 
 import requests
-from sortedcontainers import SortedDict as sd
 
 from cryptofeed.feed import Feed
 from cryptofeed.exchanges import GEMINI
@@ -24,6 +23,7 @@ LOG = logging.getLogger('feedhandler')
 
 class Gemini(Feed):
     id = GEMINI
+    ignore_prefixes = ('{"type":"heartbeat"',)
 
     def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
         self.l3_snapshot_channel = False
@@ -44,7 +44,23 @@ class Gemini(Feed):
                          channels=None,
                          callbacks=callbacks,
                          **kwargs)
-        self.book = {BID: sd(), ASK: sd()}
+        self.book = self._new_book(self.pair, l3=True)
+        # message type -> handler, None for message types that are ignored
+        self.dispatch = {}
+        # update event type -> handler
+        self.event_dispatch = {}
+
+    def _books(self):
+        yield L3_BOOK, self.pair, self.book
+
+    def _checkpoint_pairs(self):
+        return {self.pair}
+
+    async def add_subscriptions(self, pairs=(), channels=()):
+        raise ValueError("Gemini requires a websocket per trading pair, add a feed per pair instead")
+
+    async def remove_subscriptions(self, pairs=(), channels=()):
+        raise ValueError("Gemini requires a websocket per trading pair, remove the feed instead")
 
     async def _book_snapshot(self):
         # this will not be very useful for rebuilding from l3 messages as
@@ -55,7 +71,7 @@ class Gemini(Feed):
         get_book = partial(requests.get, params={'limit_bids': 0, 'limit_asks': 0})
         response = await loop.run_in_executor(None, get_book, url)
         response = response.json()
-        snapshot = {BID: sd(), ASK: sd()}
+        snapshot = self._new_book(self.pair)
 
         for side in (BID, ASK):
             book_side = snapshot[side]
@@ -80,7 +96,7 @@ class Gemini(Feed):
         remaining = Decimal(msg['remaining'])
         delta = Decimal(msg['delta'])
         reason = msg['reason']
-        timestamp = self.tz_aware_datetime_from_string(msg['timestamp'])
+        timestamp = self.timestamp(msg['timestamp'])
 
         if msg['reason'] == 'initial':
             self.book[side][price] = remaining
@@ -97,6 +113,7 @@ class Gemini(Feed):
                                              side=side,
                                              price=price,
                                              size=delta)
+        await self._l2_view_callback(self.pair)
 
     async def _trade(self, msg):
         price = Decimal(msg['price'])
@@ -122,26 +139,36 @@ class Gemini(Feed):
         for update in msg['events']:
             update['timestamp'] = timestamp
             update['sequence'] = sequence
-            if update['type'] == 'change':
-                await self._book(update)
-            elif update['type'] == 'trade':
-                await self._trade(update)
-            elif update['type'] == 'auction':
-                pass
-            elif update['type'] == 'block_trade':
-                pass
-            else:
+            try:
+                handler = self.event_dispatch[update['type']]
+            except KeyError:
                 LOG.warning("Invalid update received {}".format(update))
+                continue
+            if handler is not None:
+                await handler(update)
 
     async def message_handler(self, msg):
+        if self.ignored(msg):
+            return
         msg = json.loads(msg, parse_float=Decimal)
-        if msg['type'] == 'update':
-            await self._update(msg)
-        elif msg['type'] == 'heartbeat':
-            pass
-        else:
+        try:
+            handler = self.dispatch[msg['type']]
+        except KeyError:
             LOG.warning('Invalid message type {}'.format(msg))
+            return
+        if handler is not None:
+            await handler(msg)
 
     async def subscribe(self, *args):
+        self.dispatch = {
+            'update': self._update,
+            'heartbeat': None
+        }
+        self.event_dispatch = {
+            'change': self._book,
+            'trade': self._trade,
+            'auction': None,
+            'block_trade': None
+        }
         if self.l3_snapshot_channel:
             asyncio.ensure_future(self.synthesize_feed(self._book_snapshot))
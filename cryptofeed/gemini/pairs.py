@@ -4,8 +4,15 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-gemini_trading_pairs = {
-    'BTCUSD',
-    'ETHUSD',
-    'ETHBTC'
-}
\ No newline at end of file
+# standardized pairs listed on Gemini, see cryptofeed.standards
+standard_pairs = (
+    'BTC-USD', 'ETH-USD', 'ETH-BTC'
+)
+
+
+def exchange_symbol(pair: str) -> str:
+    # BTC-USD -> BTCUSD
+    return pair.replace('-', '')
+
+
+gemini_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
@@ -10,8 +10,8 @@ import asyncio
 from decimal import Decimal
 
 import requests
-from sortedcontainers import SortedDict as sd
 
+from cryptofeed import metadata
 from cryptofeed.feed import Feed
 from cryptofeed.exchanges import HITBTC
 from cryptofeed.defines import TICKER, L3_BOOK, L3_BOOK_UPDATE, TRADES, BID, ASK
@@ -23,30 +23,44 @@ LOG = logging.getLogger('feedhandler')
 
 class HitBTC(Feed):
     id = HITBTC
+    incremental_subscriptions = True
 
-    def __init__(self, pairs=None, channels=None, callbacks=None):
+    def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
+        # register listings from the symbol cache (if present) before
+        # pairs are converted, this never hits the network
+        instruments = metadata.instruments(self.id, allow_fetch=False)
         super().__init__('wss://api.hitbtc.com/api/2/ws',
                          pairs=pairs,
                          channels=channels,
-                         callbacks=callbacks)
+                         callbacks=callbacks,
+                         **kwargs)
+        self.instruments = instruments
+        # method -> handler
+        self.dispatch = {}
+        # exchange symbol -> standard pair for the subscribed pairs
+        self.std_pairs = {}
 
     async def _ticker(self, msg):
         await self.callbacks[TICKER](feed=self.id,
-                                     pair=pair_exchange_to_std(msg['symbol']),
+                                     pair=self.std_pairs[msg['symbol']],
                                      bid=Decimal(msg['bid']),
                                      ask=Decimal(msg['ask']))
     
     async def _book(self, msg):
         sequence = msg['sequence']
-        pair = pair_exchange_to_std(msg['symbol'])
+        pair = self.std_pairs[msg['symbol']]
+        book = self.l3_book.get(pair)
+        if book is None:
+            # the order book was unsubscribed, the update was in flight
+            return
         for side in (BID, ASK):
             for entry in msg[side]:
                 price = Decimal(entry['price'])
                 size = Decimal(entry['size'])
                 if size == 0:
-                    del self.l3_book[pair][side][price]
+                    del book[side][price]
                 else:
-                    self.l3_book[pair][side][price] = size
+                    book[side][price] = size
                 await self.callbacks[L3_BOOK_UPDATE](feed=self.id,
                                                      pair=pair,
                                                      msg_type='change',
@@ -55,6 +69,7 @@ class HitBTC(Feed):
                                                      side=side,
                                                      price=price,
                                                      size=size)
+        await self._l2_view_callback(pair)
 
     async def _book_snapshot(self, pair):
         url = "https://api.hitbtc.com/api/2/public/orderbook/{}?limit=0".format(pair)
@@ -68,9 +83,9 @@ class HitBTC(Feed):
         await self._snapshot(msg, update_book=False)
 
     async def _snapshot(self, msg, update_book=True):
-        pair = pair_exchange_to_std(msg['symbol'])
+        pair = self.std_pairs[msg['symbol']]
         sequence = msg['sequence']
-        book = {ASK: sd(), BID: sd()}
+        book = self._new_book(pair, l3=update_book)
         for side in (BID, ASK):
             book_side = book[side]
             for entry in msg[side]:
@@ -84,9 +99,11 @@ class HitBTC(Feed):
                                       timestamp=None,
                                       pair=pair,
                                       book=book)
+        if update_book:
+            await self._l2_view_callback(pair)
 
     async def _trades(self, msg):
-        pair = pair_exchange_to_std(msg['symbol'])
+        pair = self.std_pairs[msg['symbol']]
         for update in msg['data']:
             price = Decimal(update['price'])
             quantity = Decimal(update['quantity'])
@@ -99,17 +116,15 @@ class HitBTC(Feed):
 
     async def message_handler(self, msg):
         msg = json.loads(msg, parse_float=Decimal)
+        if self.removed_pairs and msg.get('params', msg.get('data', {})).get('symbol') in self.removed_pairs:
+            return
         if 'method' in msg:
-            if msg['method'] == 'ticker':
-                await self._ticker(msg['params'])
-            elif msg['method'] == 'snapshotOrderbook':
-                await self._snapshot(msg['params'])
-            elif msg['method'] == 'updateOrderbook':
-                await self._book(msg['params'])
-            elif msg['method'] == 'updateTrades' or msg['method'] == 'snapshotTrades':
-                await self._trades(msg['params'])
-            else:
+            try:
+                handler = self.dispatch[msg['method']]
+            except KeyError:
                 LOG.warning("{} - Invalid message received: {}".format(self.id, msg))
+                return
+            await handler(msg['params'])
         elif 'channel' in msg:
             if msg['channel'] == 'ticker':
                 await self._ticker(msg['data'])
@@ -120,8 +135,23 @@ class HitBTC(Feed):
                 LOG.error("{} - Received error from server {}".format(self.id, msg))
 
     async def subscribe(self, websocket):
-        for channel in self.channels:
-            for pair in self.pairs:
+        self.websocket = websocket
+        self.removed_pairs = set()
+        self.dispatch = {
+            'ticker': self._ticker,
+            'snapshotOrderbook': self._snapshot,
+            'updateOrderbook': self._book,
+            'snapshotTrades': self._trades,
+            'updateTrades': self._trades
+        }
+        self.std_pairs = {}
+        await self._subscribe(websocket, self.channels, self.pairs)
+        self._start_symbol_refresh()
+
+    async def _subscribe(self, websocket, channels, pairs):
+        self.std_pairs.update({pair: pair_exchange_to_std(pair, self.id) for pair in pairs})
+        for channel in channels:
+            for pair in pairs:
                 await websocket.send(
                     json.dumps({
                         "method": channel,
@@ -130,6 +160,27 @@ class HitBTC(Feed):
                         },
                         "id": 123
                     }))
-        if L3_BOOK in self.channels and '_book_snapshot' in self.intervals:
-            for pair in self.pairs:
-                asyncio.ensure_future(self.synthesize_feed(self._book_snapshot, pair))
+        if 'subscribeOrderbook' in channels and '_book_snapshot' in self.intervals:
+            for pair in pairs:
+                self._start_pair_task('_book_snapshot', pair, self.synthesize_feed(self._book_snapshot, pair))
+
+    async def _unsubscribe(self, websocket, channels, pairs):
+        for channel in channels:
+            for pair in pairs:
+                # subscribeTicker -> unsubscribeTicker
+                await websocket.send(
+                    json.dumps({
+                        "method": 'un' + channel,
+                        "params": {
+                            "symbol": pair
+                        },
+                        "id": 123
+                    }))
+        if 'subscribeOrderbook' in channels:
+            for pair in pairs:
+                std = self.std_pairs.get(pair, pair)
+                self.l3_book.pop(std, None)
+                self.l2_views.pop(std, None)
+                task = self._pair_tasks.pop(('_book_snapshot', pair), None)
+                if task is not None:
+                    task.cancel()
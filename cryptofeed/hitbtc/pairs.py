@@ -4,437 +4,84 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
+# standardized pairs listed on HitBTC, see cryptofeed.standards
+standard_pairs = (
+    'BTC-USD', 'ETH-USD', 'ETH-BTC', 'BCH-USD', 'LTC-USD', 'LTC-BTC', 'BCH-ETH',
+    'DATA-BTC', 'ETC-BTC', 'OMG-ETH', 'ETC-USD', 'DASH-USD', 'BCH-BTC',
+    'NEO-USD', 'EDO-BTC', 'EDO-ETH', 'BTG-BTC', 'ZEC-BTC', 'XRP-BTC', 'XMR-BTC',
+    'OMG-BTC', 'ETP-USD', 'EDO-USD', 'NEO-ETH', 'BTG-USD', 'DATA-USD',
+    'ETP-BTC', 'AVT-ETH', 'SAN-ETH', 'EOS-ETH', 'DATA-ETH', 'DASH-BTC',
+    'XMR-USD', 'QTUM-ETH', 'EOS-BTC', 'ETP-ETH', 'SNT-BTC', 'SNT-ETH',
+    'ZEC-USD', 'NEO-BTC', 'EOS-USD', 'CTR-ETH', 'FYP-BTC', 'TRST-BTC',
+    'SWFTC-USD', 'HDG-ETH', 'DSH-BTC', 'VIB-USD', 'CPAY-ETH', 'AMM-ETH',
+    'XUC-ETH', 'ZRC-BTC', 'AMM-BTC', 'COSS-BTC', 'LA-ETH', 'XMR-ETH', 'UGT-USD',
+    'EBTCNEW-USD', 'VERI-ETH', 'AIR-USD', 'INDI-BTC', 'AMP-BTC', 'FUEL-USD',
+    'XEM-USD', 'WMGO-USD', 'CLD-BTC', 'ICX-ETH', 'PRS-BTC', 'RKC-ETH',
+    'MNE-BTC', 'EMCU-SDT', 'ART-BTC', 'RVT-BTC', 'HAC-BTC', 'DOV-ETH',
+    'CND-BTC', 'ICOS-BTC', 'PPT-BTC', 'SISA-ETH', 'EBTCNEW-ETH', 'SNC-USD',
+    'DENT-ETH', 'NEBL-ETH', 'BTM-ETH', 'XRP-ETH', 'ATB-BTC', 'XTZ-USD',
+    'BTX-USDT', 'ARN-ETH', 'DDF-ETH', 'SUB-USD', 'IGNIS-ETH', 'DICE-BTC',
+    'LUN-BTC', 'DIM-ETH', 'SWT-BTC', 'GNO-ETH', 'STRAT-USD', 'ADX-ETH',
+    'STX-BTC', 'SBD-BTC', 'BQX-ETH', 'PAY-ETH', 'PLU-ETH', 'XRP-USDT',
+    'VEN-ETH', 'EMC-BTC', 'PQT-USD', 'KICK-BTC', 'ETBS-BTC', 'ICX-USD',
+    'ENJ-ETH', 'ZRX-ETH', 'NXT-ETH', 'DRPU-ETH', 'MCAP-BTC', 'OAX-ETH',
+    'NTO-BTC', 'SPF-ETH', 'BQX-BTC', 'TKN-BTC', 'B2X-USD', 'DGB-ETH', 'HVN-ETH',
+    'B2X-ETH', 'B2X-BTC', 'EBTCOLD-ETH', 'CLD-USD', 'CTX-ETH', 'VERI-BTC',
+    'TRX-USD', 'HPC-BTC', 'LTC-ETH', 'BCC-BTC', 'TBT-BTC', 'SUB-BTC', 'ZAP-BTC',
+    'QAU-BTC', 'GVT-ETH', 'NDC-ETH', 'CND-ETH', 'XAUR-BTC', 'SMS-USD',
+    'ICN-BTC', 'FUN-ETH', 'DCT-BTC', 'TRX-ETH', 'PLU-BTC', 'PAY-BTC', 'AIR-ETH',
+    'LRC-ETH', 'VERI-USD', 'BMC-USD', 'SNC-BTC', 'FCN-BTC', 'EDG-BTC',
+    'SUB-ETH', 'PPC-BTC', 'UGT-BTC', 'BET-ETH', 'UTT-USD', 'MCO-USD', 'BTG-ETH',
+    'ATM-USD', 'HGT-ETH', 'CTR-BTC', 'LRC-BTC', 'STX-ETH', 'MCO-BTC', 'ZSC-ETH',
+    'KBR-BTC', 'TGT-BTC', 'DCN-USD', 'FYN-ETH', 'EBTCOLD-USD', '8BT-USD',
+    'DLT-BTC', 'OAX-USD', 'EXN-BTC', 'ITS-BTC', 'ORME-BTC', 'CSNO-BTC',
+    'UTT-BTC', 'SC-BTC', 'WRC-ETH', 'ATM-BTC', 'CCT-ETH', 'SMART-BTC',
+    'NXT-USD', 'ELM-BTC', 'FUN-BTC', 'BMC-BTC', 'DIM-USD', 'SMS-BTC',
+    'MIPS-BTC', 'REP-BTC', 'DCN-ETH', 'DRPU-BTC', 'FUEL-ETH', 'DOGE-ETH',
+    'EMGO-BTC', 'ECH-BTC', 'PING-BTC', 'AE-BTC', 'DICE-ETH', 'IXT-ETH',
+    'ICOS-ETH', 'IXT-BTC', 'ATM-ETH', 'AEON-BTC', 'MANA-ETH', 'PPC-USD',
+    'STORM-BTC', 'ATL-BTC', 'CAT-BTC', 'NXT-BTC', 'CNX-BTC', 'EBTCNEW-BTC',
+    'STU-USD', 'ODN-BTC', 'CTX-BTC', 'ZRX-BTC', 'BTM-BTC', 'BTCA-BTC',
+    'GNO-BTC', 'XUC-BTC', 'TNT-ETH', 'BMT-ETH', 'BUS-BTC', 'IND-ETH', 'SMS-ETH',
+    'MAID-USD', 'TNT-USD', 'DOGE-BTC', 'FRD-BTC', 'STRAT-ETH', 'OPT-BTC',
+    'NXC-BTC', 'ARDR-BTC', 'MSP-ETH', 'ZSC-USD', 'SISA-BTC', 'MTH-BTC',
+    'ZSC-BTC', 'DRT-ETH', 'QAU-ETH', 'SKIN-BTC', 'BCC-ETH', 'VEN-BTC',
+    'GUP-BTC', 'CAT-USD', 'NGC-USD', 'BCN-USD', 'SWT-ETH', 'XUC-USD',
+    'TIME-ETH', 'DOV-BTC', 'ATB-USD', 'CDT-BTC', 'BTX-BTC', 'STU-BTC',
+    'LOC-ETH', 'BTCA-USD', 'XDN-USD', 'CLD-ETH', 'AMB-BTC', 'EVX-USD',
+    'VIB-ETH', 'CL-ETH', 'WRC-BTC', 'EBTCOLD-BTC', 'ELE-BTC', 'VIBE-BTC',
+    'CAT-ETH', 'GAME-BTC', 'ATS-ETH', 'BNT-BTC', 'SNGLS-BTC', 'CND-USD',
+    'ZRX-USD', 'SCL-BTC', 'ETC-ETH', 'MANA-BTC', 'SWFTC-BTC', 'TAAS-BTC',
+    'SMART-ETH', 'WTT-BTC', 'PRE-BTC', 'SBTC-BTC', 'LIFE-BTC', 'CTR-USD',
+    'FUEL-BTC', 'WMGO-BTC', 'NEBL-BTC', 'PLR-ETH', 'STU-ETH', 'TRX-BTC',
+    'SUR-BTC', 'KMD-USD', 'MAID-ETH', 'ATB-ETH', 'ERO-BTC', 'CL-USD',
+    'DBIX-BTC', 'TKR-ETH', 'PIX-ETH', 'BMC-ETH', 'PPT-ETH', 'MCO-ETH',
+    'LSK-BTC', 'XAUR-ETH', 'UGT-ETH', 'LOC-BTC', 'STEE-MBTC', 'ICX-BTC',
+    'PLBT-BTC', 'XVG-USD', 'BCC-USD', 'CVC-USD', 'ANT-BTC', 'XVG-BTC',
+    'STAR-ETH', 'XDNCO-BTC', 'OTX-BTC', 'BNT-ETH', 'PTOY-BTC', '1ST-ETH',
+    'ICOS-USD', 'AMB-USD', 'PTOY-ETH', 'SNC-ETH', 'HVN-BTC', 'SNM-ETH',
+    'ATS-BTC', 'PRO-ETH', 'MRV-ETH', 'COSS-ETH', '1ST-BTC', 'EMGO-USD',
+    'CFI-ETH', 'FUN-USD', 'BOS-BTC', 'DGB-BTC', 'PRG-USD', 'BMT-BTC', 'DGD-BTC',
+    'DNT-BTC', 'NET-ETH', 'QCN-BTC', 'HSR-BTC', 'KMD-BTC', 'XTZ-ETH', 'AMB-ETH',
+    'TAAS-ETH', 'PRGETH', 'BNTUSD', 'ZECETH', 'EVX-BTC', 'TNT-BTC', 'DIM-BTC',
+    'AMM-USD', 'ENJ-BTC', 'DOGE-USD', 'BAS-ETH', 'OAX-BTC', 'ARN-BTC', 'AIRBTC',
+    'XTZ-BTC', 'BTCA-ETH', 'CDX-ETH', 'LOC-USD', 'MYB-ETH', 'XEM-ETH',
+    'NGC-BTC', 'STRAT-BTC', 'MANA-USD', 'MAID-BTC', 'SBTC-ETH', 'WRC-USD',
+    'CDT-ETH', 'EMC-ETH', 'CL-BTC', 'POLL-BTC', 'XDN-BTC', 'XVG-ETH', 'NGC-ETH',
+    'XDN-ETH', 'PLR-BTC', 'DASH-ETH', 'YOYOW-BTC', 'BCN-BTC', 'CRS-USD',
+    'UET-ETH', 'DGB-USD', 'KMD-ETH', 'UTT-ETH', 'BTM-USD', 'WINGS-BTC',
+    'EVX-ETH', 'WTC-BTC', 'SBTC-USDT', 'XEM-BTC', 'LEND-ETH', 'PRG-BTC',
+    'POE-ETH', 'CFI-BTC', 'VIB-BTC', 'RLC-BTC', 'BKB-BTC', 'ICO-BTC', 'SUR-ETH',
+    'ENJ-USD', 'LAT-BTC', 'VOISE-BTC', 'POE-BTC', 'QVT-ETH', 'LEND-BTC',
+    'PIX-BTC', 'BCN-ETH', 'CDT-USD', 'WAVES-BTC', 'TIME-BTC', 'SWFTC-ETH',
+    'OTN-BTC', 'TIX-ETH', 'ECAT-ETH', 'MTH-ETH', 'STX-USD', 'SMART-USD',
+    'EBET-ETH', 'VEN-USD'
+)
 
-hitbtc_trading_pairs = {
-    'BCNBTC',
-    'BTCUSD',
-    'DASHBTC',
-    'DOGEBTC',
-    'DOGEUSD',
-    'DSHBTC',
-    'EMCBTC',
-    'ETHBTC',
-    'FCNBTC',
-    'LSKBTC',
-    'LTCBTC',
-    'LTCUSD',
-    'NXTBTC',
-    'QCNBTC',
-    'SBDBTC',
-    'SCBTC',
-    'STEEMBTC',
-    'XDNBTC',
-    'XEMBTC',
-    'XMRBTC',
-    'ARDRBTC',
-    'ZECBTC',
-    'WAVESBTC',
-    'MAIDBTC',
-    'AMPBTC',
-    'BUSBTC',
-    'DGDBTC',
-    'ICNBTC',
-    'SNGLSBTC',
-    '1STBTC',
-    'TRSTBTC',
-    'TIMEBTC',
-    'GNOBTC',
-    'REPBTC',
-    'XMRUSD',
-    'DASHUSD',
-    'ETHUSD',
-    'NXTUSD',
-    'ZRCBTC',
-    'BOSBTC',
-    'DCTBTC',
-    'ANTBTC',
-    'AEONBTC',
-    'GUPBTC',
-    'PLUBTC',
-    'LUNBTC',
-    'TAASBTC',
-    'NXCBTC',
-    'EDGBTC',
-    'RLCBTC',
-    'SWTBTC',
-    'TKNBTC',
-    'WINGSBTC',
-    'XAURBTC',
-    'AEBTC',
-    'PTOYBTC',
-    'WTTBTC',
-    'ZECUSD',
-    'XEMUSD',
-    'BCNUSD',
-    'XDNUSD',
-    'MAIDUSD',
-    'ETCBTC',
-    'ETCUSD',
-    'CFIBTC',
-    'PLBTBTC',
-    'BNTBTC',
-    'XDNCOBTC',
-    'FYNETH',
-    'SNMETH',
-    'SNTETH',
-    'CVCUSD',
-    'PAYETH',
-    'OAXETH',
-    'OMGETH',
-    'BQXETH',
-    'XTZBTC',
-    'CRSUSD',
-    'DICEBTC',
-    'CFIETH',
-    'PTOYETH',
-    '1STETH',
-    'XAURETH',
-    'TAASETH',
-    'TIMEETH',
-    'DICEETH',
-    'SWTETH',
-    'XMRETH',
-    'ETCETH',
-    'DASHETH',
-    'ZECETH',
-    'PLUETH',
-    'GNOETH',
-    'XRPBTC',
-    'NETETH',
-    'STRATUSD',
-    'STRATBTC',
-    'SNCETH',
-    'ADXETH',
-    'BETETH',
-    'EOSETH',
-    'DENTETH',
-    'SANETH',
-    'EOSBTC',
-    'EOSUSD',
-    'MNEBTC',
-    'MRVETH',
-    'MSPETH',
-    'DDFETH',
-    'XTZETH',
-    'XTZUSD',
-    'UETETH',
-    'MYBETH',
-    'SURETH',
-    'IXTETH',
-    'PLRETH',
-    'TIXETH',
-    'NDCETH',
-    'PROETH',
-    'AVTETH',
-    'COSSETH',
-    'PQTUSD',
-    '8BTUSD',
-    'EVXUSD',
-    'DLTBTC',
-    'BNTETH',
-    'BNTUSD',
-    'QAUBTC',
-    'QAUETH',
-    'MANAUSD',
-    'DNTBTC',
-    'FYPBTC',
-    'OPTBTC',
-    'TNTETH',
-    'STXBTC',
-    'STXETH',
-    'STXUSD',
-    'TNTUSD',
-    'TNTBTC',
-    'CATBTC',
-    'CATETH',
-    'CATUSD',
-    'BCHBTC',
-    'BCHETH',
-    'BCHUSD',
-    'ECATETH',
-    'XUCUSD',
-    'SNCBTC',
-    'SNCUSD',
-    'OAXUSD',
-    'OAXBTC',
-    'BASETH',
-    'ZRXBTC',
-    'ZRXETH',
-    'ZRXUSD',
-    'RVTBTC',
-    'ICOSBTC',
-    'ICOSETH',
-    'ICOSUSD',
-    'PPCBTC',
-    'PPCUSD',
-    'QTUMETH',
-    'VERIBTC',
-    'VERIETH',
-    'VERIUSD',
-    'IGNISETH',
-    'PRGBTC',
-    'PRGETH',
-    'PRGUSD',
-    'BMCBTC',
-    'BMCETH',
-    'BMCUSD',
-    'CNDBTC',
-    'CNDETH',
-    'CNDUSD',
-    'SKINBTC',
-    'EMGOBTC',
-    'EMGOUSD',
-    'CDTETH',
-    'CDTUSD',
-    'FUNBTC',
-    'FUNETH',
-    'FUNUSD',
-    'HVNBTC',
-    'HVNETH',
-    'FUELBTC',
-    'FUELETH',
-    'FUELUSD',
-    'POEBTC',
-    'POEETH',
-    'MCAPBTC',
-    'AIRBTC',
-    'AIRETH',
-    'AIRUSD',
-    'AMBUSD',
-    'AMBETH',
-    'AMBBTC',
-    'NTOBTC',
-    'ICOBTC',
-    'PINGBTC',
-    'RKCETH',
-    'GAMEBTC',
-    'TKRETH',
-    'HPCBTC',
-    'PPTETH',
-    'MTHBTC',
-    'MTHETH',
-    'WMGOBTC',
-    'WMGOUSD',
-    'LRCBTC',
-    'LRCETH',
-    'ICXBTC',
-    'ICXETH',
-    'NEOBTC',
-    'NEOETH',
-    'NEOUSD',
-    'CSNOBTC',
-    'ORMEBTC',
-    'ICXUSD',
-    'PIXBTC',
-    'PIXETH',
-    'INDETH',
-    'KICKBTC',
-    'YOYOWBTC',
-    'MIPSBTC',
-    'CDTBTC',
-    'XVGBTC',
-    'XVGETH',
-    'XVGUSD',
-    'DGBBTC',
-    'DGBETH',
-    'DGBUSD',
-    'DCNETH',
-    'DCNUSD',
-    'LATBTC',
-    'CCTETH',
-    'EBETETH',
-    'VIBEBTC',
-    'VOISEBTC',
-    'ENJBTC',
-    'ENJETH',
-    'ENJUSD',
-    'ZSCBTC',
-    'ZSCETH',
-    'ZSCUSD',
-    'ETBSBTC',
-    'TRXBTC',
-    'TRXETH',
-    'TRXUSD',
-    'VENBTC',
-    'VENETH',
-    'VENUSD',
-    'ARTBTC',
-    'EVXBTC',
-    'EVXETH',
-    'QVTETH',
-    'EBTCOLDBTC',
-    'EBTCOLDETH',
-    'EBTCOLDUSD',
-    'BKBBTC',
-    'EXNBTC',
-    'TGTBTC',
-    'ATSETH',
-    'UGTBTC',
-    'UGTETH',
-    'UGTUSD',
-    'CTRBTC',
-    'CTRETH',
-    'CTRUSD',
-    'BMTBTC',
-    'BMTETH',
-    'SUBBTC',
-    'SUBETH',
-    'SUBUSD',
-    'WTCBTC',
-    'CNXBTC',
-    'ATBBTC',
-    'ATBETH',
-    'ATBUSD',
-    'ODNBTC',
-    'BTMBTC',
-    'BTMETH',
-    'BTMUSD',
-    'B2XBTC',
-    'B2XETH',
-    'B2XUSD',
-    'ATMBTC',
-    'ATMETH',
-    'ATMUSD',
-    'LIFEBTC',
-    'VIBBTC',
-    'VIBETH',
-    'VIBUSD',
-    'DRTETH',
-    'STUUSD',
-    'HDGETH',
-    'OMGBTC',
-    'PAYBTC',
-    'COSSBTC',
-    'PPTBTC',
-    'SNTBTC',
-    'BTGBTC',
-    'BTGETH',
-    'BTGUSD',
-    'SMARTBTC',
-    'SMARTETH',
-    'SMARTUSD',
-    'XUCETH',
-    'XUCBTC',
-    'CLBTC',
-    'CLETH',
-    'CLUSD',
-    'LAETH',
-    'CLDBTC',
-    'CLDETH',
-    'CLDUSD',
-    'ELMBTC',
-    'EDOBTC',
-    'EDOETH',
-    'EDOUSD',
-    'HGTETH',
-    'POLLBTC',
-    'IXTBTC',
-    'PREBTC',
-    'ATSBTC',
-    'SCLBTC',
-    'BCCBTC',
-    'BCCETH',
-    'BCCUSD',
-    'ATLBTC',
-    'EBTCNEWBTC',
-    'EBTCNEWETH',
-    'EBTCNEWUSD',
-    'ETPBTC',
-    'ETPETH',
-    'ETPUSD',
-    'OTXBTC',
-    'CDXETH',
-    'DRPUBTC',
-    'NEBLBTC',
-    'NEBLETH',
-    'HACBTC',
-    'CTXBTC',
-    'CTXETH',
-    'ELEBTC',
-    'ARNBTC',
-    'ARNETH',
-    'SISABTC',
-    'SISAETH',
-    'STUBTC',
-    'STUETH',
-    'GVTETH',
-    'INDIBTC',
-    'BTXBTC',
-    'BTXUSDT',
-    'LTCETH',
-    'BCNETH',
-    'MAIDETH',
-    'NXTETH',
-    'STRATETH',
-    'XDNETH',
-    'XEMETH',
-    'PLRBTC',
-    'SURBTC',
-    'BQXBTC',
-    'DOGEETH',
-    'ITSBTC',
-    'AMMBTC',
-    'AMMETH',
-    'AMMUSD',
-    'DBIXBTC',
-    'PRSBTC',
-    'KBRBTC',
-    'TBTBTC',
-    'EROBTC',
-    'SMSBTC',
-    'SMSETH',
-    'SMSUSD',
-    'ZAPBTC',
-    'DOVBTC',
-    'DOVETH',
-    'FRDBTC',
-    'DRPUETH',
-    'OTNBTC',
-    'XRPETH',
-    'XRPUSDT',
-    'HSRBTC',
-    'LENDBTC',
-    'LENDETH',
-    'SPFETH',
-    'SBTCBTC',
-    'SBTCETH',
-    'BTCABTC',
-    'BTCAETH',
-    'BTCAUSD',
-    'WRCBTC',
-    'WRCETH',
-    'WRCUSD',
-    'LOCBTC',
-    'LOCETH',
-    'LOCUSD',
-    'SWFTCBTC',
-    'SWFTCETH',
-    'SWFTCUSD',
-    'STARETH',
-    'SBTCUSDT',
-    'STORMBTC',
-    'DIMETH',
-    'DIMUSD',
-    'DIMBTC',
-    'NGCBTC',
-    'NGCETH',
-    'NGCUSD',
-    'EMCETH',
-    'EMCUSDT',
-    'MANAETH',
-    'MANABTC',
-    'CPAYETH',
-    'MCOBTC',
-    'MCOUSD',
-    'MCOETH',
-    'ECHBTC',
-    'DATABTC',
-    'DATAETH',
-    'DATAUSD',
-    'UTTBTC',
-    'UTTETH',
-    'UTTUSD',
-    'KMDBTC',
-    'KMDETH',
-    'KMDUSD',
-}
+
+def exchange_symbol(pair: str) -> str:
+    # BTC-USD -> BTCUSD
+    return pair.replace('-', '')
+
+
+hitbtc_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
@@ -0,0 +1,121 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import zlib
+
+from cryptofeed.defines import BID, ASK
+
+
+"""
+Order book integrity checks
+
+Books are in the layout described in defines.py, with BID and ASK
+as SortedDicts of price -> size.
+"""
+
+
+def crossed(book) -> bool:
+    """
+    True if the best bid is at or through the best ask (crossed or locked)
+    """
+    bids = book[BID]
+    asks = book[ASK]
+    if not bids or not asks:
+        return False
+    return bids.peekitem(-1)[0] >= asks.peekitem(0)[0]
+
+
+def _top(book_side, depth, descending):
+    prices = reversed(book_side) if descending else iter(book_side)
+    ret = []
+    for price in prices:
+        if len(ret) == depth:
+            break
+        ret.append((price, book_side[price]))
+    return ret
+
+
+def diff(book, snapshot, depth=25) -> dict:
+    """
+    compare the top depth levels of a maintained book against a snapshot
+
+    Levels are only compared where both books have depth coverage, so a
+    single differing level does not also report the level that falls off
+    the end of one side.
+
+    returns {(side, price): (our size, snapshot size)} for levels that differ,
+    None for a size means the level is missing from that book
+    """
+    ret = {}
+    for side in (BID, ASK):
+        descending = side == BID
+        # a depth limited book can only be compared over its window
+        side_depth = min(depth, getattr(book[side], 'depth', depth))
+        ours = _top(book[side], side_depth, descending)
+        theirs = _top(snapshot[side], side_depth, descending)
+
+        # the worst price both books have full coverage for
+        limit = None
+        if len(ours) == side_depth and len(theirs) == side_depth:
+            limit = min(ours[-1][0], theirs[-1][0]) if descending else max(ours[-1][0], theirs[-1][0])
+        elif len(ours) == side_depth:
+            limit = ours[-1][0]
+        elif len(theirs) == side_depth:
+            limit = theirs[-1][0]
+
+        ours = dict(ours)
+        theirs = dict(theirs)
+        for price in ours.keys() | theirs.keys():
+            if limit is not None and (price < limit if descending else price > limit):
+                continue
+            if ours.get(price) != theirs.get(price):
+                ret[(side, price)] = (ours.get(price), theirs.get(price))
+    return ret
+
+
+def _js_number(value) -> str:
+    """
+    format a Decimal the way javascript's Number.toString does, e.g. 2.5
+    and 1e-8 rather than Decimal's 2.50 and 1E-8
+    """
+    if not value:
+        return '0'
+    sign, digits, exponent = value.normalize().as_tuple()
+    digits = ''.join(map(str, digits))
+    sign = '-' if sign else ''
+    # value is 0.digits * 10 ** n
+    n = len(digits) + exponent
+    if len(digits) <= n <= 21:
+        return sign + digits + '0' * (n - len(digits))
+    if 0 < n <= 21:
+        return sign + digits[:n] + '.' + digits[n:]
+    if -6 < n <= 0:
+        return sign + '0.' + '0' * -n + digits
+    mantissa = digits[0] + ('.' + digits[1:] if len(digits) > 1 else '')
+    return '{}{}e{}{}'.format(sign, mantissa, '+' if n > 0 else '-', abs(n - 1))
+
+
+def bitfinex_checksum(book, depth=25) -> int:
+    """
+    Bitfinex book checksum: signed CRC32 of the top 25 bids and asks
+    interleaved as bid price:bid amount:ask price:-ask amount:...
+
+    Sizes in the book are absolute, Bitfinex uses negative amounts for asks.
+    Numbers are formatted as the javascript client formats them
+    """
+    bids = _top(book[BID], depth, True)
+    asks = _top(book[ASK], depth, False)
+    parts = []
+    for i in range(depth):
+        if i < len(bids):
+            parts.append(_js_number(bids[i][0]))
+            parts.append(_js_number(bids[i][1]))
+        if i < len(asks):
+            parts.append(_js_number(asks[i][0]))
+            parts.append(_js_number(-asks[i][1]))
+    checksum = zlib.crc32(':'.join(parts).encode())
+    # bitfinex sends the checksum as a signed 32 bit int
+    return checksum - (1 << 32) if checksum & (1 << 31) else checksum
@@ -0,0 +1,179 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+
+import requests
+
+from cryptofeed.exchanges import BITMEX, HITBTC
+from cryptofeed.standards import register_pair
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Instrument metadata cache
+
+Instrument metadata is fetched from the exchange REST endpoints once and stored
+on disk so feeds can start without touching the network. Layout of the cache file:
+
+{
+    'version': CACHE_VERSION,
+    'exchanges': {
+        exchange: {
+            'timestamp': time of fetch (seconds since epoch),
+            'instruments': {
+                symbol: {
+                    'pair': standardized pair or None,
+                    'tick_size': str,
+                    'lot_size': str,
+                    'status': str
+                },
+                ...
+            }
+        },
+        ...
+    }
+}
+
+Sizes are stored as strings and returned as decimal.Decimal. The cache is ignored
+if its version does not match CACHE_VERSION.
+"""
+CACHE_VERSION = 1
+DEFAULT_CACHE = os.environ.get('CRYPTOFEED_SYMBOL_CACHE',
+                               os.path.join(os.path.expanduser('~'), '.cryptofeed', 'symbols.json'))
+
+
+def _get(url):
+    return json.loads(requests.get(url).text, parse_float=Decimal)
+
+
+def _bitmex_instruments():
+    ret = {}
+    for data in _get('https://www.bitmex.com/api/v1/instrument/active'):
+        ret[data['symbol']] = {'pair': None,
+                               'tick_size': str(data['tickSize']),
+                               'lot_size': str(data['lotSize']),
+                               'status': data['state']}
+    return ret
+
+
+def _hitbtc_instruments():
+    ret = {}
+    for data in _get('https://api.hitbtc.com/api/2/public/symbol'):
+        # the symbol endpoint only lists tradable instruments
+        ret[data['id']] = {'pair': '{}-{}'.format(data['baseCurrency'], data['quoteCurrency']),
+                           'tick_size': str(data['tickSize']),
+                           'lot_size': str(data['quantityIncrement']),
+                           'status': 'Open'}
+    return ret
+
+
+_fetchers = {
+    BITMEX: _bitmex_instruments,
+    HITBTC: _hitbtc_instruments
+}
+
+
+def fetch(exchange):
+    """
+    fetch instrument metadata from the exchange, in cache format
+    """
+    if exchange not in _fetchers:
+        raise ValueError("Instrument metadata is not supported on {}".format(exchange))
+    return {'timestamp': time.time(), 'instruments': _fetchers[exchange]()}
+
+
+def load(path=None):
+    path = path or DEFAULT_CACHE
+    try:
+        with open(path) as fp:
+            cache = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        LOG.warning("Symbol cache %s is corrupt - ignoring", path)
+        return {}
+
+    if cache.get('version') != CACHE_VERSION:
+        LOG.warning("Symbol cache %s has version %s, expected %s - ignoring", path, cache.get('version'), CACHE_VERSION)
+        return {}
+    return cache['exchanges']
+
+
+def save(exchanges, path=None):
+    path = path or DEFAULT_CACHE
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # write to a temporary file and rename so readers never see a partial cache
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'w') as fp:
+        json.dump({'version': CACHE_VERSION, 'exchanges': exchanges}, fp)
+    os.replace(tmp, path)
+
+
+def update(exchanges, path=None):
+    """
+    fetch metadata for the given exchanges and merge it into the cache
+    """
+    cache = load(path)
+    for exchange in exchanges:
+        cache[exchange] = fetch(exchange)
+    save(cache, path)
+    return cache
+
+
+def instruments(exchange, path=None, max_age=None, allow_fetch=True):
+    """
+    instrument metadata for exchange, read from the on disk cache
+
+    exchange: exchange id
+    path: cache location, defaults to DEFAULT_CACHE
+    max_age: seconds after which a cached entry is considered stale and refetched
+    allow_fetch: if False never hit the network, return {} when there is no cache entry
+
+    returns {symbol: {'pair': str, 'tick_size': Decimal, 'lot_size': Decimal, 'status': str}}
+    and registers any standardized pairs with cryptofeed.standards
+    """
+    entry = load(path).get(exchange)
+    stale = entry is None or (max_age is not None and time.time() - entry['timestamp'] > max_age)
+    if stale and allow_fetch:
+        entry = update([exchange], path)[exchange]
+    if entry is None:
+        return {}
+    return _decode(exchange, entry)
+
+
+async def refresh(exchange, path=None):
+    """
+    refetch exchange metadata in the executor and rewrite the cache
+    """
+    loop = asyncio.get_event_loop()
+    try:
+        cache = await loop.run_in_executor(None, update, [exchange], path)
+    except Exception as e:
+        LOG.warning("%s - unable to refresh instrument metadata: %s", exchange, str(e))
+        return None
+    return _decode(exchange, cache[exchange])
+
+
+def _decode(exchange, entry):
+    ret = {}
+    for symbol, data in entry['instruments'].items():
+        if data['pair']:
+            register_pair(data['pair'], symbol, exchange)
+        ret[symbol] = {'pair': data['pair'],
+                       'tick_size': Decimal(data['tick_size']),
+                       'lot_size': Decimal(data['lot_size']),
+                       'status': data['status']}
+    return ret
@@ -0,0 +1,198 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+from cryptofeed.defines import BID, ASK
+
+
+class Order:
+    """
+    A resting order. Slotted, so a record costs a fraction of the
+    {'price': ..., 'size': ...} dicts it replaces.
+
+    prev/next link the orders at a price level in arrival order
+    when the store tracks queue position.
+    """
+    __slots__ = ('side', 'price', 'size', 'prev', 'next')
+
+    def __init__(self, side, price, size):
+        self.side = side
+        self.price = price
+        self.size = size
+        self.prev = None
+        self.next = None
+
+    def __repr__(self):
+        return 'Order({!r}, {!r}, {!r})'.format(self.side, self.price, self.size)
+
+
+class Level:
+    """
+    The orders resting at one price, oldest first
+    """
+    __slots__ = ('head', 'tail')
+
+    def __init__(self):
+        self.head = None
+        self.tail = None
+
+    def __iter__(self):
+        order = self.head
+        while order is not None:
+            yield order
+            order = order.next
+
+
+class OrderStore:
+    """
+    Resting orders for L3 books, partitioned per pair:
+
+    {
+        pair: {
+            order_id: Order,
+            ...
+        },
+        ...
+    }
+
+    A pair's partition is replaced wholesale when its book is rebuilt
+    from a snapshot, so stale orders never accumulate.
+
+    With track_queue set, the orders at each price level are also kept in
+    arrival order (an intrusive doubly linked list through the Order records)
+    so insert and remove stay O(1) and queue_position can report what is
+    ahead of a given order:
+
+    {
+        pair: {
+            BID: {price: Level, ...},
+            ASK: {price: Level, ...}
+        },
+        ...
+    }
+    """
+    def __init__(self, track_queue=False):
+        self.pairs = {}
+        self.track_queue = track_queue
+        self.levels = {}
+
+    def __getitem__(self, pair):
+        return self.pairs[pair]
+
+    def __len__(self):
+        return sum(len(orders) for orders in self.pairs.values())
+
+    def reset(self, pair):
+        """
+        drop all orders for pair, returns the new (empty) partition
+        """
+        orders = self.pairs[pair] = {}
+        if self.track_queue:
+            self.levels[pair] = {BID: {}, ASK: {}}
+        return orders
+
+    def remove(self, pair):
+        """
+        forget pair entirely (e.g. when it is unsubscribed)
+        """
+        self.pairs.pop(pair, None)
+        self.levels.pop(pair, None)
+
+    def clear(self):
+        self.pairs = {}
+        self.levels = {}
+
+    def add(self, pair, order_id, side, price, size):
+        """
+        add an order to the back of the queue at its price
+        """
+        try:
+            orders = self.pairs[pair]
+        except KeyError:
+            orders = self.reset(pair)
+        order = Order(side, price, size)
+        if self.track_queue:
+            previous = orders.get(order_id)
+            if previous is not None:
+                self._unlink(pair, previous)
+            self._append(pair, order)
+        orders[order_id] = order
+        return order
+
+    def get(self, pair, order_id):
+        try:
+            return self.pairs[pair].get(order_id)
+        except KeyError:
+            return None
+
+    def pop(self, pair, order_id):
+        try:
+            order = self.pairs[pair].pop(order_id, None)
+        except KeyError:
+            return None
+        if order is not None and self.track_queue:
+            self._unlink(pair, order)
+        return order
+
+    def level(self, pair, side, price):
+        """
+        orders at a price level in arrival order, None if the level is empty
+        """
+        return self._levels(pair)[side].get(price)
+
+    def queue_position(self, pair, order_id):
+        """
+        returns (number of orders, total size) ahead of order_id at its
+        price level, or None if the order is not on the book
+        """
+        if not self.track_queue:
+            raise ValueError("Queue position requires an OrderStore created with track_queue=True")
+        order = self.get(pair, order_id)
+        if order is None:
+            return None
+        count = 0
+        size = 0
+        ahead = order.prev
+        while ahead is not None:
+            count += 1
+            size += ahead.size
+            ahead = ahead.prev
+        return count, size
+
+    def _levels(self, pair):
+        try:
+            return self.levels[pair]
+        except KeyError:
+            if not self.track_queue:
+                raise ValueError("Price levels require an OrderStore created with track_queue=True")
+            levels = self.levels[pair] = {BID: {}, ASK: {}}
+            return levels
+
+    def _append(self, pair, order):
+        side = self._levels(pair)[order.side]
+        level = side.get(order.price)
+        if level is None:
+            level = side[order.price] = Level()
+        if level.tail is None:
+            level.head = order
+        else:
+            level.tail.next = order
+            order.prev = level.tail
+        level.tail = order
+
+    def _unlink(self, pair, order):
+        side = self.levels[pair][order.side]
+        level = side[order.price]
+        if order.prev is None:
+            level.head = order.next
+        else:
+            order.prev.next = order.next
+        if order.next is None:
+            level.tail = order.prev
+        else:
+            order.next.prev = order.prev
+        order.prev = order.next = None
+        if level.head is None:
+            del side[order.price]
@@ -208,22 +208,31 @@ poloniex_pair_id_mapping = {
     'BTC_STORJ': 200,
 }
 
-poloniex_trading_pairs = {
-    'BTC_BCN', 'BTC_BELA', 'BTC_BLK', 'BTC_BTCD', 'BTC_BTM', 'BTC_BTS',
-    'BTC_BURST', 'BTC_CLAM', 'BTC_DASH', 'BTC_DGB', 'BTC_DOGE', 'BTC_EMC2',
-    'BTC_FLDC', 'BTC_FLO', 'BTC_GAME', 'BTC_GRC', 'BTC_HUC', 'BTC_LTC',
-    'BTC_MAID', 'BTC_OMNI', 'BTC_NAV', 'BTC_NEOS', 'BTC_NMC', 'BTC_NXT',
-    'BTC_PINK', 'BTC_POT', 'BTC_PPC', 'BTC_RIC', 'BTC_STR', 'BTC_SYS',
-    'BTC_VIA', 'BTC_XVC', 'BTC_VRC', 'BTC_VTC', 'BTC_XBC', 'BTC_XCP',
-    'BTC_XEM', 'BTC_XMR', 'BTC_XPM', 'BTC_XRP', 'USDT_BTC', 'USDT_DASH',
-    'USDT_LTC', 'USDT_NXT', 'USDT_STR', 'USDT_XMR', 'USDT_XRP', 'XMR_BCN',
-    'XMR_BLK', 'XMR_BTCD', 'XMR_DASH', 'XMR_LTC', 'XMR_MAID', 'XMR_NXT',
-    'BTC_ETH', 'USDT_ETH', 'BTC_SC', 'BTC_BCY', 'BTC_EXP', 'BTC_FCT',
-    'BTC_RADS', 'BTC_AMP', 'BTC_DCR', 'BTC_LSK', 'ETH_LSK', 'BTC_LBC',
-    'BTC_STEEM', 'ETH_STEEM', 'BTC_SBD', 'BTC_ETC', 'ETH_ETC', 'USDT_ETC',
-    'BTC_REP', 'USDT_REP', 'ETH_REP', 'BTC_ARDR', 'BTC_ZEC', 'ETH_ZEC',
-    'USDT_ZEC', 'XMR_ZEC', 'BTC_STRAT', 'BTC_NXC', 'BTC_PASC', 'BTC_GNT',
-    'ETH_GNT', 'BTC_GNO', 'ETH_GNO', 'BTC_BCH', 'ETH_BCH', 'USDT_BCH',
-    'BTC_ZRX', 'ETH_ZRX', 'BTC_CVC', 'ETH_CVC', 'BTC_OMG', 'ETH_OMG',
-    'BTC_GAS', 'ETH_GAS', 'BTC_STORJ'
-}
+# standardized pairs listed on Poloniex, see cryptofeed.standards
+standard_pairs = (
+    'BTC-BCN', 'BTC-BELA', 'BTC-BLK', 'BTC-BTCD', 'BTC-BTM', 'BTC-BTS',
+    'BTC-BURST', 'BTC-CLAM', 'BTC-DASH', 'BTC-DGB', 'BTC-DOGE', 'BTC-EMC2',
+    'BTC-FLDC', 'BTC-FLO', 'BTC-GAME', 'BTC-GRC', 'BTC-HUC', 'BTC-LTC',
+    'BTC-MAID', 'BTC-OMNI', 'BTC-NAV', 'BTC-NEOS', 'BTC-NMC', 'BTC-NXT',
+    'BTC-PINK', 'BTC-POT', 'BTC-PPC', 'BTC-RIC', 'BTC-STR', 'BTC-SYS',
+    'BTC-VIA', 'BTC-XVC', 'BTC-VRC', 'BTC-VTC', 'BTC-XBC', 'BTC-XCP', 'BTC-XEM',
+    'BTC-XMR', 'BTC-XPM', 'BTC-XRP', 'USDT-BTC', 'USDT-DASH', 'USDT-LTC',
+    'USDT-NXT', 'USDT-STR', 'USDT-XMR', 'USDT-XRP', 'XMR-BCN', 'XMR-BLK',
+    'XMR-BTCD', 'XMR-DASH', 'XMR-LTC', 'XMR-MAID', 'XMR-NXT', 'BTC-ETH',
+    'USDT-ETH', 'BTC-SC', 'BTC-BCY', 'BTC-EXP', 'BTC-FCT', 'BTC-RADS',
+    'BTC-AMP', 'BTC-DCR', 'BTC-LSK', 'ETH-LSK', 'BTC-LBC', 'BTC-STEEM',
+    'ETH-STEEM', 'BTC-SBD', 'BTC-ETC', 'ETH-ETC', 'USDT-ETC', 'BTC-REP',
+    'USDT-REP', 'ETH-REP', 'BTC-ARDR', 'BTC-ZEC', 'ETH-ZEC', 'USDT-ZEC',
+    'XMR-ZEC', 'BTC-STRAT', 'BTC-NXC', 'BTC-PASC', 'BTC-GNT', 'ETH-GNT',
+    'BTC-GNO', 'ETH-GNO', 'BTC-BCH', 'ETH-BCH', 'USDT-BCH', 'BTC-ZRX',
+    'ETH-ZRX', 'BTC-CVC', 'ETH-CVC', 'BTC-OMG', 'ETH-OMG', 'BTC-GAS', 'ETH-GAS',
+    'BTC-STORJ'
+)
+
+
+def exchange_symbol(pair: str) -> str:
+    # USDT-BTC -> USDT_BTC
+    return pair.replace('-', '_')
+
+
+poloniex_trading_pairs = {exchange_symbol(pair) for pair in standard_pairs}
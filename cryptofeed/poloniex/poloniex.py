@@ -8,7 +8,6 @@ import json
 import logging
 from decimal import Decimal
 
-from sortedcontainers import SortedDict as sd
 
 from cryptofeed.feed import Feed
 from cryptofeed.defines import BID, ASK, TRADES, TICKER, L3_BOOK, L3_BOOK_UPDATE, VOLUME
@@ -22,21 +21,28 @@ LOG = logging.getLogger('feedhandler')
 
 class Poloniex(Feed):
     id = POLONIEX
+    # heartbeats: [1010]
+    ignore_prefixes = ('[1010]',)
 
-    def __init__(self, pairs=None, channels=None, callbacks=None):
+    def __init__(self, pairs=None, channels=None, callbacks=None, **kwargs):
         if pairs:
             LOG.error("Poloniex does not support pairs")
             raise ValueError("Poloniex does not support pairs")
 
         super().__init__('wss://api2.poloniex.com',
                          channels=channels,
-                         callbacks=callbacks)
+                         callbacks=callbacks,
+                         **kwargs)
+        # channel id -> handler, None for channels that are ignored
+        self.dispatch = {}
+        # pair id -> standard pair
+        self.std_pairs = {}
 
     async def _ticker(self, msg):
         # currencyPair, last, lowestAsk, highestBid, percentChange, baseVolume,
         # quoteVolume, isFrozen, 24hrHigh, 24hrLow
         pair_id, _, ask, bid, _, _, _, _, _, _ = msg
-        pair = pair_exchange_to_std(poloniex_id_pair_mapping[pair_id])
+        pair = self.std_pairs[pair_id]
         await self.callbacks[TICKER](feed=self.id,
                                      pair=pair,
                                      bid=Decimal(bid),
@@ -56,8 +62,8 @@ class Poloniex(Feed):
         # initial update (i.e. snapshot)
         if msg_type == 'i':
             pair = msg[0][1]['currencyPair']
-            pair = pair_exchange_to_std(pair)
-            self.l3_book[pair] = {BID: sd(), ASK: sd()}
+            pair = pair_exchange_to_std(pair, self.id)
+            self.l3_book[pair] = self._new_book(pair, l3=True)
             # 0 is asks, 1 is bids
             order_book = msg[0][1]['orderBook']
             for key in order_book[0]:
@@ -70,8 +76,7 @@ class Poloniex(Feed):
                 price = Decimal(key)
                 self.l3_book[pair][BID][price] = amount
         else:
-            pair = poloniex_id_pair_mapping[chan_id]
-            pair = pair_exchange_to_std(pair)
+            pair = self.std_pairs[chan_id]
             for update in msg:
                 timestamp = None
                 msg_type = update[0]
@@ -88,7 +93,7 @@ class Poloniex(Feed):
                 elif msg_type == 't':
                     # index 1 is trade id, 2 is side, 3 is price, 4 is amount, 5 is timestamp
                     mtype = 'trade'
-                    timestamp = self.tz_aware_datetime_from_string(update[5])
+                    timestamp = self.timestamp(update[5])
                     price = Decimal(update[3])
                     side = ASK if update[2] == 0 else BID
                     amount = Decimal(update[4])
@@ -116,39 +121,56 @@ class Poloniex(Feed):
                                       timestamp=None,
                                       pair=pair,
                                       book=self.l3_book[pair])
+        await self._l2_view_callback(pair)
+
+    async def _ticker_channel(self, msg):
+        # the ticker channel doesn't have sequence ids
+        # so it should be None, except for the subscription
+        # ack, in which case its 1
+        if msg[1] is None:
+            await self._ticker(msg[2])
+
+    async def _volume_channel(self, msg):
+        # volume update channel is just like ticker - the
+        # sequence id is None except for the initial ack
+        if msg[1] is None:
+            await self._volume(msg[2])
+
+    async def _book_channel(self, msg):
+        # order book updates - the channel id refers to
+        # the trading pair being updated
+        await self._book(msg[2], msg[0], msg[1])
 
     async def message_handler(self, msg):
+        if self.ignored(msg):
+            return
         msg = json.loads(msg, parse_float=Decimal)
         if 'error' in msg:
             LOG.error("{} - Error from exchange: {}".format(self.id, msg))
             return
 
         chan_id = msg[0]
-        sequence = msg[1]
-        if chan_id == 1002:
-            # the ticker channel doesn't have sequence ids
-            # so it should be None, except for the subscription
-            # ack, in which case its 1
-            seq_id = msg[1]
-            if seq_id is None:
-                await self._ticker(msg[2])
-        elif chan_id == 1003:
-            # volume update channel is just like ticker - the
-            # sequence id is None except for the initial ack
-            seq_id = msg[1]
-            if seq_id is None:
-                await self._volume(msg[2])
-        elif chan_id <= 200:
-            # order book updates - the channel id refers to
-            # the trading pair being updated
-            await self._book(msg[2], chan_id, sequence)
-        elif chan_id == 1010:
-            # heartbeat - ignore
-            pass
-        else:
+        try:
+            handler = self.dispatch[chan_id]
+        except KeyError:
             LOG.warning('{} - Invalid message type {}'.format(self.id, msg))
+            return
+        if handler is not None:
+            await handler(msg)
 
     async def subscribe(self, websocket):
+        self.std_pairs = {pair_id: pair_exchange_to_std(pair, self.id)
+                          for pair_id, pair in poloniex_id_pair_mapping.items()}
+        self.dispatch = {
+            1002: self._ticker_channel,
+            1003: self._volume_channel,
+            # heartbeat - ignore
+            1010: None
+        }
+        # order book channel ids are the pair ids
+        for pair_id in poloniex_id_pair_mapping:
+            self.dispatch[pair_id] = self._book_channel
+
         for channel in self.channels:
             await websocket.send(json.dumps({"command": "subscribe",
                                              "channel": channel
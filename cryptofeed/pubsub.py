@@ -0,0 +1,313 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+import logging
+import struct
+
+from sortedcontainers import SortedDict as sd
+
+from cryptofeed import timestamps
+from cryptofeed.book import top_levels, level_changes
+from cryptofeed.defines import BID, ASK, TRADES, TICKER, L2_BOOK, L3_BOOK, VOLUME
+from cryptofeed.wire import DEFINE, RECORD, Encoder, Decoder
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Local fan-out of normalized events
+
+EventPublisher serves events to subscribers over a Unix domain socket or TCP.
+Frames are
+
+    length (uint32, little endian, of what follows), topic length (uint8), topic, payload
+
+Topics are channel.feed.pair (e.g. trades.GDAX.BTC-USD, volume.POLONIEX).
+A subscriber's first frame has the topic 'subscribe' and a JSON list of topic
+prefixes as the payload, an empty list subscribes to everything.
+
+Event payloads are the receipt, when the event's frame arrived (int64
+nanoseconds since the epoch, 0 if none), followed by the event. Trades, tickers
+and books are cryptofeed.wire records (trade ids that aren't integers are not
+carried), other channels JSON with Decimals (and timestamps) as strings. Wire
+feed and pair names are sent to every subscriber in 'define' frames, all names
+so far when it subscribes and new ones as they are first used. Events for names
+too long for the wire format are logged and not published. Book channels are
+published as deltas of the top book_depth levels, BOOK_DELTA records with a
+size of 0 removing a level. New subscribers get a snapshot of every matching
+book first (without a receipt).
+
+EventSubscriber.recv decodes events into dicts with Decimal prices and sizes,
+books as
+
+    {'feed': ..., 'pair': ..., 'type': 'snapshot' or 'delta', BID: [(price, size), ...], ASK: [...]}
+
+The publisher never waits on a subscriber: a subscriber whose unsent data
+exceeds max_buffer bytes is disconnected.
+"""
+FRAME = struct.Struct('<IB')
+RECEIPT = struct.Struct('<q')
+SUBSCRIBE = 'subscribe'
+DEFINE_TOPIC = 'define'
+WIRE_CHANNELS = (TRADES, TICKER, L2_BOOK, L3_BOOK)
+
+
+def encode_frame(topic: str, payload: bytes) -> bytes:
+    topic = topic.encode()
+    return FRAME.pack(1 + len(topic) + len(payload), len(topic)) + topic + payload
+
+
+async def read_frame(reader):
+    """
+    returns (topic, payload), raises asyncio.IncompleteReadError at EOF
+    """
+    header = await reader.readexactly(FRAME.size)
+    length, topic_length = FRAME.unpack(header)
+    data = await reader.readexactly(length - 1)
+    return data[:topic_length].decode(), data[topic_length:]
+
+
+def _topic(channel, kwargs):
+    if channel == VOLUME:
+        return '{}.{}'.format(channel, kwargs['feed'])
+    return '{}.{}.{}'.format(channel, kwargs['feed'], kwargs['pair'])
+
+
+class _ChannelCallback:
+    def __init__(self, publisher, channel):
+        self.publisher = publisher
+        self.channel = channel
+
+    async def __call__(self, **kwargs):
+        topic = _topic(self.channel, kwargs)
+        if self.channel in (L2_BOOK, L3_BOOK):
+            kwargs = self.publisher.book_delta(topic, kwargs)
+            if kwargs is None:
+                return
+        self.publisher.publish(topic, self.channel, kwargs, timestamps.receipt().wall)
+
+
+class EventPublisher:
+    def __init__(self, path=None, host='127.0.0.1', port=None, max_buffer=1024 * 1024, book_depth=25):
+        """
+        path: Unix domain socket to listen on, otherwise TCP on host:port
+        max_buffer: bytes of unsent data after which a subscriber is dropped
+        book_depth: levels per side published for book channels
+        """
+        if path is None and port is None:
+            raise ValueError("EventPublisher requires a socket path or a TCP port")
+        self.path = path
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+        self.book_depth = book_depth
+        self.server = None
+        # writer -> tuple of topic prefixes
+        self.subscribers = {}
+        # topic -> {BID: {price: size}, ASK: {price: size}} last published levels
+        self.books = {}
+        self.encoder = Encoder()
+        # (feed, pair) whose names can't be encoded
+        self.rejected = set()
+
+    def callback(self, channel):
+        """
+        callback that publishes a channel, e.g. callbacks={TRADES: publisher.callback(TRADES)}
+        """
+        return _ChannelCallback(self, channel)
+
+    async def start(self):
+        if self.path:
+            self.server = await asyncio.start_unix_server(self._connected, path=self.path)
+        else:
+            self.server = await asyncio.start_server(self._connected, self.host, self.port)
+
+    def close(self):
+        for writer in list(self.subscribers):
+            self._drop(writer)
+        if self.server is not None:
+            self.server.close()
+
+    async def _connected(self, reader, writer):
+        try:
+            topic, payload = await read_frame(reader)
+            if topic != SUBSCRIBE:
+                raise ValueError("expected a subscribe frame, got {}".format(topic))
+            prefixes = tuple(json.loads(payload.decode())) or ('',)
+        except (asyncio.IncompleteReadError, ValueError) as e:
+            LOG.warning("Rejecting subscriber: %s", str(e))
+            writer.close()
+            return
+
+        frames = []
+        for topic, book in self.books.items():
+            if topic.startswith(prefixes):
+                channel, feed, pair = topic.split('.', 2)
+                event = {'feed': feed, 'pair': pair, 'type': 'snapshot'}
+                for side in (BID, ASK):
+                    event[side] = [[price, size] for price, size in book[side].items()]
+                payload = self._encode(channel, event)
+                if payload is not None:
+                    frames.append(encode_frame(topic, RECEIPT.pack(0) + payload))
+        self.subscribers[writer] = prefixes
+        definitions = self.encoder.definitions()
+        if definitions:
+            self._send(writer, encode_frame(DEFINE_TOPIC, definitions))
+        for frame in frames:
+            self._send(writer, frame)
+
+        # subscribers don't send anything else, wait for them to go away
+        try:
+            while await reader.read(4096):
+                pass
+        except ConnectionError:
+            pass
+        self._drop(writer)
+
+    def _drop(self, writer):
+        if self.subscribers.pop(writer, None) is not None:
+            writer.close()
+
+    def _send(self, writer, frame):
+        if writer not in self.subscribers:
+            # dropped while this frame was being built
+            return
+        if writer.transport.get_write_buffer_size() + len(frame) > self.max_buffer:
+            LOG.warning("Dropping slow subscriber %s", writer.get_extra_info('peername'))
+            self._drop(writer)
+            return
+        writer.write(frame)
+
+    def _encode(self, channel, event):
+        if channel not in WIRE_CHANNELS:
+            return json.dumps(event, default=str).encode()
+        encoder = self.encoder
+        feed = event['feed']
+        pair = event['pair']
+        timestamp = event.get('timestamp')
+        try:
+            if channel == TRADES:
+                data = encoder.trade(feed, pair, event['side'], event['amount'], event['price'], event.get('id'),
+                                     timestamp)
+            elif channel == TICKER:
+                data = encoder.ticker(feed, pair, event['bid'], event['ask'], timestamp)
+            elif event['type'] == 'snapshot':
+                data = encoder.book_snapshot(feed, pair, {side: sd(event[side]) for side in (BID, ASK)}, timestamp)
+            else:
+                data = b''.join(encoder.book_delta(feed, pair, side, price, size, timestamp)
+                                for side in (BID, ASK) for price, size in event[side])
+        except ValueError as e:
+            # a name too long for the wire format, don't take the feed down over it
+            if (feed, pair) not in self.rejected:
+                self.rejected.add((feed, pair))
+                LOG.error("Not publishing %s %s: %s", feed, pair, str(e))
+            return None
+
+        # names used for the first time lead the records, every subscriber needs them
+        start = 0
+        while start < len(data) and data[start] == DEFINE:
+            start += RECORD.size
+        if start:
+            frame = encode_frame(DEFINE_TOPIC, data[:start])
+            for writer in list(self.subscribers):
+                self._send(writer, frame)
+        return data[start:]
+
+    def publish(self, topic, channel, event, receipt=0):
+        frame = None
+        for writer, prefixes in list(self.subscribers.items()):
+            if not topic.startswith(prefixes):
+                continue
+            if frame is None:
+                payload = self._encode(channel, event)
+                if payload is None:
+                    return
+                frame = encode_frame(topic, RECEIPT.pack(receipt) + payload)
+            self._send(writer, frame)
+
+    def book_delta(self, topic, kwargs):
+        """
+        replace the book in a book callback's arguments with the levels that
+        changed since the book was last published, None if nothing changed
+        """
+        book = kwargs.pop('book')
+        top = top_levels(book, self.book_depth)
+        previous = self.books.get(topic)
+        self.books[topic] = top
+
+        if previous is None:
+            kwargs['type'] = 'snapshot'
+            for side in (BID, ASK):
+                kwargs[side] = [[price, size] for price, size in top[side].items()]
+            return kwargs
+
+        kwargs['type'] = 'delta'
+        changes = level_changes(previous, top)
+        if not changes[BID] and not changes[ASK]:
+            return None
+        for side in (BID, ASK):
+            kwargs[side] = [[price, size] for price, size in changes[side]]
+        return kwargs
+
+
+class EventSubscriber:
+    """
+    Client for an EventPublisher
+    """
+    def __init__(self, topics=(), path=None, host='127.0.0.1', port=None):
+        self.topics = list(topics)
+        self.path = path
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.decoder = Decoder()
+
+    async def connect(self):
+        if self.path:
+            self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(encode_frame(SUBSCRIBE, json.dumps(self.topics).encode()))
+
+    async def recv(self):
+        """
+        next (topic, event), raises asyncio.IncompleteReadError when the
+        publisher closes the connection
+        """
+        while True:
+            topic, payload = await read_frame(self.reader)
+            if topic == DEFINE_TOPIC:
+                self.decoder.decode(payload)
+            else:
+                return topic, self._decode(topic, payload)
+
+    def _decode(self, topic, payload):
+        receipt, = RECEIPT.unpack_from(payload)
+        channel = topic.split('.', 1)[0]
+        if channel not in WIRE_CHANNELS:
+            event = json.loads(payload[RECEIPT.size:].decode())
+        else:
+            events = self.decoder.decode(payload[RECEIPT.size:])
+            event = events[0]
+            if channel in (L2_BOOK, L3_BOOK):
+                if event['type'] == L2_BOOK:
+                    event['type'] = 'snapshot'
+                else:
+                    event = {'feed': event['feed'], 'pair': event['pair'], 'timestamp': event['timestamp'],
+                             'type': 'delta', BID: [], ASK: []}
+                    for delta in events:
+                        event[delta['side']].append((delta['price'], delta['size']))
+        if receipt:
+            event['receipt'] = receipt
+        return event
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
@@ -0,0 +1,276 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import logging
+import mmap
+import os
+import struct
+from itertools import islice
+
+from cryptofeed import timestamps
+from cryptofeed.defines import BID, ASK
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Shared memory book publication
+
+A BookPublisher is a book callback that writes the top levels of each book it
+receives into a memory mapped file (put it on a tmpfs such as /dev/shm), and
+BookReader maps the same file in other processes. Reads are plain memory
+copies, no syscalls or messages are involved.
+
+Layout (little endian):
+
+    header (64 bytes): magic, version, depth, max_books, slot size, generation (uint64)
+    slots (max_books of them), each:
+        sequence (uint64), feed (16 bytes), pair (16 bytes), timestamp (double,
+        seconds since the epoch the book's frame arrived),
+        bid count (uint32), ask count (uint32), padding to 64 bytes
+        depth bids then depth asks as (price, size) doubles, best first
+
+Each slot is a seqlock: the publisher makes the sequence odd before it writes
+and even again after, a reader retries until it copies a slot whose sequence
+was even and unchanged across the copy. A sequence of 0 is an unused slot.
+Prices and sizes are published as doubles.
+
+A restarted publisher reuses a file with the same layout in place (it is
+never truncated under readers that have it mapped) and bumps the
+generation, slots are then handed out afresh. A file with a different
+layout is replaced by a new one and its generation set to RETIRED. Readers
+check the generation and the slot's feed/pair on every read, and rescan
+(or reopen) when they change.
+"""
+MAGIC = b'CFBK'
+VERSION = 2
+HEADER = struct.Struct('<4sIIIIQ')
+GENERATION = struct.Struct('<Q')
+GENERATION_OFFSET = 20
+RETIRED = 2 ** 64 - 1
+NAME_SIZE = 16
+HEADER_SIZE = 64
+SLOT_HEADER = struct.Struct('<Q16s16sdII')
+SLOT_HEADER_SIZE = 64
+SEQUENCE = struct.Struct('<Q')
+LEVEL = struct.Struct('<dd')
+# reads give up on a slot that stays mid-write this long (e.g. the publisher died)
+SPIN_LIMIT = 100000
+
+
+def _slot_size(depth):
+    return SLOT_HEADER_SIZE + 2 * depth * LEVEL.size
+
+
+class BookPublisher:
+    """
+    Book callback (L2_BOOK or L3_BOOK) that publishes the top depth levels
+    of every book into shared memory. Slots are allocated to (feed, pair)
+    as books are first seen, up to max_books.
+    """
+    def __init__(self, path, depth=10, max_books=64):
+        self.path = path
+        self.depth = depth
+        self.max_books = max_books
+        self.slot_size = _slot_size(depth)
+        # (feed, pair) -> slot offset
+        self.slots = {}
+        self.sequences = {}
+
+        self.size = HEADER_SIZE + max_books * self.slot_size
+        self.mm = self._reuse()
+        if self.mm is None:
+            self.mm = self._create()
+
+    def _reuse(self):
+        """
+        map an existing file with the same layout and start a new generation
+        in it, None if there is no such file
+        """
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            return None
+        try:
+            if os.fstat(fd).st_size < HEADER_SIZE:
+                return None
+            mm = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        magic, version, depth, max_books, slot_size, generation = HEADER.unpack_from(mm, 0)
+        layout = (MAGIC, VERSION, self.depth, self.max_books, self.slot_size)
+        if (magic, version, depth, max_books, slot_size) != layout or len(mm) != self.size:
+            if magic == MAGIC and version == VERSION:
+                # tell readers of the old layout to reopen the path
+                GENERATION.pack_into(mm, GENERATION_OFFSET, RETIRED)
+            mm.close()
+            return None
+        # free every slot before readers are sent to rescan
+        for i in range(self.max_books):
+            SEQUENCE.pack_into(mm, HEADER_SIZE + i * self.slot_size, 0)
+        GENERATION.pack_into(mm, GENERATION_OFFSET, (generation + 1) % RETIRED)
+        return mm
+
+    def _create(self):
+        tmp = os.path.join(os.path.dirname(self.path), '.' + os.path.basename(self.path) + '.tmp')
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, self.size)
+            mm = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+        HEADER.pack_into(mm, 0, MAGIC, VERSION, self.depth, self.max_books, self.slot_size, 1)
+        os.replace(tmp, self.path)
+        return mm
+
+    def _slot(self, feed, pair):
+        key = (feed, pair)
+        if key not in self.slots:
+            if len(feed.encode()) > NAME_SIZE or len(pair.encode()) > NAME_SIZE:
+                LOG.warning("%s - %s can not be published, names are limited to %d bytes", feed, pair, NAME_SIZE)
+                return None
+            if len(self.slots) == self.max_books:
+                LOG.warning("%s - no free shared memory slot for %s book", feed, pair)
+                return None
+            self.slots[key] = HEADER_SIZE + len(self.slots) * self.slot_size
+            self.sequences[key] = 0
+        return self.slots[key]
+
+    def publish(self, feed, pair, book):
+        offset = self._slot(feed, pair)
+        if offset is None:
+            return
+        key = (feed, pair)
+        sequence = self.sequences[key]
+        mm = self.mm
+
+        SEQUENCE.pack_into(mm, offset, sequence + 1)
+        levels = offset + SLOT_HEADER_SIZE
+        bids = 0
+        for price in islice(reversed(book[BID]), self.depth):
+            LEVEL.pack_into(mm, levels + bids * LEVEL.size, price, book[BID][price])
+            bids += 1
+        levels += self.depth * LEVEL.size
+        asks = 0
+        for price in islice(book[ASK], self.depth):
+            LEVEL.pack_into(mm, levels + asks * LEVEL.size, price, book[ASK][price])
+            asks += 1
+        SLOT_HEADER.pack_into(mm, offset, sequence + 1, feed.encode(), pair.encode(),
+                              timestamps.receipt().wall / timestamps.NS, bids, asks)
+        SEQUENCE.pack_into(mm, offset, sequence + 2)
+        self.sequences[key] = sequence + 2
+
+    async def __call__(self, *, feed, pair, book, timestamp=None, sequence=None):
+        self.publish(feed, pair, book)
+
+    def close(self):
+        self.mm.close()
+
+
+class BookReader:
+    """
+    Reads consistent book snapshots published by a BookPublisher
+    """
+    def __init__(self, path):
+        self.path = path
+        self.mm = None
+        self._open()
+
+    def _open(self):
+        if self.mm is not None:
+            self.mm.close()
+        with open(self.path, 'rb') as fp:
+            self.mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.depth, self.max_books, self.slot_size, self.generation = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} book publication".format(self.path, VERSION))
+        # (feed, pair) -> slot offset
+        self.slots = {}
+
+    def _check_generation(self):
+        """
+        drop the slot cache if the publisher restarted, reopen the path if the file was replaced
+        """
+        generation = GENERATION.unpack_from(self.mm, GENERATION_OFFSET)[0]
+        if generation == self.generation:
+            return
+        if generation == RETIRED:
+            self._open()
+        else:
+            self.generation = generation
+            self.slots = {}
+
+    def _scan(self):
+        self.slots = {}
+        for i in range(self.max_books):
+            offset = HEADER_SIZE + i * self.slot_size
+            data = self._copy(offset)
+            if data is None:
+                continue
+            sequence, feed, pair, _, _, _ = self._header(data)
+            if sequence == 0:
+                break
+            self.slots[(feed, pair)] = offset
+
+    def _copy(self, offset):
+        """
+        seqlock read of the slot at offset, returns the slot's bytes or
+        None if no consistent copy could be taken
+        """
+        for _ in range(SPIN_LIMIT):
+            before = SEQUENCE.unpack_from(self.mm, offset)[0]
+            if before & 1:
+                continue
+            data = self.mm[offset:offset + self.slot_size]
+            if SEQUENCE.unpack_from(self.mm, offset)[0] == before:
+                return data
+        return None
+
+    @staticmethod
+    def _header(data):
+        sequence, feed, pair, timestamp, bids, asks = SLOT_HEADER.unpack_from(data, 0)
+        return sequence, feed.rstrip(b'\0').decode(), pair.rstrip(b'\0').decode(), timestamp, bids, asks
+
+    def books(self):
+        """
+        (feed, pair) of every published book
+        """
+        self._check_generation()
+        self._scan()
+        return list(self.slots)
+
+    def read(self, feed, pair):
+        """
+        latest published book for feed/pair as
+        (sequence, timestamp, {BID: [(price, size), ...], ASK: [...]}), levels best
+        first, or None if the book has not been published (or is mid-write
+        for longer than SPIN_LIMIT reads)
+        """
+        self._check_generation()
+        for attempt in range(2):
+            if (feed, pair) not in self.slots:
+                self._scan()
+                if (feed, pair) not in self.slots:
+                    return None
+            data = self._copy(self.slots[(feed, pair)])
+            if data is None:
+                return None
+            sequence, slot_feed, slot_pair, timestamp, bids, asks = self._header(data)
+            if (slot_feed, slot_pair) == (feed, pair):
+                break
+            # the slot was handed to another book since it was cached
+            self.slots = {}
+        else:
+            return None
+        levels = SLOT_HEADER_SIZE
+        book = {BID: [LEVEL.unpack_from(data, levels + i * LEVEL.size) for i in range(bids)]}
+        levels += self.depth * LEVEL.size
+        book[ASK] = [LEVEL.unpack_from(data, levels + i * LEVEL.size) for i in range(asks)]
+        return sequence, timestamp, book
+
+    def close(self):
+        self.mm.close()
@@ -0,0 +1,194 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import functools
+import time
+from calendar import timegm
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+"""
+Exchange timestamp parsing
+
+Timestamps are parsed to integer nanoseconds since the epoch. ISO 8601
+strings are split by hand rather than with strptime, and the date and hour
+are looked up in a cache since consecutive messages almost always share
+them. Seconds since the epoch (strings or numbers) are converted exactly.
+
+Receipts record when the frame behind an event arrived, see receipt().
+"""
+NS = 1000000000
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# 'YYYY-MM-DDTHH' -> nanoseconds at the start of the hour
+_hours = {}
+_MAX_HOURS = 1024
+
+
+class Nanoseconds(int):
+    """
+    nanoseconds since the epoch, an int that storage and the wire format
+    can tell apart from seconds
+    """
+    __slots__ = ()
+
+
+def _hour(prefix):
+    try:
+        return _hours[prefix]
+    except KeyError:
+        pass
+    if prefix[4] != '-' or prefix[7] != '-' or prefix[10] not in 'T ':
+        raise ValueError("{} is not an ISO 8601 timestamp".format(prefix))
+    if len(_hours) >= _MAX_HOURS:
+        _hours.clear()
+    ns = timegm((int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10]), int(prefix[11:13]), 0, 0)) * NS
+    _hours[prefix] = ns
+    return ns
+
+
+def iso_to_ns(timestamp: str) -> int:
+    """
+    YYYY-MM-DDTHH:MM:SS[.fraction](Z|+HH:MM|+HHMM), no offset is UTC
+    """
+    offset = 0
+    if timestamp[-1] == 'Z':
+        body = timestamp[:-1]
+    elif len(timestamp) > 19 and timestamp[-6] in '+-' and timestamp[-3] == ':':
+        body = timestamp[:-6]
+        offset = int(timestamp[-5:-3]) * 3600 + int(timestamp[-2:]) * 60
+        if timestamp[-6] == '-':
+            offset = -offset
+    elif len(timestamp) > 19 and timestamp[-5] in '+-':
+        body = timestamp[:-5]
+        offset = int(timestamp[-4:-2]) * 3600 + int(timestamp[-2:]) * 60
+        if timestamp[-5] == '-':
+            offset = -offset
+    else:
+        body = timestamp
+
+    if body[13] != ':' or body[16] != ':':
+        raise ValueError("{} is not an ISO 8601 timestamp".format(timestamp))
+    ns = _hour(body[:13]) + (int(body[14:16]) * 60 + int(body[17:19]) - offset) * NS
+    if len(body) > 19:
+        if body[19] != '.':
+            raise ValueError("{} is not an ISO 8601 timestamp".format(timestamp))
+        fraction = body[20:29]
+        ns += int(fraction) * 10 ** (9 - len(fraction))
+    return ns
+
+
+def seconds_to_ns(timestamp) -> int:
+    """
+    seconds since the epoch as a string, int, float or Decimal
+    """
+    if isinstance(timestamp, str):
+        seconds, _, fraction = timestamp.partition('.')
+        fraction = fraction[:9]
+        return int(seconds) * NS + (int(fraction) * 10 ** (9 - len(fraction)) if fraction else 0)
+    if isinstance(timestamp, int):
+        return timestamp * NS
+    if isinstance(timestamp, float):
+        timestamp = Decimal(repr(timestamp))
+    return int(timestamp * NS)
+
+
+def parser(timestamp):
+    """
+    the parser for timestamps formatted like this one
+    """
+    if isinstance(timestamp, str) and len(timestamp) > 10 and timestamp[4] == '-':
+        return iso_to_ns
+    return seconds_to_ns
+
+
+def to_ns(timestamp) -> int:
+    return parser(timestamp)(timestamp)
+
+
+def to_datetime(ns: int) -> datetime:
+    """
+    nanoseconds since the epoch to a UTC datetime (microsecond resolution)
+    """
+    return EPOCH + timedelta(microseconds=ns // 1000)
+
+
+if hasattr(time, 'time_ns'):
+    wall_ns = time.time_ns
+    monotonic_ns = time.monotonic_ns
+else:
+    def wall_ns():
+        return int(time.time() * NS)
+
+    def monotonic_ns():
+        return int(time.monotonic() * NS)
+
+
+class Receipt:
+    """
+    when a frame was received, as wall clock nanoseconds since the epoch and
+    monotonic nanoseconds (only comparable within the process)
+    """
+    __slots__ = ('wall', 'monotonic')
+
+    def __init__(self, wall, monotonic):
+        self.wall = wall
+        self.monotonic = monotonic
+
+    def __repr__(self):
+        return 'Receipt(wall={}, monotonic={})'.format(self.wall, self.monotonic)
+
+
+def now() -> Receipt:
+    return Receipt(wall_ns(), monotonic_ns())
+
+
+# the receipt of the frame being handled. Each feed connection is its own
+# task so with contextvars receipts are per feed, without them (before
+# python 3.7) a feed that awaits mid-frame may see another feed's receipt
+if contextvars is not None:
+    _receipt = contextvars.ContextVar('receipt', default=None)
+    _get_receipt = _receipt.get
+    _set_receipt = _receipt.set
+else:
+    _current = [None]
+
+    def _get_receipt():
+        return _current[0]
+
+    def _set_receipt(value):
+        _current[0] = value
+
+
+def set_receipt(value):
+    """
+    the receipt of the frame about to be handled, None clears it
+    """
+    _set_receipt(value)
+
+
+def receipt() -> Receipt:
+    """
+    when the frame behind the event being handled arrived. Events that do not
+    come from a frame (e.g. REST snapshots) are stamped with the current time
+    """
+    return _get_receipt() or now()
+
+
+def bind(func):
+    """
+    func wrapped to see the current receipt wherever it is called, for
+    running it in an executor thread (threads do not inherit context variables)
+    """
+    if contextvars is None:
+        # the module global is visible from every thread
+        return func
+    return functools.partial(contextvars.copy_context().run, func)
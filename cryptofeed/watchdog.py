@@ -0,0 +1,99 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import heapq
+import logging
+from itertools import count
+
+from cryptofeed.timestamps import NS, monotonic_ns
+
+
+LOG = logging.getLogger('feedhandler')
+
+
+"""
+Connection watchdog
+
+One task watches every connection. Connections are kept in a heap by the
+time they would time out if nothing more arrived, and the task sleeps until
+the earliest of those deadlines. Receiving a message only stores the
+monotonic time in Watch.last, so the heap entry goes stale instead of being
+updated: when a deadline is reached the connection's real deadline is
+recomputed from last and the entry is pushed back if it has moved. A busy
+connection costs one wakeup per timeout, not one per message or poll.
+"""
+
+
+class Watch:
+    """
+    a watched connection. Set last (monotonic nanoseconds) whenever a message arrives
+    """
+    __slots__ = ('name', 'websocket', 'timeout', 'last')
+
+    def __init__(self, name, websocket, timeout, last):
+        self.name = name
+        self.websocket = websocket
+        # nanoseconds
+        self.timeout = timeout
+        self.last = last
+
+
+class Watchdog:
+    def __init__(self):
+        # (deadline, tie breaker, watch)
+        self.heap = []
+        self._order = count()
+        self._wakeup = None
+
+    def watch(self, name, websocket, timeout) -> Watch:
+        """
+        close websocket if it is silent for timeout seconds, until unwatch is called
+        """
+        watch = Watch(name, websocket, int(timeout * NS), monotonic_ns())
+        self._push(watch.last + watch.timeout, watch)
+        return watch
+
+    @staticmethod
+    def unwatch(watch):
+        # dropped from the heap when its deadline comes up
+        watch.websocket = None
+
+    def _push(self, deadline, watch):
+        heapq.heappush(self.heap, (deadline, next(self._order), watch))
+        if self.heap[0][2] is watch and self._wakeup is not None:
+            # new earliest deadline, the task is sleeping until a later one
+            self._wakeup.set()
+
+    def expire(self, now):
+        """
+        close connections whose deadline passed by now (monotonic
+        nanoseconds), returns the next deadline or None
+        """
+        while self.heap and self.heap[0][0] <= now:
+            _, _, watch = heapq.heappop(self.heap)
+            if watch.websocket is None:
+                continue
+            deadline = watch.last + watch.timeout
+            if deadline > now:
+                heapq.heappush(self.heap, (deadline, next(self._order), watch))
+                continue
+            LOG.warning("Feed {} received no messages within timeout, restarting connection".format(watch.name))
+            asyncio.ensure_future(watch.websocket.close())
+            watch.websocket = None
+        return self.heap[0][0] if self.heap else None
+
+    async def run(self):
+        self._wakeup = asyncio.Event()
+        while True:
+            self._wakeup.clear()
+            now = monotonic_ns()
+            deadline = self.expire(now)
+            timeout = None if deadline is None else (deadline - now) / NS
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,237 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import struct
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_EVEN
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cryptofeed.defines import BID, ASK, TRADES, TICKER, L2_BOOK
+from cryptofeed.timestamps import Nanoseconds
+
+
+"""
+Binary wire format for normalized events
+
+A stream is a sequence of fixed size (40 byte, little endian) records:
+
+    type (uint8), side (uint8), feed id (uint16), pair id (uint16), padding (2 bytes),
+    timestamp (int64, nanoseconds since the epoch, 0 if unknown), a, b, c (int64)
+
+    type            a           b           c
+    DEFINE          name (24 bytes of utf-8, nul padded), side is the id kind
+    TRADE           price       amount      trade id (-1 if absent or not an integer)
+    TICKER          bid         ask         0
+    BOOK_DELTA      price       size        0, size 0 removes the level
+    BOOK_SNAPSHOT   0           0           number of BOOK_LEVEL records that follow
+    BOOK_LEVEL      price       size        0
+
+Feeds and pairs are interned: an Encoder assigns ids and emits a DEFINE record
+the first time it sees a name, a Decoder learns the names from them. Prices and
+sizes are integers scaled by 10^DECIMALS.
+
+Because every record has the same layout a buffer can be decoded in one step
+into a NumPy structured array (RECORD_DTYPE) if numpy is installed.
+"""
+DEFINE = 0
+TRADE = 1
+TICKER_RECORD = 2
+BOOK_DELTA = 3
+BOOK_SNAPSHOT = 4
+BOOK_LEVEL = 5
+
+FEED_ID = 0
+PAIR_ID = 1
+
+DECIMALS = 8
+SCALE = 10 ** DECIMALS
+
+RECORD = struct.Struct('<BBHH2xqqqq')
+NAME = struct.Struct('<BBHH2xq24s')
+# some feeds report trade sides as buy/sell
+SIDE_IDS = {BID: 0, ASK: 1, 'buy': 0, 'sell': 1, 'BUY': 0, 'SELL': 1}
+_SIDE_NAMES = (BID, ASK)
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([('type', 'u1'), ('side', 'u1'), ('feed', '<u2'), ('pair', '<u2'), ('pad', 'V2'),
+                             ('timestamp', '<i8'), ('a', '<i8'), ('b', '<i8'), ('c', '<i8')])
+else:
+    RECORD_DTYPE = None
+
+
+def to_scaled(value) -> int:
+    return int((Decimal(value) * SCALE).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def from_scaled(value: int) -> Decimal:
+    return Decimal(value).scaleb(-DECIMALS)
+
+
+def to_nanoseconds(timestamp) -> int:
+    """
+    datetime, Nanoseconds or seconds since the epoch to nanoseconds, None is 0
+    """
+    if timestamp is None:
+        return 0
+    if isinstance(timestamp, Nanoseconds):
+        return int(timestamp)
+    if isinstance(timestamp, datetime):
+        timestamp = Decimal(str(timestamp.timestamp()))
+    return int(Decimal(timestamp) * 1000000000)
+
+
+class Encoder:
+    def __init__(self):
+        # (kind, name) -> id
+        self.ids = {}
+        self.next_id = [0, 0]
+
+    def _id(self, kind, name, out):
+        try:
+            return self.ids[(kind, name)]
+        except KeyError:
+            pass
+        encoded = name.encode()
+        if len(encoded) > 24:
+            raise ValueError("{} is too long for the wire format".format(name))
+        ident = self.next_id[kind]
+        self.next_id[kind] += 1
+        self.ids[(kind, name)] = ident
+        out.append(NAME.pack(DEFINE, kind, ident, 0, 0, encoded))
+        return ident
+
+    def definitions(self) -> bytes:
+        """
+        DEFINE records for every name assigned so far, for a reader joining part way
+        """
+        return b''.join(NAME.pack(DEFINE, kind, ident, 0, 0, name.encode()) for (kind, name), ident in self.ids.items())
+
+    def _header(self, feed, pair, out):
+        return self._id(FEED_ID, feed, out), self._id(PAIR_ID, pair, out)
+
+    def trade(self, feed, pair, side, amount, price, id=None, timestamp=None) -> bytes:
+        out = []
+        feed_id, pair_id = self._header(feed, pair, out)
+        try:
+            trade_id = int(id) if id is not None else -1
+        except ValueError:
+            trade_id = -1
+        out.append(RECORD.pack(TRADE, SIDE_IDS[side], feed_id, pair_id, to_nanoseconds(timestamp),
+                               to_scaled(price), to_scaled(amount), trade_id))
+        return b''.join(out)
+
+    def ticker(self, feed, pair, bid, ask, timestamp=None) -> bytes:
+        out = []
+        feed_id, pair_id = self._header(feed, pair, out)
+        out.append(RECORD.pack(TICKER_RECORD, 0, feed_id, pair_id, to_nanoseconds(timestamp),
+                               to_scaled(bid), to_scaled(ask), 0))
+        return b''.join(out)
+
+    def book_delta(self, feed, pair, side, price, size, timestamp=None) -> bytes:
+        out = []
+        feed_id, pair_id = self._header(feed, pair, out)
+        out.append(RECORD.pack(BOOK_DELTA, SIDE_IDS[side], feed_id, pair_id, to_nanoseconds(timestamp),
+                               to_scaled(price), to_scaled(size), 0))
+        return b''.join(out)
+
+    def book_snapshot(self, feed, pair, book, timestamp=None, depth=None) -> bytes:
+        """
+        the top depth levels per side of book (all levels if depth is None), best first
+        """
+        out = []
+        feed_id, pair_id = self._header(feed, pair, out)
+        timestamp = to_nanoseconds(timestamp)
+        levels = []
+        for side, prices in ((BID, reversed(book[BID])), (ASK, iter(book[ASK]))):
+            for price in islice(prices, depth):
+                levels.append(RECORD.pack(BOOK_LEVEL, SIDE_IDS[side], feed_id, pair_id, timestamp,
+                                          to_scaled(price), to_scaled(book[side][price]), 0))
+        out.append(RECORD.pack(BOOK_SNAPSHOT, 0, feed_id, pair_id, timestamp, 0, 0, len(levels)))
+        out.extend(levels)
+        return b''.join(out)
+
+
+class Decoder:
+    def __init__(self):
+        # [{feed id: name}, {pair id: name}]
+        self.names = [{}, {}]
+        # snapshot being assembled: (event, levels remaining)
+        self._snapshot = None
+
+    def _define(self, kind, ident, name):
+        self.names[kind][ident] = name.rstrip(b'\0').decode()
+
+    def decode(self, data):
+        """
+        decode records into a list of event dicts, with Decimal prices/sizes and
+        timestamps in seconds. Book snapshots are a single event with BID and
+        ASK lists of (price, size), best first
+        """
+        events = []
+        for offset in range(0, len(data), RECORD.size):
+            rtype, side, feed_id, pair_id, timestamp, a, b, c = RECORD.unpack_from(data, offset)
+            if rtype == DEFINE:
+                self._define(side, feed_id, data[offset + 16:offset + RECORD.size])
+                continue
+
+            if rtype == BOOK_LEVEL:
+                event, remaining = self._snapshot
+                event[_SIDE_NAMES[side]].append((from_scaled(a), from_scaled(b)))
+                remaining -= 1
+                self._snapshot = (event, remaining) if remaining else None
+                if not remaining:
+                    events.append(event)
+                continue
+
+            event = {'feed': self.names[FEED_ID][feed_id],
+                     'pair': self.names[PAIR_ID][pair_id],
+                     'timestamp': timestamp / 1e9 if timestamp else None}
+            if rtype == TRADE:
+                event.update(type=TRADES, side=_SIDE_NAMES[side], price=from_scaled(a), amount=from_scaled(b),
+                             id=c if c >= 0 else None)
+            elif rtype == TICKER_RECORD:
+                event.update(type=TICKER, bid=from_scaled(a), ask=from_scaled(b))
+            elif rtype == BOOK_DELTA:
+                event.update(type='book_delta', side=_SIDE_NAMES[side], price=from_scaled(a), size=from_scaled(b))
+            elif rtype == BOOK_SNAPSHOT:
+                event.update(type=L2_BOOK, **{BID: [], ASK: []})
+                if c:
+                    self._snapshot = (event, c)
+                    continue
+            else:
+                raise ValueError("Unknown record type {}".format(rtype))
+            events.append(event)
+        return events
+
+    def array(self, data):
+        """
+        decode records into a NumPy structured array of RECORD_DTYPE, DEFINE
+        records are consumed and dropped. Prices and sizes stay scaled ints,
+        divide by SCALE for floats. Requires numpy
+        """
+        if np is None:
+            raise ImportError("numpy is required to decode into arrays")
+        records = np.frombuffer(data, dtype=RECORD_DTYPE)
+        defines = records['type'] == DEFINE
+        if defines.any():
+            for record in records[defines]:
+                self._define(int(record['side']), int(record['feed']), record.tobytes()[16:])
+            records = records[~defines]
+        return records
+
+
+def encode_array(records) -> bytes:
+    """
+    records from a RECORD_DTYPE structured array back to wire format
+    """
+    if np is None:
+        raise ImportError("numpy is required to encode arrays")
+    return np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes()
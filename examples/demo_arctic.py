@@ -4,32 +4,24 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-import time
-
-import pandas as pd
-from arctic import Arctic
-
-from cryptofeed.callback import TickerCallback
+from cryptofeed.backends.arctic import ArcticWriter
 from cryptofeed import FeedHandler
 from cryptofeed import GDAX
-from cryptofeed.defines import BID, ASK, TICKER
-
-
-a = Arctic('127.0.0.1')
-a.initialize_library('gdax.ticker')
-lib = a['gdax.ticker']
-
-
-async def ticker(feed, pair, bid, ask):
-    ts = time.time()
-    df = pd.DataFrame({'time': [ts], 'bid': [float(bid)], 'ask': [float(ask)]})
-    lib.append('BTC-USD', df)
+from cryptofeed.defines import TICKER, TRADES
 
 
 def main():
+    # batches are appended to the gdax library every 1000 rows (or 60 seconds),
+    # at most 100k rows may be waiting on arctic before new batches are dropped
+    writer = ArcticWriter('gdax', host='127.0.0.1', max_rows=1000, max_pending=100000, overflow='drop')
+
     f = FeedHandler()
-    f.add_feed(GDAX(pairs=['BTC-USD'], channels=[TICKER], callbacks={TICKER: TickerCallback(ticker)}))
-    f.run()
+    f.add_feed(GDAX(pairs=['BTC-USD'], channels=[TICKER, TRADES],
+                    callbacks={TICKER: writer.callback(TICKER), TRADES: writer.callback(TRADES)}))
+    try:
+        f.run()
+    finally:
+        writer.close()
 
 
 if __name__ == '__main__':
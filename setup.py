@@ -40,4 +40,9 @@ setup(
         "websockets>=5.0",
         "sortedcontainers>=1.5.9"
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "parquet": ["pyarrow"],
+        "arctic": ["arctic", "pandas"]
+    },
 )
@@ -0,0 +1,163 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import threading
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.backends.batch import BatchWriter, DROP
+from cryptofeed.book import new_book
+from cryptofeed.defines import BID, ASK, TRADES, L2_BOOK, VOLUME
+from cryptofeed.timestamps import Nanoseconds
+
+
+class ListWriter(BatchWriter):
+    def __init__(self, **kwargs):
+        self.written = []
+        super().__init__(**kwargs)
+
+    def write(self, channel, feed, pair, columns):
+        self.written.append((channel, feed, pair, columns))
+
+
+def test_batches_by_size():
+    writer = ListWriter(max_rows=2)
+    trades = writer.callback(TRADES)
+    books = writer.callback(L2_BOOK)
+    book = new_book()
+    book[BID][Decimal('100')] = Decimal('1')
+
+    async def run():
+        for i in range(3):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('1'), price=Decimal(i), id=i,
+                         timestamp=1527000000.5 if i else None)
+        await books(feed='GDAX', pair='BTC-USD', book=book)
+        book[ASK][Decimal('101')] = Decimal('2')
+        del book[BID][Decimal('100')]
+        await books(feed='GDAX', pair='BTC-USD', book=book)
+
+    asyncio.new_event_loop().run_until_complete(run())
+    writer.close()
+
+    trade_batches = [columns for channel, _, _, columns in writer.written if channel == TRADES]
+    assert [batch['id'] for batch in trade_batches] == [[0, 1], [2]]
+    assert trade_batches[0]['timestamp'] == [None, 1527000000500000000]
+    book_batch, = [columns for channel, _, _, columns in writer.written if channel == L2_BOOK]
+    assert list(zip(book_batch['side'], book_batch['price'], book_batch['size'])) == \
+        [(BID, 100, 1), (BID, 100, 0), (ASK, 101, 2)]
+
+    with pytest.raises(ValueError):
+        writer.callback(VOLUME)
+
+
+def test_parquet(tmpdir):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    from cryptofeed.backends.parquet import ParquetWriter
+
+    writer = ParquetWriter(str(tmpdir))
+    trades = writer.callback(TRADES)
+
+    async def run():
+        for i in range(3):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('0.5'), price=Decimal(i), id=i,
+                         timestamp=Nanoseconds(1527000000123456789 + i) if i else None)
+
+    asyncio.new_event_loop().run_until_complete(run())
+    writer.close()
+
+    files = tmpdir.join(TRADES).listdir()[0].join('exchange=GDAX', 'pair=BTC-USD').listdir()
+    assert len(files) == 1
+    table = pq.read_table(str(files[0]))
+    assert table.column('price').to_pylist() == [0.0, 1.0, 2.0]
+    assert table.column('id').to_pylist() == ['0', '1', '2']
+    # exchange timestamps keep nanosecond precision
+    assert table.column('timestamp').cast(pa.int64()).to_pylist() == [None, 1527000000123456790, 1527000000123456791]
+
+
+def test_backpressure_drop():
+    release = threading.Event()
+
+    class SlowWriter(ListWriter):
+        def write(self, *args):
+            release.wait()
+            super().write(*args)
+
+    writer = SlowWriter(max_rows=1, max_pending=2, overflow=DROP)
+    trades = writer.callback(TRADES)
+
+    async def run():
+        for i in range(4):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('1'), price=Decimal(i), id=i)
+
+    asyncio.new_event_loop().run_until_complete(run())
+    assert writer.dropped == 2
+    release.set()
+    writer.close()
+    assert [columns['id'] for _, _, _, columns in writer.written] == [[0], [1]]
+    assert writer.pending == 0
+
+
+def test_arctic_chunks():
+    pytest.importorskip('pandas')
+    from cryptofeed.backends.arctic import ArcticWriter
+
+    class Library:
+        def __init__(self):
+            self.appends = []
+
+        def append(self, symbol, frame, upsert=False):
+            self.appends.append((symbol, frame))
+
+    library = Library()
+    writer = ArcticWriter(library, chunk_size=2)
+    trades = writer.callback(TRADES)
+
+    async def run():
+        for i in range(3):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('1'), price=Decimal(i), id=i)
+
+    asyncio.new_event_loop().run_until_complete(run())
+    writer.close()
+    assert [(symbol, len(frame)) for symbol, frame in library.appends] == [('trades.GDAX.BTC-USD', 2),
+                                                                          ('trades.GDAX.BTC-USD', 1)]
+    assert list(library.appends[1][1]['price']) == [2.0]
+
+
+def test_backpressure_block():
+    release = threading.Event()
+
+    class SlowWriter(ListWriter):
+        def write(self, *args):
+            release.wait()
+            super().write(*args)
+
+    writer = SlowWriter(max_rows=1, max_pending=2)
+    trades = writer.callback(TRADES)
+    ticks = []
+
+    async def feed():
+        for i in range(4):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('1'), price=Decimal(i), id=i)
+
+    async def ticker():
+        # the loop keeps running while the feed waits for the writer
+        while not release.is_set():
+            ticks.append(len(ticks))
+            if len(ticks) == 5:
+                release.set()
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(feed(), ticker())
+
+    asyncio.new_event_loop().run_until_complete(run())
+    writer.close()
+    assert len(ticks) == 5
+    assert writer.dropped == 0
+    assert [columns['id'] for _, _, _, columns in writer.written] == [[0], [1], [2], [3]]
@@ -0,0 +1,55 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+from decimal import Decimal
+
+from sortedcontainers import SortedDict as sd
+
+from cryptofeed import Bitstamp
+from cryptofeed.callback import L3BookCallback, TradeCallback
+from cryptofeed.defines import BID, ASK, L3_BOOK, TRADES
+
+
+class FakeWebsocket:
+    async def send(self, msg):
+        pass
+
+
+def pusher(event, channel, data):
+    return json.dumps({'event': event, 'channel': channel, 'data': json.dumps(data)})
+
+
+def test_double_encoded_messages():
+    trades = []
+    books = []
+
+    async def trade(*args):
+        trades.append(args)
+
+    async def book(feed, pair, timestamp, sequence, book):
+        books.append({BID: dict(book[BID]), ASK: dict(book[ASK])})
+
+    feed = Bitstamp(pairs=['BTC-USD'], channels=[L3_BOOK, TRADES],
+                    callbacks={TRADES: TradeCallback(trade), L3_BOOK: L3BookCallback(book)})
+    feed.snapshot_processed = True
+    feed.book = {'BTC-USD': {BID: sd({Decimal('1'): Decimal('1')}), ASK: sd()}}
+
+    async def run():
+        await feed.subscribe(FakeWebsocket())
+        await feed.message_handler(pusher('pusher:connection_established', None, {'socket_id': '1.2'}))
+        # embedded quotes and braces used to be mangled by string replacement
+        await feed.message_handler(pusher('trade', 'live_trades', {'type': 0, 'amount': 0.5, 'price': 8000.1,
+                                                                   'id': 1, 'note': '"{x}"'}))
+        await feed.message_handler(pusher('data', 'diff_order_book', {'timestamp': '1527000000',
+                                                                      'bids': [['1', '0'], ['2', '3']],
+                                                                      'asks': [['4', '5']]}))
+
+    asyncio.new_event_loop().run_until_complete(run())
+
+    assert trades == [('BITSTAMP', 'BTC-USD', None, None, 'BUY', Decimal('0.5'), Decimal('8000.1'))]
+    assert books == [{BID: {Decimal('2'): Decimal('3')}, ASK: {Decimal('4'): Decimal('5')}}]
@@ -0,0 +1,158 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import pickle
+from decimal import Decimal
+from weakref import ref
+
+from cryptofeed import Bitfinex
+from cryptofeed.book import DepthLimitedSide, new_book, snapshot
+from cryptofeed.callback import BookCallback
+from cryptofeed.defines import BID, ASK, L2_BOOK, L3_BOOK
+
+
+def test_depth_limited_side():
+    bids = DepthLimitedSide(2, descending=True)
+    for price in (100, 99, 98, 97):
+        bids[price] = 1
+    assert list(bids) == [99, 100]
+    assert 97 in bids and bids[97] == 1
+    # SortedDict reads see the window
+    assert bids.peekitem() == (100, 1)
+    assert list(bids.irange(90, 99)) == [99]
+
+    # deep levels are updated in the overflow
+    bids[98] += 2
+    assert list(bids) == [99, 100]
+
+    # a better price pushes the worst level out of the window
+    bids[101] = 5
+    assert list(bids) == [100, 101]
+    assert bids.overflow == {99: 1, 98: 3, 97: 1}
+
+    # removing from the window brings the best overflow level back in
+    del bids[101]
+    assert list(bids) == [99, 100]
+    assert bids.pop(100) == 1
+    assert list(bids) == [98, 99] and bids[98] == 3
+
+    restored = pickle.loads(pickle.dumps(bids))
+    assert list(restored) == [98, 99] and restored.overflow == {97: 1}
+
+
+def test_depth_limited_side_bounded():
+    truncated = []
+    asks = DepthLimitedSide(5, descending=False)
+    asks.on_truncated = lambda: truncated.append(True)
+    for price in range(1, 10001):
+        asks[price] = 1
+        assert len(asks.window) + len(asks.overflow) <= 5 + 2 * asks.max_overflow
+        assert len(asks._heap) <= 2 * asks.max_overflow + 5
+    assert list(asks) == [1, 2, 3, 4, 5]
+    assert asks.pruned is not None and min(asks.overflow) == 6
+
+    # pruned levels are unknown, updates to them are ignored
+    asks[9000] = 3
+    assert 9000 not in asks and asks[9000] == 0
+    del asks[9000]
+    assert asks.pop(9000) == 0
+
+    # levels kept in the overflow refill the window, then the book runs short
+    kept = len(asks.overflow)
+    for price in range(1, kept + 1):
+        del asks[price]
+        assert not truncated
+    assert len(asks) == 5 and not asks.overflow
+    del asks[kept + 1]
+    assert truncated == [True]
+    del asks[asks.keys()[0]]
+    assert truncated == [True]
+
+    asks.clear()
+    assert asks.pruned is None and not asks.truncated
+
+
+def test_max_depth_window():
+    books = []
+
+    async def book(feed, pair, book):
+        books.append({side: list(book[side]) for side in (BID, ASK)})
+
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[L2_BOOK], callbacks={L2_BOOK: BookCallback(book)},
+                    max_depth={'BTC-USD': 1})
+
+    async def run():
+        await feed._book([1, [[100.0, 1, 1.0], [99.0, 1, 1.0], [101.0, 1, -1.0], [102.0, 1, -1.0]]], 'BTC-USD')
+        # best bid removed, 99 moves into the window
+        await feed._book([1, [100.0, 0, 1.0]], 'BTC-USD')
+
+    asyncio.new_event_loop().run_until_complete(run())
+    assert books == [{BID: [Decimal('100.0')], ASK: [Decimal('101.0')]},
+                     {BID: [Decimal('99.0')], ASK: [Decimal('101.0')]}]
+
+
+def test_l2_view_from_l3():
+    views = []
+
+    async def book(feed, pair, book):
+        views.append({side: dict(book[side]) for side in (BID, ASK)})
+
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[L3_BOOK], callbacks={L2_BOOK: BookCallback(book)},
+                    l2_tick_size=Decimal('1'))
+
+    async def run():
+        await feed._raw_book([1, [[1, 100.5, 1.0], [2, 100.2, 2.0], [3, 99.5, 1.0], [4, 101.5, -1.5]]], 'BTC-USD')
+        # order 2 moves into the 99 bucket
+        await feed._raw_book([1, [2, 99.9, 2.0]], 'BTC-USD')
+        # order 4 cancelled
+        await feed._raw_book([1, [4, 0, -1.0]], 'BTC-USD')
+
+    asyncio.new_event_loop().run_until_complete(run())
+    assert views == [{BID: {Decimal('100'): Decimal('3.0'), Decimal('99'): Decimal('1.0')}, ASK: {Decimal('102'): Decimal('1.5')}},
+                     {BID: {Decimal('100'): Decimal('1.0'), Decimal('99'): Decimal('3.0')}, ASK: {Decimal('102'): Decimal('1.5')}},
+                     {BID: {Decimal('100'): Decimal('1.0'), Decimal('99'): Decimal('3.0')}, ASK: {}}]
+
+
+def test_snapshot_is_isolated():
+    book = new_book(depth=2)
+    for price, size in ((100, 1), (99, 2), (98, 3)):
+        book[BID][price] = size
+    book[ASK][101] = 1
+
+    snap = snapshot(book)
+    del book[BID][100]
+    book[ASK][101] = 5
+
+    assert list(snap[BID]) == [99, 100]
+    assert snap[BID].peekitem() == (100, 1)
+    assert snap[ASK][101] == 1
+    assert 98 not in snap[BID]
+    assert list(book[BID]) == [98, 99]
+
+
+def test_snapshot_copy_on_write():
+    book = new_book()
+    for price in range(100):
+        book[BID][price] = 1
+
+    # snapshots read the side in place, until it changes
+    snap = snapshot(book)
+    assert snap[BID]._sizes is book[BID]
+    assert snapshot(book)[BID] is snap[BID]
+    book[BID][100] = 1
+    assert snap[BID]._sizes is not book[BID]
+    assert len(snap[BID]) == 100 and 100 not in snap[BID]
+    assert snap[BID].peekitem() == (99, 1)
+
+    # once nothing references a snapshot there is nothing to copy on change
+    view = ref(snapshot(book)[BID])
+    assert view() is None
+    book[BID][101] = 1
+    assert book[BID]._snapshot is None
+
+    copy = snapshot(snap, copy=True)
+    assert copy[BID]._sizes is not snap[BID]._sizes and list(copy[BID]) == list(snap[BID])
@@ -0,0 +1,178 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.book import BookSnapshot, new_book
+from cryptofeed.callback import (BookCallback, TradeCallback, L3BookUpdateCallback, VolumeCallback, FilteredCallback,
+                                 FanOut, IsolatedCallback, BookEvent, TradeEvent, DROP, DROP_OLDEST)
+from cryptofeed.defines import BID, ASK, L2_BOOK
+from cryptofeed.gdax.gdax import GDAX
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+@pytest.mark.parametrize('options, expected', [({'overflow': DROP}, [0, 1]),
+                                               ({'overflow': DROP_OLDEST}, [2, 3]),
+                                               # never holds up the feed by default
+                                               ({}, [2, 3])])
+def test_overflow(options, expected):
+    handled = []
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def slow(n):
+            await gate.wait()
+            handled.append(n)
+
+        callback = IsolatedCallback(slow, max_queue=2, **options)
+        for n in range(4):
+            await callback(n=n)
+        gate.set()
+        await callback.join()
+        callback.close()
+        return callback.stats()
+
+    stats = run(main())
+    assert handled == expected
+    assert stats['dropped'] == 2
+    assert stats['calls'] == 2
+
+
+def test_timeout_and_book_snapshot():
+    books = []
+
+    async def hang(feed, pair, book):
+        if not books:
+            books.append(None)
+            await asyncio.Event().wait()
+        books.append(book)
+
+    async def main():
+        callback = IsolatedCallback(BookCallback(hang), timeout=0.05)
+        book = new_book()
+        await callback(feed='GDAX', pair='BTC-USD', book=book)
+        book[BID][Decimal(1)] = Decimal(1)
+        await callback(feed='GDAX', pair='BTC-USD', book=book)
+        # queued books are copies
+        book[BID][Decimal(2)] = Decimal(1)
+        await callback.join()
+        callback.close()
+        return callback.stats()
+
+    stats = run(main())
+    assert stats['timeouts'] == 1
+    assert stats['calls'] == 2
+    assert list(books[1][BID]) == [Decimal(1)]
+
+
+def test_fan_out_shares_one_snapshot():
+    books = []
+
+    async def cb(feed, pair, book):
+        books.append(book)
+
+    feed = GDAX(pairs=['BTC-USD'], channels=[L2_BOOK], callbacks={L2_BOOK: [BookCallback(cb), BookCallback(cb)]})
+    feed.add_callback(L2_BOOK, BookCallback(cb))
+    assert isinstance(feed.callbacks[L2_BOOK], FanOut)
+
+    book = new_book()
+    book[BID][Decimal(1)] = Decimal(1)
+    run(feed.callbacks[L2_BOOK](feed='GDAX', pair='BTC-USD', book=book))
+    assert len(books) == 3
+    assert books[0] is books[1] is books[2]
+    assert isinstance(books[0], BookSnapshot)
+
+
+def test_book_callback_snapshot():
+    books = []
+
+    async def cb(feed, pair, book):
+        books.append(book)
+
+    book = new_book()
+    book[BID][Decimal(1)] = Decimal(1)
+    run(BookCallback(cb)(feed='GDAX', pair='BTC-USD', book=book))
+    run(BookCallback(cb)(feed='GDAX', pair='BTC-USD', book=book))
+    assert isinstance(books[0], BookSnapshot)
+    # the unchanged book is viewed once
+    assert books[0][BID] is books[1][BID]
+    book[BID][Decimal(2)] = Decimal(1)
+    assert list(books[1][BID]) == [Decimal(1)]
+
+
+def test_filtered_callback():
+    trades = []
+
+    async def cb(feed, pair, id, timestamp, side, amount, price):
+        trades.append((pair, side, amount))
+
+    callback = FilteredCallback(TradeCallback(cb), pairs=['BTC-USD'], sides=[BID], min_size=Decimal(1))
+
+    async def main():
+        await callback(feed='GDAX', pair='BTC-USD', side='buy', amount=Decimal(2), price=Decimal(1))
+        await callback(feed='GDAX', pair='ETH-USD', side=BID, amount=Decimal(2), price=Decimal(1))
+        await callback(feed='GDAX', pair='BTC-USD', side=ASK, amount=Decimal(2), price=Decimal(1))
+        await callback(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal('0.5'), price=Decimal(1))
+
+    run(main())
+    assert trades == [('BTC-USD', 'buy', Decimal(2))]
+
+
+def test_events():
+    events = []
+
+    async def cb(event):
+        events.append((event, event.pair, event.amount))
+
+    def sync_cb(event):
+        events.append((event, event.msg_type, event.size))
+
+    trades = TradeCallback(cb, events=True)
+    updates = L3BookUpdateCallback(sync_cb, events=True)
+
+    async def main():
+        for _ in range(2):
+            await trades(feed='GDAX', pair='BTC-USD', side=BID, amount=Decimal(len(events)), price=Decimal(1))
+        await updates(feed='GDAX', pair='BTC-USD', msg_type='open', timestamp=None, sequence=1, side=ASK,
+                      price=Decimal(1), size=Decimal(3))
+
+    run(main())
+    assert isinstance(events[0][0], TradeEvent)
+    assert [amount for _, _, amount in events[:2]] == [0, 1]
+    assert events[2][1:] == ('open', Decimal(3))
+    assert events[2][0]._asdict()['sequence'] == 1
+
+    with pytest.raises(ValueError):
+        VolumeCallback(cb, events=True)
+
+
+def test_fan_out_shares_one_event():
+    events = []
+    calls = []
+
+    async def event_cb(event):
+        events.append(event)
+
+    async def cb(feed, pair, book):
+        calls.append((feed, pair, book))
+
+    feed = GDAX(pairs=['BTC-USD'], channels=[L2_BOOK],
+                callbacks={L2_BOOK: [BookCallback(event_cb, events=True), BookCallback(cb)]})
+    feed.add_callback(L2_BOOK, FanOut([BookCallback(event_cb, events=True)]))
+
+    book = new_book()
+    book[BID][Decimal(1)] = Decimal(1)
+    run(feed.callbacks[L2_BOOK](feed='GDAX', pair='BTC-USD', book=book))
+    assert len(events) == 2 and events[0] is events[1]
+    assert isinstance(events[0], BookEvent) and events[0].pair == 'BTC-USD'
+    assert calls[0][2] is events[0].book
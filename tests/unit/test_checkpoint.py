@@ -0,0 +1,104 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed import checkpoint
+from cryptofeed.callback import BookCallback, L3BookCallback
+from cryptofeed.defines import BID, ASK, L2_BOOK, L3_BOOK, L3_BOOK_UPDATE
+from cryptofeed.feedhandler import FeedHandler
+from cryptofeed.gdax.gdax import GDAX
+
+
+def test_warm_restart(tmpdir):
+    path = str(tmpdir.join('books.ckpt'))
+    feed = GDAX(pairs=['BTC-USD', 'ETH-USD'], channels=[L2_BOOK])
+    feed.l2_book['BTC-USD'] = feed._new_book('BTC-USD')
+    feed.l2_book['BTC-USD'][BID][Decimal('100')] = Decimal('1.5')
+    feed.l2_book['BTC-USD'][ASK][Decimal('101')] = Decimal('2')
+    feed.l2_book['ETH-USD'] = feed._new_book('ETH-USD')
+    feed.book['BTC-USD'] = feed._new_book('BTC-USD', l3=True)
+    feed.book['BTC-USD'][ASK][Decimal('102')] = Decimal('3')
+    feed.seq_no['BTC-USD'] = 42
+    checkpoint.save(path, checkpoint.state([feed]))
+
+    received = []
+
+    async def l2(feed, pair, book):
+        received.append((L2_BOOK, pair, book))
+
+    async def l3(feed, pair, timestamp, sequence, book):
+        received.append((L3_BOOK, pair, sequence, book))
+
+    handler = FeedHandler(checkpoint=path)
+    handler.add_feed(GDAX(pairs=['BTC-USD'], channels=[L2_BOOK],
+                          callbacks={L2_BOOK: BookCallback(l2), L3_BOOK: L3BookCallback(l3)}))
+    asyncio.new_event_loop().run_until_complete(handler._restore())
+
+    # empty books and pairs the feed does not subscribe to are not delivered
+    assert len(received) == 2
+    (_, pair, book), (_, _, sequence, l3_book) = sorted(received, key=lambda event: event[0])
+    assert pair == 'BTC-USD'
+    assert book.stale and l3_book.stale
+    assert dict(book[BID]) == {Decimal('100'): Decimal('1.5')}
+    assert list(l3_book[ASK].items()) == [(Decimal('102'), Decimal('3'))]
+    assert sequence == 42
+
+
+class Websocket:
+    async def send(self, message):
+        pass
+
+
+@pytest.mark.parametrize('sequence, resumed', [(43, True), (45, False)])
+def test_resume_full_book(tmpdir, sequence, resumed):
+    path = str(tmpdir.join('books.ckpt'))
+    feed = GDAX(pairs=['BTC-USD'], channels=[L3_BOOK_UPDATE])
+    feed.book['BTC-USD'] = feed._new_book('BTC-USD', l3=True)
+    for order_id, price in (('a', '100'), ('b', '100')):
+        feed.orders.add('BTC-USD', order_id, BID, Decimal(price), Decimal('1'))
+        feed.book['BTC-USD'][BID][Decimal(price)] = feed.book['BTC-USD'][BID].get(Decimal(price), 0) + 1
+    feed.seq_no['BTC-USD'] = 42
+    checkpoint.save(path, checkpoint.state([feed]))
+
+    feed = GDAX(pairs=['BTC-USD'], channels=[L3_BOOK_UPDATE])
+    snapshots = []
+
+    async def snapshot(pair, **kwargs):
+        snapshots.append(pair)
+        feed.book[pair] = feed._new_book(pair, l3=True)
+        feed.orders.reset(pair)
+        feed.seq_no[pair] = sequence
+    feed._book_snapshot = snapshot
+
+    async def run():
+        await feed.restore(checkpoint.load(path))
+        await feed.subscribe(Websocket())
+        # no snapshot while the restored book may still be current
+        assert snapshots == []
+        await feed.message_handler(json.dumps({'type': 'done', 'product_id': 'BTC-USD', 'sequence': sequence,
+                                               'order_id': 'a', 'price': '100', 'side': 'buy',
+                                               'reason': 'canceled', 'time': '2018-05-21T00:26:05.585000Z'}))
+
+    asyncio.new_event_loop().run_until_complete(run())
+    if resumed:
+        assert snapshots == []
+        assert dict(feed.book['BTC-USD'][BID]) == {Decimal('100'): Decimal('1')}
+        assert feed.seq_no['BTC-USD'] == 43
+    else:
+        # messages were missed while down, the restored book is rejected
+        assert snapshots == ['BTC-USD']
+
+
+def test_missing_or_corrupt(tmpdir):
+    path = tmpdir.join('books.ckpt')
+    assert checkpoint.load(str(path)) is None
+    path.write(b'not a checkpoint')
+    assert checkpoint.load(str(path)) is None
@@ -0,0 +1,127 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import zlib
+from decimal import Decimal
+
+import requests
+from sortedcontainers import SortedDict as sd
+
+from cryptofeed import Bitfinex, Bitmex, GDAX, metadata
+from cryptofeed.defines import BID, ASK, L2_BOOK, L3_BOOK
+from cryptofeed.integrity import crossed, diff, bitfinex_checksum
+
+
+def book(bids, asks):
+    return {BID: sd({Decimal(p): Decimal(s) for p, s in bids}),
+            ASK: sd({Decimal(p): Decimal(s) for p, s in asks})}
+
+
+def test_crossed():
+    assert not crossed(book([('99', '1')], [('100', '1')]))
+    assert crossed(book([('100', '1')], [('100', '1')]))
+    assert crossed(book([('101', '1')], [('100', '1')]))
+    assert not crossed(book([], [('100', '1')]))
+
+
+def test_diff():
+    ours = book([('99', '1'), ('98', '2'), ('97', '1')], [('100', '1'), ('101', '3')])
+    theirs = book([('99', '1'), ('98', '1.5')], [('100', '1'), ('101', '3'), ('102', '1')])
+    # 97 is beyond the snapshot's bid depth, 102 beyond ours on the ask side
+    assert diff(ours, theirs, depth=2) == {(BID, Decimal('98')): (Decimal('2'), Decimal('1.5'))}
+    assert diff(ours, ours) == {}
+
+
+def test_bitfinex_checksum():
+    b = book([('100', '1'), ('99', '2')], [('101', '0.5')])
+    expected = zlib.crc32(b'100:1:101:-0.5:99:2')
+    if expected & (1 << 31):
+        expected -= 1 << 32
+    assert bitfinex_checksum(b) == expected
+
+    # numbers are formatted like javascript's, not Decimal's 1E-8 and 2.50
+    b = book([('100', '0.00000001')], [('101.10', '2.50')])
+    expected = zlib.crc32(b'100:1e-8:101.1:-2.5')
+    if expected & (1 << 31):
+        expected -= 1 << 32
+    assert bitfinex_checksum(b) == expected
+
+
+def test_bitfinex_checksum_mismatch_resyncs():
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[L2_BOOK], check_integrity=True)
+    resynced = []
+
+    async def resync(pair):
+        resynced.append(pair)
+    feed._resync = resync
+
+    async def run():
+        await feed._book([1, [[100.0, 1, 1.0], [101.0, 1, -0.5]]], 'BTC-USD')
+        await feed._book([1, 'cs', bitfinex_checksum(feed.l2_book['BTC-USD'])], 'BTC-USD')
+        assert resynced == []
+        await feed._book([1, 'cs', 12345], 'BTC-USD')
+
+    asyncio.new_event_loop().run_until_complete(run())
+    assert resynced == ['BTC-USD']
+
+
+def test_gdax_verification(monkeypatch):
+    feed = GDAX(pairs=['BTC-USD'], channels=[L3_BOOK])
+    feed.book['BTC-USD'] = book([('99', '1')], [('100', '2')])
+    feed.seq_no['BTC-USD'] = 10
+    resynced = []
+
+    async def resync(pair):
+        resynced.append(pair)
+    feed._resync = resync
+
+    # the first snapshot is behind the feed and is refetched
+    responses = [{'sequence': 8, 'bids': [], 'asks': []},
+                 {'sequence': 12, 'bids': [['99', '1', 1]], 'asks': [['100', '1', 1]]}]
+
+    class Response:
+        def __init__(self, levels):
+            self.levels = levels
+
+        def json(self):
+            return self.levels
+    monkeypatch.setattr(requests, 'get', lambda url: Response(responses.pop(0)))
+
+    async def run():
+        await feed._verify_book('BTC-USD')
+        assert responses == []
+        assert feed.pending_verify['BTC-USD'][0] == 12
+        await feed._verify_pending('BTC-USD', 11)
+        assert resynced == []
+        await feed._verify_pending('BTC-USD', 12)
+
+    asyncio.new_event_loop().run_until_complete(run())
+    assert resynced == ['BTC-USD']
+    assert feed.pending_verify == {}
+
+
+def test_bitmex_verification(monkeypatch):
+    monkeypatch.setattr(metadata, 'instruments', lambda *args, **kwargs: {'XBTUSD': {}})
+    feed = Bitmex(pairs=['XBTUSD'], channels=[L2_BOOK])
+    feed.partial_received.add('XBTUSD')
+    feed.l2_book['XBTUSD'] = book([('99', '1')], [('100', '2')])
+    resynced = []
+
+    async def resync(pair):
+        resynced.append(pair)
+    feed._resync = resync
+
+    # a difference that is gone on the second fetch was a race with the stream
+    snapshots = [book([('99', '1')], [('100', '1')]), book([('99', '1')], [('100', '2')]),
+                 book([('99', '1')], [('100', '1')]), book([('99', '1')], [('100', '1')])]
+    feed._rest_book = lambda pair, depth: snapshots.pop(0)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(feed._verify_book('XBTUSD', delay=0))
+    assert resynced == []
+    loop.run_until_complete(feed._verify_book('XBTUSD', delay=0))
+    assert resynced == ['XBTUSD']
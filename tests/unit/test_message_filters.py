@@ -0,0 +1,59 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+
+from cryptofeed import Bitfinex, GDAX, Poloniex
+from cryptofeed.callback import TickerCallback
+from cryptofeed.defines import TRADES, TICKER
+
+
+class Websocket:
+    async def send(self, message):
+        pass
+
+
+def test_bitfinex_ignored():
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[TRADES])
+    assert feed.ignored('[17,"hb"]')
+    assert feed.ignored('[17,"tu",[1,1527000000000,0.5,8000]]')
+    assert not feed.ignored('[17,"te",[1,1527000000000,0.5,8000]]')
+    assert not feed.ignored('[17,[8000,1,0.5]]')
+
+
+def test_poloniex_ignored():
+    feed = Poloniex(channels=['USDT-BTC'])
+    assert feed.ignored('[1010]')
+    assert not feed.ignored('[1002,null,[121,"1","2","3","0","0","0",0,"0","0"]]')
+
+
+def test_gdax_raw_sequence():
+    feed = GDAX(pairs=['BTC-USD'], channels=[TRADES])
+    msg = '{"type":"received","order_id":"abc","product_id":"BTC-USD","sequence":10,"side":"buy"}'
+    assert feed.ignored(msg)
+    assert feed._raw_sequence(msg) == ('BTC-USD', 10)
+    assert feed._raw_sequence('{"type":"activate","product_id":"ETH-USD","sequence":11}') == ('ETH-USD', 11)
+    assert not feed.ignored('{"type":"match","product_id":"BTC-USD","sequence":12}')
+
+
+def test_gdax_replays_dropped_without_full():
+    tickers = []
+
+    async def ticker(feed, pair, bid, ask):
+        tickers.append(bid)
+
+    feed = GDAX(pairs=['BTC-USD'], channels=[TICKER], callbacks={TICKER: TickerCallback(ticker)})
+
+    async def run():
+        await feed.subscribe(Websocket())
+        for sequence in (5, 5, 4, 9):
+            await feed.message_handler(json.dumps({'type': 'ticker', 'product_id': 'BTC-USD', 'sequence': sequence,
+                                                   'best_bid': str(sequence), 'best_ask': '10'}))
+
+    asyncio.new_event_loop().run_until_complete(run())
+    # gaps are expected without the full channel, replays are not
+    assert tickers == [5, 9]
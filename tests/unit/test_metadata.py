@@ -0,0 +1,46 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import json
+from decimal import Decimal
+
+from cryptofeed import metadata
+from cryptofeed.standards import pair_exchange_to_std
+
+
+def fake_hitbtc():
+    return {'NEWBTC': {'pair': 'NEW-BTC', 'tick_size': '0.000001', 'lot_size': '0.01', 'status': 'Open'}}
+
+
+def test_instruments_fetch_once(tmpdir, monkeypatch):
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        return fake_hitbtc()
+
+    monkeypatch.setitem(metadata._fetchers, 'HITBTC', fetcher)
+    path = str(tmpdir.join('symbols.json'))
+
+    first = metadata.instruments('HITBTC', path=path)
+    second = metadata.instruments('HITBTC', path=path)
+    assert len(calls) == 1
+    assert first == second
+    assert second['NEWBTC']['tick_size'] == Decimal('0.000001')
+    assert pair_exchange_to_std('NEWBTC', 'HITBTC') == 'NEW-BTC'
+
+
+def test_instruments_no_fetch(tmpdir):
+    path = str(tmpdir.join('symbols.json'))
+    assert metadata.instruments('HITBTC', path=path, allow_fetch=False) == {}
+
+
+def test_version_mismatch_ignored(tmpdir):
+    path = str(tmpdir.join('symbols.json'))
+    with open(path, 'w') as fp:
+        json.dump({'version': metadata.CACHE_VERSION + 1,
+                   'exchanges': {'HITBTC': {'timestamp': 0, 'instruments': fake_hitbtc()}}}, fp)
+    assert metadata.load(path) == {}
@@ -0,0 +1,68 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+from cryptofeed import Bitfinex
+from cryptofeed.defines import BID, ASK, L3_BOOK
+from cryptofeed.orders import OrderStore
+
+
+def test_order_store_partitions():
+    store = OrderStore()
+    store.add('BTC-USD', 'a', BID, Decimal('100'), Decimal('1'))
+    store.add('ETH-USD', 'a', ASK, Decimal('10'), Decimal('2'))
+    assert len(store) == 2
+    assert store.get('BTC-USD', 'a').price == Decimal('100')
+    assert store.get('LTC-USD', 'a') is None
+
+    store.reset('BTC-USD')
+    assert store.get('BTC-USD', 'a') is None
+    assert store.pop('ETH-USD', 'a').size == Decimal('2')
+    assert len(store) == 0
+
+
+def test_bitfinex_raw_book_order_update():
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[L3_BOOK])
+
+    async def run():
+        await feed._raw_book([1, [[1, 100.0, 1.0], [2, 100.0, 2.0], [3, 101.0, -1.5]]], 'BTC-USD')
+        # order 1 moves to 99
+        await feed._raw_book([1, [1, 99.0, 0.5]], 'BTC-USD')
+        # order 3 cancelled
+        await feed._raw_book([1, [3, 0, -1.0]], 'BTC-USD')
+
+    asyncio.new_event_loop().run_until_complete(run())
+    book = feed.l2_book['BTC-USD']
+    assert dict(book[BID]) == {Decimal('100.0'): Decimal('2.0'), Decimal('99.0'): Decimal('0.5')}
+    assert dict(book[ASK]) == {}
+    assert len(feed.orders) == 2
+
+
+def test_queue_position():
+    store = OrderStore(track_queue=True)
+    for order_id, size in (('a', '1'), ('b', '2'), ('c', '3')):
+        store.add('BTC-USD', order_id, BID, Decimal('100'), Decimal(size))
+    store.add('BTC-USD', 'd', BID, Decimal('99'), Decimal('1'))
+
+    assert store.queue_position('BTC-USD', 'a') == (0, 0)
+    assert store.queue_position('BTC-USD', 'c') == (2, Decimal('3'))
+    assert store.queue_position('BTC-USD', 'd') == (0, 0)
+
+    store.pop('BTC-USD', 'b')
+    assert store.queue_position('BTC-USD', 'c') == (1, Decimal('1'))
+    store.get('BTC-USD', 'a').size = Decimal('0.5')
+    assert store.queue_position('BTC-USD', 'c') == (1, Decimal('0.5'))
+    store.add('BTC-USD', 'e', BID, Decimal('100'), Decimal('1'))
+    assert [order.size for order in store.level('BTC-USD', BID, Decimal('100'))] == \
+        [Decimal('0.5'), Decimal('3'), Decimal('1')]
+
+    store.pop('BTC-USD', 'a')
+    store.pop('BTC-USD', 'c')
+    store.pop('BTC-USD', 'e')
+    assert store.level('BTC-USD', BID, Decimal('100')) is None
+    assert store.queue_position('BTC-USD', 'a') is None
@@ -4,7 +4,9 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-from cryptofeed.standards import pair_exchange_to_std, pair_std_to_exchange
+import pytest
+
+from cryptofeed.standards import pair_exchange_to_std, pair_std_to_exchange, SymbolRegistry
 from cryptofeed.gdax.pairs import gdax_trading_pairs
 from cryptofeed.poloniex.pairs import poloniex_trading_pairs
 from cryptofeed.bitfinex.pairs import bitfinex_trading_pairs
@@ -45,4 +47,25 @@ def test_gemini_pair_conversions():
 def test_bitstamp_pair_conversions():
     for pair in bitstamp_trading_pairs:
         std = pair_exchange_to_std(pair)
-        assert(pair == pair_std_to_exchange(std, 'BITSTAMP'))
\ No newline at end of file
+        assert(pair == pair_std_to_exchange(std, 'BITSTAMP'))
+
+def test_registry_loads_exchanges_lazily():
+    registry = SymbolRegistry()
+    assert registry.std_to_exchange('BTC-USD', 'BITFINEX') == 'tBTCUSD'
+    assert list(registry._std_to_exchange) == ['BITFINEX']
+    assert registry.exchange_to_std('tBTCUSD', 'BITFINEX') == 'BTC-USD'
+    assert registry.exchange_to_std('tBTCUSD', 'GDAX') is None
+
+
+def test_registry_interns_pairs():
+    registry = SymbolRegistry()
+    gdax = registry.exchange_to_std('BTC-USD', 'GDAX')
+    hitbtc = registry.exchange_to_std('BTCUSD', 'HITBTC')
+    assert gdax is hitbtc
+
+
+def test_unlisted_pair_conversions():
+    assert pair_std_to_exchange('NOT-APAIR', 'GDAX') is None
+    with pytest.raises(KeyError):
+        pair_std_to_exchange('USDT-BTC', 'GDAX')
+    assert pair_exchange_to_std('USDT_BTC') == 'USDT-BTC'
@@ -0,0 +1,95 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.book import new_book
+from cryptofeed.defines import BID, ASK, TRADES, L2_BOOK, VOLUME
+from cryptofeed.pubsub import EventPublisher, EventSubscriber
+
+
+def test_fan_out(tmpdir):
+    path = str(tmpdir.join('events.sock'))
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    publisher = EventPublisher(path=path)
+    trades = publisher.callback(TRADES)
+    books = publisher.callback(L2_BOOK)
+    book = new_book()
+    book[BID][Decimal('100')] = Decimal('1')
+    book[ASK][Decimal('101')] = Decimal('2')
+
+    async def run():
+        await publisher.start()
+        # a book published before anyone subscribed is sent as a snapshot on subscribe
+        await books(feed='GDAX', pair='BTC-USD', book=book)
+        everything = EventSubscriber(path=path)
+        btc_trades = EventSubscriber(['trades.GDAX.BTC-USD'], path=path)
+        for subscriber in (everything, btc_trades):
+            await subscriber.connect()
+        while len(publisher.subscribers) < 2:
+            await asyncio.sleep(0.01)
+
+        await trades(feed='GDAX', pair='ETH-USD', side=BID, amount=Decimal('1'), price=Decimal('10'), id=1)
+        await trades(feed='GDAX', pair='BTC-USD', side=ASK, amount=Decimal('2'), price=Decimal('100'), id=2)
+        book[BID][Decimal('100')] = Decimal('3')
+        del book[ASK][Decimal('101')]
+        await books(feed='GDAX', pair='BTC-USD', book=book)
+        # unchanged book is not republished
+        await books(feed='GDAX', pair='BTC-USD', book=book)
+        # channels without wire records are sent as JSON
+        await publisher.callback(VOLUME)(feed='POLONIEX', BTC_ETH={'BTC': Decimal('1.5')})
+
+        received = [await everything.recv() for _ in range(5)]
+        assert [topic for topic, _ in received] == ['l2_book.GDAX.BTC-USD', 'trades.GDAX.ETH-USD',
+                                                    'trades.GDAX.BTC-USD', 'l2_book.GDAX.BTC-USD', 'volume.POLONIEX']
+        assert received[0][1][BID] == [(Decimal('100'), Decimal('1'))]
+        # live events carry their frame's receipt, catch up snapshots don't
+        assert 'receipt' not in received[0][1]
+        assert all(isinstance(event.pop('receipt'), int) for _, event in received[1:])
+        assert received[3][1] == {'feed': 'GDAX', 'pair': 'BTC-USD', 'type': 'delta', 'timestamp': None,
+                                  BID: [(Decimal('100'), Decimal('3'))], ASK: [(Decimal('101'), 0)]}
+        assert received[4][1] == {'feed': 'POLONIEX', 'BTC_ETH': {'BTC': '1.5'}}
+        # names first used for ETH-USD reach subscribers that filter its topic out
+        topic, trade = await btc_trades.recv()
+        assert topic == 'trades.GDAX.BTC-USD'
+        # a pair name too long for the wire format is skipped, not raised
+        await trades(feed='GDAX', pair='X' * 25, side=BID, amount=Decimal('1'), price=Decimal('1'))
+        assert publisher.rejected == {('GDAX', 'X' * 25)}
+        assert trade['id'] == 2 and trade['price'] == Decimal('100') and trade['side'] == ASK
+        for subscriber in (everything, btc_trades):
+            subscriber.close()
+        publisher.close()
+        await asyncio.sleep(0.05)
+
+    loop.run_until_complete(run())
+
+
+def test_slow_subscriber_dropped(tmpdir):
+    path = str(tmpdir.join('events.sock'))
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    publisher = EventPublisher(path=path, max_buffer=10)
+    trades = publisher.callback(TRADES)
+
+    async def run():
+        await publisher.start()
+        subscriber = EventSubscriber(path=path)
+        await subscriber.connect()
+        while not publisher.subscribers:
+            await asyncio.sleep(0.01)
+        await trades(feed='GDAX', pair='BTC-USD', side=ASK, amount=Decimal('2'), price=Decimal('100'))
+        assert not publisher.subscribers
+        with pytest.raises(asyncio.IncompleteReadError):
+            await subscriber.recv()
+        subscriber.close()
+        publisher.close()
+        await asyncio.sleep(0.05)
+
+    loop.run_until_complete(run())
@@ -0,0 +1,77 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+from cryptofeed.book import new_book
+from cryptofeed.defines import BID, ASK
+from cryptofeed.shm import BookPublisher, BookReader, SEQUENCE
+
+
+def test_publish_and_read(tmpdir):
+    path = str(tmpdir.join('books'))
+    publisher = BookPublisher(path, depth=2, max_books=2)
+    book = new_book()
+    for price, size in (('100', '1'), ('99.5', '2'), ('99', '3')):
+        book[BID][Decimal(price)] = Decimal(size)
+    book[ASK][Decimal('101')] = Decimal('0.25')
+
+    asyncio.new_event_loop().run_until_complete(publisher(feed='GDAX', pair='BTC-USD', book=book))
+    publisher.publish('BITFINEX', 'BTC-USD', book)
+    # no slot left
+    publisher.publish('GEMINI', 'BTC-USD', book)
+
+    reader = BookReader(path)
+    assert sorted(reader.books()) == [('BITFINEX', 'BTC-USD'), ('GDAX', 'BTC-USD')]
+    sequence, timestamp, published = reader.read('GDAX', 'BTC-USD')
+    assert sequence == 2
+    assert published == {BID: [(100.0, 1.0), (99.5, 2.0)], ASK: [(101.0, 0.25)]}
+    assert reader.read('GEMINI', 'BTC-USD') is None
+
+    del book[BID][Decimal('100')]
+    publisher.publish('GDAX', 'BTC-USD', book)
+    sequence, _, published = reader.read('GDAX', 'BTC-USD')
+    assert sequence == 4
+    assert published[BID] == [(99.5, 2.0), (99.0, 3.0)]
+
+    # a slot left mid-write is not read
+    SEQUENCE.pack_into(publisher.mm, publisher.slots[('GDAX', 'BTC-USD')], 5)
+    assert reader.read('GDAX', 'BTC-USD') is None
+    reader.close()
+    publisher.close()
+
+
+def test_publisher_restart(tmpdir):
+    path = str(tmpdir.join('books'))
+    book = new_book()
+    book[BID][Decimal('100')] = Decimal('1')
+    publisher = BookPublisher(path, depth=2, max_books=2)
+    publisher.publish('GDAX', 'BTC-USD', book)
+    publisher.publish('GDAX', 'ETH-USD', book)
+    reader = BookReader(path)
+    assert reader.read('GDAX', 'ETH-USD')[2][BID] == [(100.0, 1.0)]
+    publisher.close()
+
+    # same layout, the file is reused and slots are handed out in a new order
+    publisher = BookPublisher(path, depth=2, max_books=2)
+    book[BID][Decimal('100')] = Decimal('2')
+    publisher.publish('GDAX', 'ETH-USD', book)
+    assert reader.read('GDAX', 'ETH-USD')[2][BID] == [(100.0, 2.0)]
+    assert reader.read('GDAX', 'BTC-USD') is None
+    publisher.close()
+
+    # a different layout replaces the file, the reader reopens it
+    publisher = BookPublisher(path, depth=3, max_books=2)
+    publisher.publish('GDAX', 'BTC-USD', book)
+    assert reader.read('GDAX', 'BTC-USD')[2][BID] == [(100.0, 2.0)]
+    assert reader.depth == 3
+
+    # names that do not fit a slot are not published
+    publisher.publish('GDAX', 'A-VERY-LONG-PAIR-NAME', book)
+    assert ('GDAX', 'A-VERY-LONG-PAIR-NAME') not in publisher.slots
+    reader.close()
+    publisher.close()
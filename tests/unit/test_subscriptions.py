@@ -0,0 +1,156 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import json
+
+import pytest
+
+from cryptofeed import metadata
+from cryptofeed.bitfinex.bitfinex import Bitfinex
+from cryptofeed.bitmex.bitmex import Bitmex
+from cryptofeed.bitstamp.bitstamp import Bitstamp
+from cryptofeed.defines import L2_BOOK, L3_BOOK, TRADES, TICKER
+from cryptofeed.feedhandler import FeedHandler
+from cryptofeed.gdax.gdax import GDAX
+
+
+class Websocket:
+    open = True
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def test_gdax():
+    feed = GDAX(pairs=['BTC-USD'], channels=[L2_BOOK, TRADES])
+    websocket = Websocket()
+
+    async def go():
+        await feed.subscribe(websocket)
+        await feed.add_subscriptions(pairs=['ETH-USD'], channels=[TICKER])
+        await feed.message_handler(json.dumps({'type': 'snapshot', 'product_id': 'ETH-USD',
+                                               'bids': [['10', '1']], 'asks': [['11', '1']]}))
+        assert 'ETH-USD' in feed.l2_book
+        await feed.remove_subscriptions(pairs=['ETH-USD'])
+        # in flight for the removed pair
+        await feed.message_handler(json.dumps({'type': 'l2update', 'product_id': 'ETH-USD',
+                                               'changes': [['buy', '10', '2']]}))
+    run(go())
+
+    assert websocket.sent[1:] == [
+        {'type': 'subscribe', 'product_ids': ['ETH-USD'], 'channels': ['level2', 'matches', 'ticker']},
+        {'type': 'subscribe', 'product_ids': ['BTC-USD'], 'channels': ['ticker']},
+        {'type': 'unsubscribe', 'product_ids': ['ETH-USD'], 'channels': ['level2', 'matches', 'ticker']}]
+    assert 'ETH-USD' not in feed.l2_book
+    assert feed.pairs == feed.standardized_pairs == ['BTC-USD']
+    assert feed.standardized_channels == [L2_BOOK, TRADES, TICKER]
+
+
+def test_gdax_l3_tasks():
+    feed = GDAX(pairs=['BTC-USD'], channels=[L3_BOOK])
+
+    async def go():
+        await feed.subscribe(Websocket())
+        task = feed._pair_tasks[(L3_BOOK, 'BTC-USD')]
+        await feed.remove_subscriptions(channels=[L3_BOOK])
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert feed._pair_tasks == {}
+    run(go())
+
+
+def test_bitfinex():
+    feed = Bitfinex(pairs=['BTC-USD'], channels=[TRADES, L2_BOOK])
+    websocket = Websocket()
+
+    async def go():
+        await feed.subscribe(websocket)
+        await feed.message_handler(json.dumps({'event': 'subscribed', 'channel': 'trades', 'chanId': 1,
+                                               'symbol': 'tBTCUSD', 'pair': 'BTCUSD'}))
+        await feed.message_handler(json.dumps({'event': 'subscribed', 'channel': 'book', 'chanId': 2,
+                                               'symbol': 'tBTCUSD', 'prec': 'P0', 'freq': 'F0', 'len': '25'}))
+        await feed.message_handler('[2,[[100,1,1],[101,1,-1]]]')
+        await feed.remove_subscriptions(channels=[L2_BOOK])
+        # in flight on the unsubscribed channel
+        await feed.message_handler('[2,[100,1,2]]')
+    run(go())
+
+    assert websocket.sent[-1] == {'event': 'unsubscribe', 'chanId': 2}
+    assert list(feed.channel_map) == [1]
+    assert feed.l2_book == {}
+    assert feed.channels == ['trades']
+
+
+def test_bitmex_new_listing(monkeypatch):
+    listing = {'tick_size': 1, 'lot_size': 1, 'status': 'Open', 'pair': None}
+    monkeypatch.setattr(metadata, 'instruments', lambda *args, **kwargs: {'XBTUSD': listing})
+    feed = Bitmex(pairs=['XBTUSD'], channels=[TRADES])
+    websocket = Websocket()
+
+    def blocking(*args, **kwargs):
+        raise AssertionError("blocking metadata fetch on the event loop")
+
+    async def refresh(exchange):
+        return {'XBTUSD': listing, 'XBTZ18': listing}
+
+    monkeypatch.setattr(metadata, 'instruments', blocking)
+    monkeypatch.setattr(metadata, 'refresh', refresh)
+
+    async def go():
+        await feed.subscribe(websocket)
+        await feed.add_subscriptions(pairs=['XBTZ18'])
+        with pytest.raises(ValueError):
+            await feed.add_subscriptions(pairs=['XBTH19'])
+    run(go())
+
+    assert websocket.sent[-1] == {'op': 'subscribe', 'args': ['trade:XBTZ18']}
+    assert feed.pairs == ['XBTUSD', 'XBTZ18']
+
+
+def test_live_feed_without_support():
+    feed = Bitstamp(pairs=['BTC-USD'], channels=[TRADES])
+    feed.websocket = Websocket()
+    with pytest.raises(NotImplementedError):
+        run(feed.add_subscriptions(pairs=['ETH-USD']))
+    assert feed.standardized_pairs == ['BTC-USD']
+    # before it connects the feed is just reconfigured
+    feed.websocket = None
+    run(feed.add_subscriptions(pairs=['ETH-USD']))
+    assert feed.pairs == ['btcusd', 'ethusd']
+
+
+def test_add_remove_feeds():
+    handler = FeedHandler()
+    connected = []
+
+    async def connect(feed):
+        connected.append(feed)
+        await asyncio.sleep(60)
+
+    handler._connect = connect
+    first = GDAX(pairs=['BTC-USD'], channels=[TRADES])
+    second = GDAX(pairs=['ETH-USD'], channels=[TRADES])
+    handler.add_feed(first)
+
+    async def go():
+        running = asyncio.ensure_future(handler._run())
+        await asyncio.sleep(0.01)
+        handler.add_feed(second)
+        await asyncio.sleep(0.01)
+        assert connected == [first, second]
+        handler.remove_feed(first)
+        handler.remove_feed(second)
+        await asyncio.wait_for(running, 1)
+    run(go())
+    assert handler.feeds == [] and not handler.running
@@ -0,0 +1,93 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.backends.tickstore import TickStoreWriter, TICK, INDEX_ENTRY
+from cryptofeed.defines import BID, ASK, TRADES, TICKER, L2_BOOK, L3_BOOK_UPDATE
+from cryptofeed.wire import SCALE, TRADE, TICKER_RECORD
+
+
+START = datetime(2018, 6, 1, 14, 0, tzinfo=timezone.utc).timestamp()
+NS = 1000000000
+
+
+def trades(receipts):
+    receipts = [int(receipt * NS) for receipt in receipts]
+    return {'receipt': receipts, 'timestamp': [None] * len(receipts), 'feed': [], 'pair': [],
+            'id': list(range(len(receipts))), 'side': [BID, ASK] * (len(receipts) // 2),
+            'amount': [Decimal('0.5')] * len(receipts), 'price': [Decimal(100 + i) for i in range(len(receipts))]}
+
+
+def test_append_and_index(tmpdir):
+    writer = TickStoreWriter(str(tmpdir), index_interval=4)
+    writer.write(TRADES, 'GDAX', 'BTC-USD', trades([START + i for i in range(6)]))
+    writer.write(TRADES, 'GDAX', 'BTC-USD', trades([START + 6 + i for i in range(4)]))
+    writer.close()
+
+    path = os.path.join(str(tmpdir), 'GDAX', 'BTC-USD', TRADES, '2018-06-01')
+    assert os.path.getsize(path + '.ticks') == 10 * TICK.size
+    with open(path + '.index', 'rb') as fp:
+        index = [entry for entry in INDEX_ENTRY.iter_unpack(fp.read())]
+    assert [record for _, record in index] == [0, 4, 8]
+    assert index[1][0] == int((START + 4) * NS)
+
+    with pytest.raises(ValueError):
+        writer.callback(L3_BOOK_UPDATE)
+
+
+def test_query(tmpdir):
+    np = pytest.importorskip('numpy')
+    from cryptofeed.backends.tickstore import TickStore
+
+    writer = TickStoreWriter(str(tmpdir), index_interval=16)
+    # one trade a second from 13:58 to 14:08
+    writer.write(TRADES, 'GDAX', 'BTC-USD', trades([START - 120 + i for i in range(600)]))
+    writer.write(TRADES, 'BITSTAMP', 'BTC-USD', trades([START + 0.5 + i for i in range(10)]))
+    writer.write(TICKER, 'BITSTAMP', 'BTC-USD', {'receipt': [int((START + 1) * NS)], 'feed': [], 'pair': [],
+                                                 'bid': [Decimal(1)], 'ask': [Decimal(2)]})
+    writer.write(L2_BOOK, 'GDAX', 'ETH-USD', {'receipt': [int(START * NS)], 'feed': [], 'pair': [], 'side': [BID],
+                                              'price': [Decimal(1)], 'size': [Decimal(1)]})
+    writer.close()
+
+    store = TickStore(str(tmpdir))
+    assert store.feeds() == ['BITSTAMP', 'GDAX']
+    result = store.query('BTC-USD', START, START + 300, channel=TRADES)
+    assert sorted(result) == ['BITSTAMP', 'GDAX']
+
+    gdax = result['GDAX']
+    assert len(gdax) == 300
+    assert gdax['receipt'][0] == int(START * NS)
+    assert (gdax['type'] == TRADE).all()
+    assert gdax['a'][0] / SCALE == 220
+    assert np.all(np.diff(gdax['receipt']) > 0)
+    assert len(result['BITSTAMP']) == 10
+
+    assert len(store.query('BTC-USD', START, START + 300, feeds=['BITSTAMP'])['BITSTAMP']) == 11
+    assert all(len(records) == 0 for records in store.query('BTC-USD', START + 1000, START + 2000).values())
+    assert store.query('BTC-USD', START + 2 * 86400, START + 3 * 86400) == {}
+
+
+def test_channels_interleaved(tmpdir):
+    pytest.importorskip('numpy')
+    from cryptofeed.backends.tickstore import TickStore
+
+    writer = TickStoreWriter(str(tmpdir), index_interval=2)
+    # written one channel after the other, receipts interleave
+    writer.write(TRADES, 'GDAX', 'BTC-USD', trades([START + i for i in range(6)]))
+    writer.write(TICKER, 'GDAX', 'BTC-USD', {'receipt': [int((START + 0.5 + i) * NS) for i in range(6)],
+                                             'feed': [], 'pair': [], 'bid': [Decimal(1)] * 6, 'ask': [Decimal(2)] * 6})
+    writer.close()
+
+    store = TickStore(str(tmpdir))
+    records = store.query('BTC-USD', START + 2, START + 4)['GDAX']
+    assert list(records['receipt']) == [int((START + offset) * NS) for offset in (2, 2.5, 3, 3.5)]
+    assert list(records['type']) == [TRADE, TICKER_RECORD, TRADE, TICKER_RECORD]
+    assert len(store.query('BTC-USD', START + 2, START + 4, channel=TICKER)['GDAX']) == 2
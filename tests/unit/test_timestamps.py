@@ -0,0 +1,96 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed import timestamps
+from cryptofeed.callback import IsolatedCallback, TradeCallback
+from cryptofeed.defines import BID
+from cryptofeed.gdax.gdax import GDAX
+from cryptofeed.timestamps import Nanoseconds, iso_to_ns, seconds_to_ns, to_datetime
+
+
+BASE = 1526862365 * 1000000000
+
+
+@pytest.mark.parametrize('timestamp, expected', [
+    ('2018-05-21T00:26:05.585000Z', BASE + 585000000),
+    ('2018-05-21T00:26:05.585Z', BASE + 585000000),
+    ('2018-05-21T00:26:05.123456789Z', BASE + 123456789),
+    ('2018-05-21T00:26:05Z', BASE),
+    ('2018-05-21T00:26:05', BASE),
+    ('2018-05-21T02:26:05.5+02:00', BASE + 500000000),
+    ('2018-05-20T23:26:05.5-0100', BASE + 500000000),
+])
+def test_iso(timestamp, expected):
+    assert iso_to_ns(timestamp) == expected
+
+
+def test_seconds():
+    assert seconds_to_ns('1526862365') == BASE
+    assert seconds_to_ns('1526862365.25') == BASE + 250000000
+    assert seconds_to_ns(1526862365) == BASE
+    assert seconds_to_ns(1526862365.25) == BASE + 250000000
+    assert seconds_to_ns(Decimal('1526862365.000001')) == BASE + 1000
+
+
+def test_invalid():
+    for timestamp in ('2018/05/21T00:26:05Z', '2018-05-21T00-26-05Z', 'yesterday'):
+        with pytest.raises(ValueError):
+            timestamps.to_ns(timestamp)
+
+
+def test_feed_timestamps():
+    expected = datetime(2018, 5, 21, 0, 26, 5, 585000, tzinfo=timezone.utc)
+    feed = GDAX(pairs=['BTC-USD'])
+    assert feed.timestamp('2018-05-21T00:26:05.585000Z') == expected
+    # the format changing is picked up
+    assert feed.timestamp('1526862365.585') == expected
+    assert to_datetime(BASE) == feed.tz_aware_datetime_from_string('2018-05-21T00:26:05.000000Z')
+
+    feed = GDAX(pairs=['BTC-USD'], timestamp_ns=True)
+    ns = feed.timestamp('2018-05-21T00:26:05.585000Z')
+    assert isinstance(ns, Nanoseconds)
+    assert ns == BASE + 585000000
+
+
+def test_receipts():
+    trades = []
+    received = []
+
+    async def trade(feed, pair, id, timestamp, side, amount, price):
+        trades.append(timestamps.receipt())
+
+    def sync_trade(feed, pair, id, timestamp, side, amount, price):
+        # runs on an executor thread
+        trades.append(timestamps.receipt())
+
+    async def positional(**kwargs):
+        received.append(timestamps.receipt())
+
+    async def run():
+        receipt = timestamps.now()
+        timestamps.set_receipt(receipt)
+        await TradeCallback(trade)(feed='GDAX', pair='BTC-USD', id=1, timestamp=BASE,
+                                   side=BID, amount=Decimal('1'), price=Decimal('10'))
+        await TradeCallback(sync_trade)(feed='GDAX', pair='BTC-USD', id=2, timestamp=BASE,
+                                        side=BID, amount=Decimal('1'), price=Decimal('10'))
+        isolated = IsolatedCallback(positional)
+        await isolated(feed='GDAX', pair='BTC-USD')
+        # the worker task sees the receipt of the frame, not of whatever is handled when it runs
+        timestamps.set_receipt(None)
+        await isolated.join()
+        isolated.close()
+        return receipt
+
+    receipt = asyncio.new_event_loop().run_until_complete(run())
+    assert trades == [receipt, receipt]
+    assert received == [receipt]
+    assert receipt.wall > BASE and receipt.monotonic > 0
@@ -0,0 +1,62 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+
+from cryptofeed.defines import L2_BOOK, TRADES
+from cryptofeed.feedhandler import FeedHandler
+from cryptofeed.gdax.gdax import GDAX
+from cryptofeed.timestamps import NS
+from cryptofeed.watchdog import Watchdog
+
+
+class Websocket:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_expire():
+    async def run():
+        watchdog = Watchdog()
+        quiet, busy, gone = Websocket(), Websocket(), Websocket()
+        watches = [watchdog.watch(name, websocket, 1) for name, websocket in
+                   (('quiet', quiet), ('busy', busy), ('gone', gone))]
+        # all three are due one second after the last was watched
+        now = watches[2].last + NS
+        watches[1].last = now - NS // 2
+        watchdog.unwatch(watches[2])
+
+        # busy's deadline moved, its entry is pushed back rather than expired
+        assert watchdog.expire(now) == watches[1].last + NS
+        await asyncio.sleep(0)
+        assert quiet.closed and not busy.closed and not gone.closed
+        assert len(watchdog.heap) == 1
+    asyncio.new_event_loop().run_until_complete(run())
+
+
+def test_run():
+    async def run():
+        watchdog = Watchdog()
+        task = asyncio.ensure_future(watchdog.run())
+        slow, fast = Websocket(), Websocket()
+        watchdog.watch('slow', slow, 10)
+        await asyncio.sleep(0.01)
+        # an earlier deadline wakes the sleeping watchdog
+        watchdog.watch('fast', fast, 0.05)
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.wait([task])
+        assert fast.closed and not slow.closed
+    asyncio.new_event_loop().run_until_complete(run())
+
+
+def test_channel_timeouts():
+    handler = FeedHandler(channel_timeouts={L2_BOOK: 5, TRADES: 120})
+    handler.add_feed(GDAX(pairs=['BTC-USD'], channels=[TRADES, L2_BOOK]))
+    handler.add_feed(GDAX(pairs=['ETH-USD'], channels=[TRADES]), timeout=60)
+    assert [handler._timeout(feed) for feed in handler.feeds] == [5, 120]
@@ -0,0 +1,52 @@
+'''
+Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.book import new_book
+from cryptofeed.defines import BID, ASK, TRADES, TICKER, L2_BOOK
+from cryptofeed.wire import Encoder, Decoder, RECORD, encode_array
+
+
+def test_round_trip():
+    encoder = Encoder()
+    decoder = Decoder()
+    book = new_book()
+    book[BID][Decimal('100.5')] = Decimal('1')
+    book[BID][Decimal('100')] = Decimal('2')
+    book[ASK][Decimal('101')] = Decimal('0.00000001')
+
+    data = encoder.trade('GDAX', 'BTC-USD', 'sell', Decimal('0.5'), Decimal('8000.01'), id=12, timestamp=1527000000.5)
+    # feed and pair are defined once
+    assert len(data) == 3 * RECORD.size
+    data += encoder.ticker('GDAX', 'BTC-USD', Decimal('8000'), Decimal('8000.01'))
+    data += encoder.book_snapshot('GDAX', 'BTC-USD', book, depth=1)
+    data += encoder.book_delta('BITFINEX', 'BTC-USD', ASK, Decimal('101'), Decimal('0'))
+
+    # records can arrive in arbitrary chunks of whole records
+    events = decoder.decode(data[:4 * RECORD.size]) + decoder.decode(data[4 * RECORD.size:])
+    assert events[0] == {'type': TRADES, 'feed': 'GDAX', 'pair': 'BTC-USD', 'timestamp': 1527000000.5,
+                         'side': ASK, 'price': Decimal('8000.01'), 'amount': Decimal('0.5'), 'id': 12}
+    assert events[1]['type'] == TICKER and events[1]['timestamp'] is None
+    assert events[2]['type'] == L2_BOOK
+    assert events[2][BID] == [(Decimal('100.5'), Decimal('1'))]
+    assert events[2][ASK] == [(Decimal('101'), Decimal('0.00000001'))]
+    assert events[3]['feed'] == 'BITFINEX' and events[3]['size'] == 0
+
+
+def test_arrays():
+    np = pytest.importorskip('numpy')
+    encoder = Encoder()
+    data = b''.join(encoder.trade('GDAX', 'BTC-USD', BID, Decimal(i), Decimal('100'), id=i) for i in range(1, 4))
+    decoder = Decoder()
+    records = decoder.array(data)
+    assert len(records) == 3
+    assert decoder.names[1] == {0: 'BTC-USD'}
+    assert list(records['b'] / 10 ** 8) == [1.0, 2.0, 3.0]
+    assert np.all(records['c'] == [1, 2, 3])
+    assert Decoder().decode(data[:2 * RECORD.size] + encode_array(records))[2]['id'] == 3
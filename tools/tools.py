@@ -4,10 +4,13 @@ Copyright (C) 2017-2018  Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
+import sys
 from urllib.request import urlopen
 import requests
 import json
 
+from cryptofeed import metadata
+
 
 def poloniex_get_ticker_map():
     """
@@ -77,5 +80,18 @@ def bitmex_instruments():
     print("]")
 
 
+def write_symbol_cache(*exchanges):
+    """
+    fetch instrument metadata and store it in the symbol cache
+    feeds load on startup (see cryptofeed/metadata.py)
+    """
+    exchanges = exchanges or ('BITMEX', 'HITBTC')
+    cache = metadata.update(exchanges)
+    for exchange in exchanges:
+        print("{}: {} instruments".format(exchange, len(cache[exchange]['instruments'])))
+    print("written to {}".format(metadata.DEFAULT_CACHE))
+
+
 if __name__ == '__main__':
-    bitmex_instruments()
+    # python tools.py [EXCHANGE ...]
+    write_symbol_cache(*sys.argv[1:])